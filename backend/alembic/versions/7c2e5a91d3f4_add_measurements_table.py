@@ -0,0 +1,44 @@
+"""Add measurements table
+
+Revision ID: 7c2e5a91d3f4
+Revises: 0b8b01cb6f4d
+Create Date: 2026-10-19 10:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7c2e5a91d3f4'
+down_revision = '0b8b01cb6f4d'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('measurements',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('pasture_id', sa.Integer(), nullable=False),
+    sa.Column('drone_id', sa.Integer(), nullable=True),
+    sa.Column('method', sa.String(), nullable=False),
+    sa.Column('status', sa.String(), nullable=True),
+    sa.Column('biomass_value', sa.Float(), nullable=True),
+    sa.Column('ndvi_value', sa.Float(), nullable=True),
+    sa.Column('coverage_percent', sa.Float(), nullable=True),
+    sa.Column('quality_score', sa.Float(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('media_url', sa.String(length=500), nullable=True),
+    sa.Column('measured_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['drone_id'], ['drones.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['pasture_id'], ['pastures.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_measurements_id'), 'measurements', ['id'], unique=False)
+    op.create_index('ix_measurements_pasture_measured_at', 'measurements', ['pasture_id', 'measured_at'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_measurements_pasture_measured_at', table_name='measurements')
+    op.drop_index(op.f('ix_measurements_id'), table_name='measurements')
+    op.drop_table('measurements')
@@ -0,0 +1,28 @@
+"""Add owner and farm foreign key indexes
+
+Revision ID: a41f0c7be2d9
+Revises: 7c2e5a91d3f4
+Create Date: 2026-10-19 12:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a41f0c7be2d9'
+down_revision = '7c2e5a91d3f4'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_index(op.f('ix_farms_owner_id'), 'farms', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_farms_agronomist_id'), 'farms', ['agronomist_id'], unique=False)
+    op.create_index(op.f('ix_pastures_farm_id'), 'pastures', ['farm_id'], unique=False)
+    op.create_index(op.f('ix_drones_farm_id'), 'drones', ['farm_id'], unique=False)
+
+def downgrade():
+    op.drop_index(op.f('ix_drones_farm_id'), table_name='drones')
+    op.drop_index(op.f('ix_pastures_farm_id'), table_name='pastures')
+    op.drop_index(op.f('ix_farms_agronomist_id'), table_name='farms')
+    op.drop_index(op.f('ix_farms_owner_id'), table_name='farms')
@@ -0,0 +1,38 @@
+"""Add pastures.boundary and geofence_events table
+
+Revision ID: a7d3e5f1c9b2
+Revises: f2c7d8e9a1b3
+Create Date: 2026-10-19 18:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3e5f1c9b2'
+down_revision = 'f2c7d8e9a1b3'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('pastures', sa.Column('boundary', sa.JSON(), nullable=True))
+    op.create_table('geofence_events',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('drone_id', sa.Integer(), nullable=False),
+    sa.Column('pasture_id', sa.Integer(), nullable=True),
+    sa.Column('pasture_farm_id', sa.Integer(), nullable=True),
+    sa.Column('event', sa.String(length=10), nullable=False),
+    sa.Column('own', sa.Boolean(), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['drone_id'], ['drones.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['pasture_id'], ['pastures.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_geofence_events_drone_id_recorded_at', 'geofence_events', ['drone_id', 'recorded_at'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_geofence_events_drone_id_recorded_at', table_name='geofence_events')
+    op.drop_table('geofence_events')
+    op.drop_column('pastures', 'boundary')
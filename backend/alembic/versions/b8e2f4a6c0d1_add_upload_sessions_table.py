@@ -0,0 +1,47 @@
+"""Add upload_sessions table
+
+Revision ID: b8e2f4a6c0d1
+Revises: a7d3e5f1c9b2
+Create Date: 2026-10-19 20:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e2f4a6c0d1'
+down_revision = 'a7d3e5f1c9b2'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('upload_sessions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('pasture_id', sa.Integer(), nullable=False),
+    sa.Column('drone_id', sa.Integer(), nullable=True),
+    sa.Column('measurement_id', sa.Integer(), nullable=True),
+    sa.Column('filename', sa.String(length=255), nullable=False),
+    sa.Column('content_type', sa.String(length=100), nullable=True),
+    sa.Column('size', sa.BigInteger(), nullable=False),
+    sa.Column('received', sa.BigInteger(), nullable=False),
+    sa.Column('sha256', sa.String(length=64), nullable=True),
+    sa.Column('status', sa.String(length=20), nullable=True),
+    sa.Column('message', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['pasture_id'], ['pastures.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['drone_id'], ['drones.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['measurement_id'], ['measurements.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_upload_sessions_id'), 'upload_sessions', ['id'], unique=False)
+    op.create_index(op.f('ix_upload_sessions_owner_id'), 'upload_sessions', ['owner_id'], unique=False)
+
+def downgrade():
+    op.drop_index(op.f('ix_upload_sessions_owner_id'), table_name='upload_sessions')
+    op.drop_index(op.f('ix_upload_sessions_id'), table_name='upload_sessions')
+    op.drop_table('upload_sessions')
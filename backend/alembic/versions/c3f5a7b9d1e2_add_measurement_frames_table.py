@@ -0,0 +1,39 @@
+"""Add measurement_frames table
+
+Revision ID: c3f5a7b9d1e2
+Revises: b8e2f4a6c0d1
+Create Date: 2026-10-19 22:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f5a7b9d1e2'
+down_revision = 'b8e2f4a6c0d1'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('measurement_frames',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('measurement_id', sa.Integer(), nullable=False),
+    sa.Column('offset', sa.Float(), nullable=False),
+    sa.Column('captured_at', sa.DateTime(), nullable=True),
+    sa.Column('lat', sa.Float(), nullable=True),
+    sa.Column('lng', sa.Float(), nullable=True),
+    sa.Column('image_url', sa.String(length=500), nullable=False),
+    sa.Column('phash', sa.String(length=16), nullable=True),
+    sa.Column('scene_score', sa.Float(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['measurement_id'], ['measurements.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_measurement_frames_id'), 'measurement_frames', ['id'], unique=False)
+    op.create_index(op.f('ix_measurement_frames_measurement_id'), 'measurement_frames', ['measurement_id'], unique=False)
+
+def downgrade():
+    op.drop_index(op.f('ix_measurement_frames_measurement_id'), table_name='measurement_frames')
+    op.drop_index(op.f('ix_measurement_frames_id'), table_name='measurement_frames')
+    op.drop_table('measurement_frames')
@@ -0,0 +1,51 @@
+"""Add jobs table
+
+Revision ID: d4a6b8c0e2f3
+Revises: c3f5a7b9d1e2
+Create Date: 2026-10-20 10:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4a6b8c0e2f3'
+down_revision = 'c3f5a7b9d1e2'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('jobs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('farm_id', sa.Integer(), nullable=True),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('priority', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('run_after', sa.DateTime(), nullable=False),
+    sa.Column('worker', sa.String(length=100), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('result', sa.JSON(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['farm_id'], ['farms.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_jobs_id'), 'jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_jobs_owner_id'), 'jobs', ['owner_id'], unique=False)
+    op.create_index(op.f('ix_jobs_farm_id'), 'jobs', ['farm_id'], unique=False)
+    op.create_index('ix_jobs_status_priority_run_after', 'jobs', ['status', 'priority', 'run_after'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_jobs_status_priority_run_after', table_name='jobs')
+    op.drop_index(op.f('ix_jobs_farm_id'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_owner_id'), table_name='jobs')
+    op.drop_index(op.f('ix_jobs_id'), table_name='jobs')
+    op.drop_table('jobs')
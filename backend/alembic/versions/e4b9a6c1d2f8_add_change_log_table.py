@@ -0,0 +1,47 @@
+"""Add change_log table
+
+Revision ID: e4b9a6c1d2f8
+Revises: c58d21e4a7b3
+Create Date: 2026-10-19 16:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e4b9a6c1d2f8'
+down_revision = 'c58d21e4a7b3'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.create_table('change_log',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=20), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('op', sa.String(length=10), nullable=False),
+    sa.Column('changed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_log_owner_id_id', 'change_log', ['owner_id', 'id'], unique=False)
+
+    # существующие строки попадают в журнал как upsert — первая синхронизация (since=0) получит всё
+    op.execute(
+        "INSERT INTO change_log (owner_id, entity, entity_id, op, changed_at) "
+        "SELECT owner_id, 'farms', id, 'upsert', COALESCE(updated_at, created_at, CURRENT_TIMESTAMP) "
+        "FROM farms ORDER BY id"
+    )
+    for table in ('pastures', 'drones'):
+        op.execute(
+            "INSERT INTO change_log (owner_id, entity, entity_id, op, changed_at) "
+            f"SELECT farms.owner_id, '{table}', {table}.id, 'upsert', "
+            f"COALESCE({table}.updated_at, {table}.created_at, CURRENT_TIMESTAMP) "
+            f"FROM {table} JOIN farms ON farms.id = {table}.farm_id ORDER BY {table}.id"
+        )
+
+def downgrade():
+    op.drop_index('ix_change_log_owner_id_id', table_name='change_log')
+    op.drop_table('change_log')
@@ -0,0 +1,23 @@
+"""Add measurements.biomass_model
+
+Revision ID: e5b7c9d1f3a4
+Revises: d4a6b8c0e2f3
+Create Date: 2026-10-21 10:00:00.000000+00:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b7c9d1f3a4'
+down_revision = 'd4a6b8c0e2f3'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    op.add_column('measurements', sa.Column('biomass_model', sa.String(length=50), nullable=True))
+
+
+def downgrade():
+    op.drop_column('measurements', 'biomass_model')
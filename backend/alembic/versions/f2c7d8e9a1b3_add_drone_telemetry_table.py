@@ -0,0 +1,69 @@
+"""Add drone_telemetry table (monthly partitions in PostgreSQL)
+
+Revision ID: f2c7d8e9a1b3
+Revises: e4b9a6c1d2f8
+Create Date: 2026-10-19 17:00:00.000000+00:00
+
+"""
+import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f2c7d8e9a1b3'
+down_revision = 'e4b9a6c1d2f8'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    bind = op.get_bind()
+    if bind.dialect.name == 'postgresql':
+        op.execute("""
+            CREATE TABLE drone_telemetry (
+                id BIGSERIAL NOT NULL,
+                drone_id INTEGER NOT NULL REFERENCES drones (id) ON DELETE CASCADE,
+                recorded_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+                lat DOUBLE PRECISION NOT NULL,
+                lng DOUBLE PRECISION NOT NULL,
+                altitude DOUBLE PRECISION,
+                battery DOUBLE PRECISION,
+                speed DOUBLE PRECISION,
+                heading DOUBLE PRECISION,
+                PRIMARY KEY (id, recorded_at)
+            ) PARTITION BY RANGE (recorded_at)
+        """)
+        # точки вне созданных месяцев (часы дрона сбиты) попадают в DEFAULT, а не теряются
+        op.execute("CREATE TABLE drone_telemetry_default PARTITION OF drone_telemetry DEFAULT")
+        # секции на текущий и два следующих месяца; дальше их создаёт приложение при старте
+        today = datetime.date.today()
+        for offset in range(3):
+            year, month = divmod(today.month - 1 + offset, 12)
+            start = datetime.date(today.year + year, month + 1, 1)
+            year, month = divmod(start.month, 12)
+            end = datetime.date(start.year + year, month + 1, 1)
+            op.execute(
+                f"CREATE TABLE drone_telemetry_{start:%Y_%m} PARTITION OF drone_telemetry "
+                f"FOR VALUES FROM ('{start}') TO ('{end}')"
+            )
+    else:
+        op.create_table('drone_telemetry',
+        sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+        sa.Column('drone_id', sa.Integer(), nullable=False),
+        sa.Column('recorded_at', sa.DateTime(), nullable=False),
+        sa.Column('lat', sa.Float(), nullable=False),
+        sa.Column('lng', sa.Float(), nullable=False),
+        sa.Column('altitude', sa.Float(), nullable=True),
+        sa.Column('battery', sa.Float(), nullable=True),
+        sa.Column('speed', sa.Float(), nullable=True),
+        sa.Column('heading', sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(['drone_id'], ['drones.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+        )
+    op.create_index('ix_drone_telemetry_drone_id_recorded_at', 'drone_telemetry', ['drone_id', 'recorded_at'], unique=False)
+
+def downgrade():
+    op.drop_index('ix_drone_telemetry_drone_id_recorded_at', table_name='drone_telemetry')
+    # в PostgreSQL секции удаляются вместе с родительской таблицей
+    op.execute("DROP TABLE drone_telemetry CASCADE" if op.get_bind().dialect.name == 'postgresql' else "DROP TABLE drone_telemetry")
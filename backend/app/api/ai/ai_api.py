@@ -1,6 +1,6 @@
 import os
 import httpx
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from core.config import settings
@@ -43,7 +43,7 @@ def _get_env_or_settings(name: str, default: str = "") -> str:
 
 
 @router.post("/chat", response_model=ChatResponse)
-async def ai_chat(req: ChatRequest, user: User = Depends(get_current_user)):
+async def ai_chat(req: ChatRequest, request: Request, user: User = Depends(get_current_user)):
     msg = (req.message or "").strip()
     if not msg:
         raise HTTPException(status_code=400, detail="Empty message")
@@ -81,8 +81,9 @@ async def ai_chat(req: ChatRequest, user: User = Depends(get_current_user)):
     }
 
     try:
-        async with httpx.AsyncClient(timeout=60) as client:
-            resp = await client.post(f"{base_url}/chat/completions", json=payload, headers=headers)
+        # общий пул соединений создаётся в lifespan (main.py)
+        client = request.app.state.http_client
+        resp = await client.post(f"{base_url}/chat/completions", json=payload, headers=headers)
 
         # Если OpenRouter вернул ошибку — покажем её текстом
         if resp.status_code >= 400:
@@ -0,0 +1,24 @@
+# backend/app/api/common/crud/bulk_crud.py
+# Общие части пакетных операций (пастбища, дроны) и импорта: текст ошибки
+# проверки, владение фермами одним запросом на пачку, результат по элементу.
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from model.models import Farm
+
+
+def validation_message(exc: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors())
+
+
+def owned_farm_ids(db: Session, farm_ids: set, user_id: int) -> set:
+    """Какие из farm_ids принадлежат пользователю — один запрос на всю пачку"""
+    if not farm_ids:
+        return set()
+    return set(db.scalars(select(Farm.id).where(Farm.id.in_(farm_ids), Farm.owner_id == user_id)))
+
+
+def add_result(results: list, index: int, status: str, id: int | None = None, error: str | None = None):
+    """Результат элемента пачки (BulkItemResult)"""
+    results.append({"index": index, "id": id, "status": status, "error": error})
@@ -0,0 +1,36 @@
+# backend/app/api/common/schemas/bulk_schemas.py
+# Общие схемы пакетных операций (пастбища, дроны). Элементы принимаются как
+# словари и проверяются схемой ресурса по одному, чтобы ошибка в одной строке
+# не отменяла остальные — результат возвращается по каждому элементу.
+from typing import Any, List, Literal, Optional
+
+from pydantic import BaseModel, Field
+
+BULK_MAX_ITEMS = 10_000
+
+
+class BulkItems(BaseModel):
+    """Тело пакетного создания и обновления"""
+    items: List[dict[str, Any]] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkDelete(BaseModel):
+    ids: List[int] = Field(..., min_length=1, max_length=BULK_MAX_ITEMS)
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    status: Literal["created", "updated", "deleted", "error"]
+    error: Optional[str] = None
+
+
+class BulkResponse(BaseModel):
+    succeeded: int
+    failed: int
+    results: List[BulkItemResult]
+
+    @classmethod
+    def from_results(cls, results: list[dict]) -> "BulkResponse":
+        failed = sum(1 for r in results if r["status"] == "error")
+        return cls(succeeded=len(results) - failed, failed=failed, results=results)
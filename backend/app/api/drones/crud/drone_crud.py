@@ -1,21 +1,44 @@
+import datetime
+
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import delete, func, insert, or_, select, update
 
+from core.cache import drones_cache
 from model.models import Drone, Farm
-from app.api.drones.schemas.drone_schemas import DroneCreate, DroneUpdate
+from app.api.common.crud.bulk_crud import add_result, owned_farm_ids, validation_message
+from app.api.sync.changelog import DELETE, UPSERT, record_changes
+from app.api.drones.schemas.drone_schemas import DroneBulkUpdateItem, DroneCreate, DroneUpdate
 
 
-def get_drones(db: Session, user_id: int, skip: int = 0, limit: int = 100):
-    """Получить все дроны пользователя (через его фермы)"""
-    return db.query(Drone).join(Farm).filter(
-        Farm.owner_id == user_id
-    ).offset(skip).limit(limit).all()
+def get_drones(db: Session, user_id: int, skip: int = 0, limit: int = 100, columns=None, version=None):
+    """Получить все дроны пользователя (через его фермы), строки из колонок columns, через кэш"""
+    columns = columns or list(Drone.__table__.columns)
+
+    def load():
+        rows = db.execute(
+            select(*columns).select_from(Drone).join(Farm).where(
+                Farm.owner_id == user_id
+            ).offset(skip).limit(limit)
+        ).mappings()
+        return [dict(row) for row in rows]
+
+    return drones_cache.get_or_load(user_id, (tuple(c.key for c in columns), skip, limit, version), load)
+
+
+def get_drones_version(db: Session, user_id: int):
+    """Версия коллекции дронов пользователя для ETag: (количество, max(updated_at))"""
+    return tuple(db.execute(
+        select(func.count(Drone.id), func.max(Drone.updated_at)).select_from(Drone).join(Farm).where(
+            Farm.owner_id == user_id
+        )
+    ).one())
 
 
-def get_drones_by_farm(db: Session, farm_id: int, user_id: int, skip: int = 0, limit: int = 100):
+def get_drones_by_farm(db: Session, farm_id: int, user_id: int, skip: int = 0, limit: int = 100, columns=None):
     """Получить дроны конкретной фермы с проверкой доступа"""
     # Проверяем, принадлежит ли ферма пользователю
-    farm = db.query(Farm).filter(
+    farm = db.query(Farm.id).filter(
         Farm.id == farm_id,
         Farm.owner_id == user_id
     ).first()
@@ -23,9 +46,13 @@ def get_drones_by_farm(db: Session, farm_id: int, user_id: int, skip: int = 0, l
     if not farm:
         raise ValueError("Ферма не найдена или доступ запрещен")
     
-    return db.query(Drone).filter(
-        Drone.farm_id == farm_id
-    ).offset(skip).limit(limit).all()
+    columns = columns or list(Drone.__table__.columns)
+    rows = db.execute(
+        select(*columns).where(
+            Drone.farm_id == farm_id
+        ).offset(skip).limit(limit)
+    ).mappings()
+    return [dict(row) for row in rows]
 
 
 def get_drone(db: Session, drone_id: int, user_id: int):
@@ -69,6 +96,7 @@ def create_drone(db: Session, drone_data: DroneCreate, user_id: int):
     
     db.add(drone)
     db.commit()
+    drones_cache.invalidate(user_id)
     db.refresh(drone)
     return drone
 
@@ -101,6 +129,7 @@ def update_drone(db: Session, drone_id: int, drone_data: DroneUpdate, user_id: i
         setattr(drone, field, value)
     
     db.commit()
+    drones_cache.invalidate(user_id)
     db.refresh(drone)
     return drone
 
@@ -117,6 +146,7 @@ def update_drone_status(db: Session, drone_id: int, status: str, user_id: int):
     
     drone.status = status
     db.commit()
+    drones_cache.invalidate(user_id)
     db.refresh(drone)
     return drone
 
@@ -129,4 +159,123 @@ def delete_drone(db: Session, drone_id: int, user_id: int):
     
     db.delete(drone)
     db.commit()
-    return True
\ No newline at end of file
+    drones_cache.invalidate(user_id)
+    return True
+
+
+# --- Пакетные операции ---------------------------------------------------------
+
+def _taken_serials(db: Session, serials: set) -> set:
+    """Серийные номера, уже занятые в БД, — один запрос на всю пачку"""
+    if not serials:
+        return set()
+    return set(db.scalars(select(Drone.serial_number).where(Drone.serial_number.in_(serials))))
+
+
+def bulk_create_drones(db: Session, items: list[dict], user_id: int):
+    """Создать дроны пачкой: владение фермой и уникальность серийных номеров
+    проверяются одним запросом на пачку, вставка — один INSERT ... RETURNING"""
+    results, valid = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, DroneCreate.model_validate(item)))
+        except ValidationError as exc:
+            add_result(results, index, "error", error=validation_message(exc))
+
+    owned = owned_farm_ids(db, {d.farm_id for _, d in valid}, user_id)
+    taken = _taken_serials(db, {d.serial_number for _, d in valid})
+    now = datetime.datetime.utcnow()
+    rows, row_indexes = [], []
+    for index, drone in valid:
+        if drone.farm_id not in owned:
+            add_result(results, index, "error", error="Ферма не найдена или доступ запрещен")
+        elif drone.serial_number in taken:
+            add_result(results, index, "error", error="Дрон с таким серийным номером уже существует")
+        else:
+            taken.add(drone.serial_number)  # дубликаты внутри пачки
+            rows.append({**drone.model_dump(), "status": "active", "created_at": now, "updated_at": now})
+            row_indexes.append(index)
+
+    if rows:
+        ids = db.scalars(
+            insert(Drone).returning(Drone.id, sort_by_parameter_order=True), rows
+        ).all()
+        record_changes(db, user_id, "drones", ids, UPSERT)
+        db.commit()
+        drones_cache.invalidate(user_id)
+        for index, drone_id in zip(row_indexes, ids):
+            add_result(results, index, "created", id=drone_id)
+
+    return sorted(results, key=lambda r: r["index"])
+
+
+def bulk_update_drones(db: Session, items: list[dict], user_id: int):
+    """Обновить дроны пачкой (UPDATE по первичному ключу, одна транзакция)"""
+    results, valid = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, DroneBulkUpdateItem.model_validate(item)))
+        except ValidationError as exc:
+            item_id = item.get("id") if isinstance(item.get("id"), int) else None
+            add_result(results, index, "error", id=item_id, error=validation_message(exc))
+
+    current = dict(db.execute(
+        select(Drone.id, Drone.serial_number).join(Farm).where(
+            Drone.id.in_({d.id for _, d in valid}),
+            Farm.owner_id == user_id
+        )
+    ).all()) if valid else {}
+    owned = owned_farm_ids(db, {d.farm_id for _, d in valid if d.farm_id is not None}, user_id)
+    changed_serials = {
+        d.serial_number for _, d in valid
+        if d.serial_number is not None and d.serial_number != current.get(d.id)
+    }
+    taken = _taken_serials(db, changed_serials)
+
+    now = datetime.datetime.utcnow()
+    rows, row_indexes = [], []
+    for index, drone in valid:
+        data = drone.model_dump(exclude_unset=True)
+        if drone.id not in current:
+            add_result(results, index, "error", id=drone.id, error="Дрон не найден")
+        elif "farm_id" in data and data["farm_id"] not in owned:
+            add_result(results, index, "error", id=drone.id, error="Новая ферма не найдена или доступ запрещен")
+        elif data.get("serial_number", current[drone.id]) != current[drone.id] and data["serial_number"] in taken:
+            add_result(results, index, "error", id=drone.id, error="Дрон с таким серийным номером уже существует")
+        else:
+            if "serial_number" in data:
+                taken.add(data["serial_number"])
+            rows.append({**data, "updated_at": now})
+            row_indexes.append(index)
+
+    if rows:
+        db.execute(update(Drone), rows)
+        record_changes(db, user_id, "drones", [row["id"] for row in rows], UPSERT)
+        db.commit()
+        drones_cache.invalidate(user_id)
+        for index, row in zip(row_indexes, rows):
+            add_result(results, index, "updated", id=row["id"])
+
+    return sorted(results, key=lambda r: r["index"])
+
+
+def bulk_delete_drones(db: Session, ids: list[int], user_id: int):
+    """Удалить дроны пачкой одним DELETE ... WHERE id IN (...)"""
+    existing = set(db.scalars(
+        select(Drone.id).join(Farm).where(Drone.id.in_(set(ids)), Farm.owner_id == user_id)
+    ))
+    if existing:
+        db.execute(
+            delete(Drone).where(Drone.id.in_(existing)).execution_options(synchronize_session=False)
+        )
+        record_changes(db, user_id, "drones", sorted(existing), DELETE)
+        db.commit()
+        drones_cache.invalidate(user_id)
+
+    results = []
+    for index, drone_id in enumerate(ids):
+        if drone_id in existing:
+            add_result(results, index, "deleted", id=drone_id)
+        else:
+            add_result(results, index, "error", id=drone_id, error="Дрон не найден")
+    return results
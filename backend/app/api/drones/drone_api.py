@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from anyio import from_thread
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from database.db import get_db
+from core.etag import etag_headers, etag_matches, make_etag, not_modified
 from core.security import get_current_user
-from model.models import User
+from core.serialization import ListSerializer
+from model.models import Drone, User
+from app.api.common.schemas.bulk_schemas import BulkDelete, BulkItems, BulkResponse
 from app.api.drones.schemas.drone_schemas import (
     DroneCreate,
     DroneUpdate,
@@ -12,14 +16,19 @@ from app.api.drones.schemas.drone_schemas import (
     DroneStatusUpdate
 )
 from app.api.drones.crud import drone_crud
+from app.api.fleet.fleet_state import fleet_state
 
 router = APIRouter(prefix="/drones", tags=["Drones"])
 
+drone_list = ListSerializer(DroneResponse, Drone)
+
 
 @router.get("/", response_model=List[DroneResponse])
-async def get_all_drones(
+def get_all_drones(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = Query(None, description=drone_list.fields_description),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -30,13 +39,19 @@ async def get_all_drones(
             detail="Только фермеры могут управлять дронами"
         )
     
-    drones = drone_crud.get_drones(db, current_user.id, skip, limit)
-    return drones
+    columns = drone_list.select(fields)
+    version = drone_crud.get_drones_version(db, current_user.id)
+    etag = make_etag("drones", current_user.id, skip, limit, *version, *(c.key for c in columns))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    drones = drone_crud.get_drones(db, current_user.id, skip, limit, columns=columns, version=version)
+    return drone_list.response(drones, headers=etag_headers(etag), columns=columns)
 
 
 @router.get("/farm/{farm_id}", response_model=List[DroneResponse])
 async def get_farm_drones(
     farm_id: int,
+    fields: Optional[str] = Query(None, description=drone_list.fields_description),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
@@ -47,8 +62,9 @@ async def get_farm_drones(
             detail="Только фермеры могут просматривать дроны"
         )
     
-    drones = drone_crud.get_drones_by_farm(db, farm_id, current_user.id)
-    return drones
+    columns = drone_list.select(fields)
+    drones = drone_crud.get_drones_by_farm(db, farm_id, current_user.id, columns=columns)
+    return drone_list.response(drones, columns=columns)
 
 
 @router.get("/{drone_id}", response_model=DroneResponse)
@@ -117,6 +133,7 @@ async def update_drone(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Дрон не найден"
             )
+        fleet_state.set_status(current_user.id, drone.id, drone.status)
         return drone
     except ValueError as e:
         raise HTTPException(
@@ -146,6 +163,7 @@ async def update_drone_status(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Дрон не найден"
             )
+        fleet_state.set_status(current_user.id, drone.id, drone.status)
         return drone
     except ValueError as e:
         raise HTTPException(
@@ -173,4 +191,59 @@ async def delete_drone(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Дрон не найден"
         )
-    return None
\ No newline at end of file
+    fleet_state.remove([drone_id])
+    return None
+
+
+# Пакетные операции. Обычные def: FastAPI выполняет их в пуле потоков,
+# и вставка тысяч строк не блокирует event loop.
+def _require_farmer(user: User):
+    if user.account_type != "farmer":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Только фермеры могут управлять дронами"
+        )
+
+
+@router.post("/bulk", response_model=BulkResponse)
+def bulk_create_drones(
+    payload: BulkItems,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Создать дроны пачкой (до 10 000 за запрос), результат по каждому элементу"""
+    _require_farmer(current_user)
+    return BulkResponse.from_results(drone_crud.bulk_create_drones(db, payload.items, current_user.id))
+
+
+@router.patch("/bulk", response_model=BulkResponse)
+def bulk_update_drones(
+    payload: BulkItems,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Обновить дроны пачкой: каждый элемент — id и изменяемые поля"""
+    _require_farmer(current_user)
+    results = drone_crud.bulk_update_drones(db, payload.items, current_user.id)
+    statuses = [
+        (r["id"], payload.items[r["index"]]["status"]) for r in results
+        if r["status"] == "updated" and "status" in payload.items[r["index"]]
+    ]
+    if statuses:
+        # состояние парка меняется только в event loop
+        from_thread.run_sync(fleet_state.set_statuses, current_user.id, statuses)
+    return BulkResponse.from_results(results)
+
+
+@router.post("/bulk/delete", response_model=BulkResponse)
+def bulk_delete_drones(
+    payload: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Удалить дроны пачкой по списку id"""
+    _require_farmer(current_user)
+    results = drone_crud.bulk_delete_drones(db, payload.ids, current_user.id)
+    # состояние парка меняется только в event loop
+    from_thread.run_sync(fleet_state.remove, [r["id"] for r in results if r["status"] == "deleted"])
+    return BulkResponse.from_results(results)
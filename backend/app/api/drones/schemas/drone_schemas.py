@@ -2,7 +2,6 @@ from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field
 
-
 class DroneBase(BaseModel):
     model: str = Field(..., min_length=1, max_length=100, description="Модель дрона")
     serial_number: str = Field(..., min_length=1, max_length=100, description="Серийный номер")
@@ -33,4 +32,9 @@ class DroneResponse(DroneBase):
     updated_at: datetime
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# Элемент пакетного обновления; остальные пакетные схемы — общие (bulk_schemas)
+class DroneBulkUpdateItem(DroneUpdate):
+    id: int
@@ -0,0 +1,41 @@
+# backend/app/api/exports/crud/export_crud.py
+# Запросы экспорта: фермер выгружает свои фермы, агроном — фермы, где он консультант
+# (User.consulting_farms). Строки читаются с серверного курсора пачками (yield_per).
+from typing import Iterator
+
+from sqlalchemy import Select, select
+
+from core.config import settings
+from database.db import SessionLocal
+from model.models import Farm, Measurement, Pasture, User
+
+DATASETS = ("farms", "pastures", "measurements")
+
+
+def scoped_farm_ids(user: User) -> Select:
+    column = Farm.agronomist_id if user.account_type == "agronomist" else Farm.owner_id
+    return select(Farm.id).where(column == user.id)
+
+
+def export_query(dataset: str, user: User) -> Select:
+    farm_ids = scoped_farm_ids(user)
+    if dataset == "farms":
+        return select(*Farm.__table__.columns).where(Farm.id.in_(farm_ids)).order_by(Farm.id)
+    if dataset == "pastures":
+        return select(*Pasture.__table__.columns).where(Pasture.farm_id.in_(farm_ids)).order_by(Pasture.id)
+    if dataset == "measurements":
+        return (
+            select(*Measurement.__table__.columns, Pasture.farm_id)
+            .join(Pasture, Measurement.pasture_id == Pasture.id)
+            .where(Pasture.farm_id.in_(farm_ids))
+            .order_by(Measurement.id)
+        )
+    raise ValueError(f"Неизвестный набор данных: {dataset}")
+
+
+def stream_partitions(query: Select, yield_per: int | None = None, session_factory=SessionLocal) -> Iterator[list]:
+    """Пачки строк-кортежей; сессия своя — живёт, пока читается ответ"""
+    with session_factory() as db:
+        result = db.execute(query.execution_options(yield_per=yield_per or settings.EXPORT_YIELD_PER))
+        for partition in result.partitions():
+            yield partition
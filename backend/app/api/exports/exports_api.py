@@ -0,0 +1,71 @@
+# backend/app/api/exports/exports_api.py
+# Выгрузка ферм, пастбищ и измерений в CSV, NDJSON или Parquet.
+#   GET  /exports/{dataset}             — ответ кусками (chunked) по мере чтения с серверного курсора
+#   POST /exports/{dataset}             — то же заданием очереди (для больших выгрузок), 202
+#   GET  /exports/jobs/{job_id}/file    — готовый файл задания
+import os
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from core.security import get_current_user
+from database.db import get_db
+from model.models import User
+from app.api.exports.crud.export_crud import export_query, stream_partitions
+from app.api.exports.writers import FORMATS, WRITERS, pa
+from app.api.jobs.crud.job_crud import get_job
+from app.api.jobs.schemas.job_schemas import JobResponse
+from app.jobs.queue import enqueue
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+
+
+def _require_writer(format: str):
+    if format == "parquet" and pa is None:
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Экспорт в Parquet недоступен: не установлен пакет pyarrow"
+        )
+
+
+@router.get("/{dataset}")
+def export_dataset(
+    dataset: Literal["farms", "pastures", "measurements"],
+    format: Literal["csv", "ndjson", "parquet"] = "csv",
+    current_user: User = Depends(get_current_user)
+):
+    """Фермер получает данные своих ферм, агроном — ферм, где он консультант"""
+    _require_writer(format)
+    query = export_query(dataset, current_user)
+    media_type, extension = FORMATS[format]
+    return StreamingResponse(
+        WRITERS[format](list(query.selected_columns), stream_partitions(query)),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{dataset}.{extension}"'},
+    )
+
+
+@router.post("/{dataset}", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+def start_export(
+    dataset: Literal["farms", "pastures", "measurements"],
+    format: Literal["csv", "ndjson", "parquet"] = "csv",
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Выгрузка в фоне: статус — GET /api/jobs/{id}, файл — /exports/jobs/{id}/file"""
+    _require_writer(format)
+    return enqueue(db, "export", {"dataset": dataset, "format": format}, current_user.id)
+
+
+@router.get("/jobs/{job_id}/file")
+def download_export(job_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    job = get_job(db, job_id, current_user.id)
+    if not job or job.kind != "export":
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Выгрузка не найдена")
+    if job.status != "completed":
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Выгрузка в статусе {job.status}")
+    if not job.result or not os.path.exists(job.result["path"]):
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Файл выгрузки удалён по сроку хранения")
+    return FileResponse(job.result["path"], media_type=job.result["media_type"], filename=job.result["filename"])
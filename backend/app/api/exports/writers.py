@@ -0,0 +1,114 @@
+# backend/app/api/exports/writers.py
+# Потоковые сериализаторы экспорта: каждая пачка строк превращается в кусок
+# ответа сразу, весь результат в памяти не собирается.
+import csv
+import io
+import json
+from typing import Iterable, Iterator
+
+import orjson
+from sqlalchemy import JSON, Date, DateTime, Float, Integer
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+FORMATS = {
+    "csv": ("text/csv", "csv"),  # Starlette сам добавит charset=utf-8
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def _csv_value(value):
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+def csv_chunks(columns: list, partitions: Iterable[list]) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([c.key for c in columns])
+    json_positions = [i for i, c in enumerate(columns) if isinstance(c.type, JSON)]
+    for rows in partitions:
+        if json_positions:
+            rows = [[_csv_value(v) for v in row] for row in rows]
+        writer.writerows(rows)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def ndjson_chunks(columns: list, partitions: Iterable[list]) -> Iterator[bytes]:
+    names = [c.key for c in columns]
+    for rows in partitions:
+        yield b"".join(orjson.dumps(dict(zip(names, row))) + b"\n" for row in rows)
+
+
+def _arrow_type(column):
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, Float):
+        return pa.float64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column.type, Date):
+        return pa.date32()
+    return pa.string()  # строки, Enum и JSON (сериализованный)
+
+
+class _DrainSink(io.RawIOBase):
+    """Файл для ParquetWriter, из которого после каждой группы строк забираются байты"""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def parquet_chunks(columns: list, partitions: Iterable[list]) -> Iterator[bytes]:
+    """Колоночный Parquet: одна группа строк (row group) на пачку курсора"""
+    schema = pa.schema([(c.key, _arrow_type(c)) for c in columns])
+    json_positions = {i for i, c in enumerate(columns) if isinstance(c.type, JSON)}
+    sink = _DrainSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for rows in partitions:
+            arrays = []
+            for i, values in enumerate(zip(*rows)):
+                if i in json_positions:
+                    values = [None if v is None else json.dumps(v, ensure_ascii=False) for v in values]
+                arrays.append(pa.array(values, type=schema.field(i).type))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            if chunk := sink.drain():
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+WRITERS = {
+    "csv": csv_chunks,
+    "ndjson": ndjson_chunks,
+    "parquet": parquet_chunks,
+}
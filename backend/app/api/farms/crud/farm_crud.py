@@ -1,11 +1,29 @@
 # backend/app/api/farms/crud/farm_crud.py
-from sqlalchemy.orm import Session
-from model.models import Farm
+import datetime
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, selectinload
+from core.cache import drones_cache, farms_cache, pastures_cache
+from model.models import Drone, Farm, Measurement, Pasture, User
 from app.api.farms.schemas.farm_schemas import FarmCreate, FarmUpdate
 
 
-def get_farms(db: Session, owner_id: int):
-    return db.query(Farm).filter(Farm.owner_id == owner_id).all()
+def get_farms(db: Session, owner_id: int, columns=None, version=None):
+    # строки только из нужных колонок — без ORM-объектов (см. core/serialization.py)
+    columns = columns or list(Farm.__table__.columns)
+
+    def load():
+        rows = db.execute(select(*columns).where(Farm.owner_id == owner_id)).mappings()
+        return [dict(row) for row in rows]
+
+    return farms_cache.get_or_load(owner_id, (tuple(c.key for c in columns), version), load)
+
+
+def get_farms_version(db: Session, owner_id: int):
+    # (количество, max(updated_at)) — меняется при любом создании, изменении и удалении
+    return tuple(db.execute(
+        select(func.count(Farm.id), func.max(Farm.updated_at)).where(Farm.owner_id == owner_id)
+    ).one())
 
 
 def get_farm(db: Session, farm_id: int, owner_id: int):
@@ -16,6 +34,7 @@ def create_farm(db: Session, farm: FarmCreate, owner_id: int):
     db_farm = Farm(**farm.dict(), owner_id=owner_id)
     db.add(db_farm)
     db.commit()
+    farms_cache.invalidate(owner_id)
     db.refresh(db_farm)
     return db_farm
 
@@ -28,6 +47,7 @@ def update_farm(db: Session, farm_id: int, farm_update: FarmUpdate, owner_id: in
     for key, value in update_data.items():
         setattr(db_farm, key, value)
     db.commit()
+    farms_cache.invalidate(owner_id)
     db.refresh(db_farm)
     return db_farm
 
@@ -38,4 +58,166 @@ def delete_farm(db: Session, farm_id: int, owner_id: int):
         return None
     db.delete(db_farm)
     db.commit()
-    return db_farm
\ No newline at end of file
+    # вместе с фермой удаляются её пастбища и дроны
+    for cache in (farms_cache, pastures_cache, drones_cache):
+        cache.invalidate(owner_id)
+    return db_farm
+
+
+def _latest_measurements(partition_by, farm_ids):
+    """Измерения ферм farm_ids (список или SELECT id), пронумерованные от последнего
+    в каждой группе partition_by (rank = 1 — последнее)"""
+    return (
+        select(
+            Pasture.farm_id,
+            Measurement.pasture_id,
+            Measurement.measured_at,
+            Measurement.status,
+            Measurement.biomass_value,
+            Measurement.ndvi_value,
+            Measurement.coverage_percent,
+            func.row_number().over(
+                partition_by=partition_by,
+                order_by=(Measurement.measured_at.desc(), Measurement.id.desc()),
+            ).label("rank"),
+        )
+        .join(Measurement, Measurement.pasture_id == Pasture.id)
+        .where(Pasture.farm_id.in_(farm_ids))
+        .subquery()
+    )
+
+
+def select_farms_with_aggregates(*criteria):
+    """Фермы, подходящие под criteria (условия на Farm), с агрегатами одним SELECT:
+    пастбища, дроны, измерения за 30 дней и последнее измерение.
+
+    Условия повторяются внутри каждого подзапроса (farm_id IN (SELECT id ...)):
+    иначе GROUP BY и оконная функция считаются по фермам всех пользователей
+    и лишь потом соединяются с отобранными.
+    """
+    since = datetime.datetime.utcnow() - datetime.timedelta(days=30)
+    farm_ids = select(Farm.id).where(*criteria)
+    pastures = (
+        select(
+            Pasture.farm_id,
+            func.count(Pasture.id).label("pasture_count"),
+            func.coalesce(func.sum(Pasture.area), 0.0).label("pasture_area"),
+        )
+        .where(Pasture.farm_id.in_(farm_ids))
+        .group_by(Pasture.farm_id)
+        .subquery()
+    )
+    drones = (
+        select(Drone.farm_id, func.count(Drone.id).label("drone_count"))
+        .where(Drone.farm_id.in_(farm_ids))
+        .group_by(Drone.farm_id)
+        .subquery()
+    )
+    recent = (
+        select(Pasture.farm_id, func.count(Measurement.id).label("measurements_30d"))
+        .join(Measurement, Measurement.pasture_id == Pasture.id)
+        .where(Pasture.farm_id.in_(farm_ids), Measurement.measured_at >= since)
+        .group_by(Pasture.farm_id)
+        .subquery()
+    )
+    ranked = _latest_measurements(Pasture.farm_id, farm_ids)
+    return (
+        select(
+            Farm,
+            func.coalesce(pastures.c.pasture_count, 0).label("pasture_count"),
+            func.coalesce(pastures.c.pasture_area, 0.0).label("pasture_area"),
+            func.coalesce(drones.c.drone_count, 0).label("drone_count"),
+            func.coalesce(recent.c.measurements_30d, 0).label("measurements_30d"),
+            ranked.c.pasture_id.label("latest_pasture_id"),
+            ranked.c.measured_at,
+            ranked.c.status,
+            ranked.c.biomass_value,
+            ranked.c.ndvi_value,
+            ranked.c.coverage_percent,
+        )
+        .outerjoin(pastures, pastures.c.farm_id == Farm.id)
+        .outerjoin(drones, drones.c.farm_id == Farm.id)
+        .outerjoin(recent, recent.c.farm_id == Farm.id)
+        .outerjoin(ranked, (ranked.c.farm_id == Farm.id) & (ranked.c.rank == 1))
+        .where(*criteria)
+    )
+
+
+def _measurement_summary(row, pasture_id_key: str = "latest_pasture_id") -> dict | None:
+    pasture_id = getattr(row, pasture_id_key)
+    if pasture_id is None:
+        return None
+    return {
+        "pasture_id": pasture_id,
+        "measured_at": row.measured_at,
+        "status": row.status,
+        "biomass_value": row.biomass_value,
+        "ndvi_value": row.ndvi_value,
+        "coverage_percent": row.coverage_percent,
+    }
+
+
+def _farm_summary(row) -> dict:
+    return {
+        **{column.key: getattr(row.Farm, column.key) for column in Farm.__table__.columns},
+        "pasture_count": row.pasture_count,
+        "pasture_area": row.pasture_area,
+        "drone_count": row.drone_count,
+        "measurements_30d": row.measurements_30d,
+        "latest_measurement": _measurement_summary(row),
+    }
+
+
+def get_portfolio(db: Session, user: User) -> list[dict]:
+    """Фермы агронома (или фермера) с владельцем и агрегатами.
+
+    Два запроса независимо от числа ферм: фермы с агрегатами одним SELECT
+    и владельцы одним selectinload.
+    """
+    scope = Farm.agronomist_id if user.account_type == "agronomist" else Farm.owner_id
+    rows = db.execute(
+        select_farms_with_aggregates(scope == user.id)
+        .order_by(Farm.id)
+        .options(selectinload(Farm.owner))
+    ).all()
+    return [{**_farm_summary(row), "owner": row.Farm.owner} for row in rows]
+
+
+def get_farm_overview(db: Session, farm_id: int, user: User) -> dict | None:
+    """Ферма с пастбищами, дронами и агрегатами для страницы фермы.
+
+    Четыре запроса: ферма с агрегатами, пастбища и дроны через selectinload,
+    последнее измерение каждого пастбища одним оконным запросом.
+    """
+    row = db.execute(
+        select_farms_with_aggregates(Farm.id == farm_id, or_(Farm.owner_id == user.id, Farm.agronomist_id == user.id))
+        .options(selectinload(Farm.pastures), selectinload(Farm.drones))
+    ).first()
+    if row is None:
+        return None
+
+    farm = row.Farm
+    latest_by_pasture = {}
+    if farm.pastures:
+        ranked = _latest_measurements(Measurement.pasture_id, [farm.id])
+        latest_by_pasture = {
+            r.pasture_id: _measurement_summary(r, "pasture_id")
+            for r in db.execute(select(ranked).where(ranked.c.rank == 1))
+        }
+
+    drones_by_status: dict[str, int] = {}
+    for drone in farm.drones:
+        drones_by_status[drone.status] = drones_by_status.get(drone.status, 0) + 1
+
+    return {
+        **_farm_summary(row),
+        "drones_by_status": drones_by_status,
+        "pastures": [
+            {
+                **{column.key: getattr(pasture, column.key) for column in Pasture.__table__.columns},
+                "latest_measurement": latest_by_pasture.get(pasture.id),
+            }
+            for pasture in sorted(farm.pastures, key=lambda p: p.id)
+        ],
+        "drones": sorted(farm.drones, key=lambda d: d.id),
+    }
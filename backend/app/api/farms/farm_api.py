@@ -1,20 +1,44 @@
 # backend/app/api/farms/farm_api.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
+from core.etag import etag_headers, etag_matches, make_etag, not_modified
 from core.security import get_current_user
+from core.serialization import ListSerializer
 from database.db import get_db
 from model.models import Farm
-from app.api.farms.schemas.farm_schemas import FarmResponse, FarmCreate, FarmUpdate
-from app.api.farms.crud.farm_crud import get_farms, get_farm, create_farm, update_farm, delete_farm
+from app.api.farms.schemas.farm_schemas import FarmResponse, FarmCreate, FarmUpdate, FarmOverview, PortfolioFarm
+from app.api.farms.crud.farm_crud import (
+    get_farms, get_farms_version, get_farm, create_farm, update_farm, delete_farm, get_portfolio, get_farm_overview,
+)
 
 router = APIRouter(prefix="/farms", tags=["farms"])
 
+farm_list = ListSerializer(FarmResponse, Farm)
+
 
 @router.get("/", response_model=list[FarmResponse])
-def read_farms(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+def read_farms(
+    request: Request,
+    fields: str | None = Query(None, description=farm_list.fields_description),
+    db: Session = Depends(get_db),
+    current_user = Depends(get_current_user),
+):
     if current_user.account_type != "farmer":
         raise HTTPException(status_code=403, detail="Only farmers can view their farms")
-    return get_farms(db, current_user.id)
+    columns = farm_list.select(fields)
+    # версию берём до выборки: при гонке клиент получит лишний 200, но не устаревший 304
+    version = get_farms_version(db, current_user.id)
+    etag = make_etag("farms", current_user.id, *version, *(c.key for c in columns))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    farms = get_farms(db, current_user.id, columns, version=version)
+    return farm_list.response(farms, headers=etag_headers(etag), columns=columns)
+
+
+@router.get("/portfolio", response_model=list[PortfolioFarm])
+def read_portfolio(db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    # агроном видит фермы, где он консультант; фермер — свои
+    return get_portfolio(db, current_user)
 
 
 @router.get("/{farm_id}", response_model=FarmResponse)
@@ -27,6 +51,15 @@ def read_farm(farm_id: int, db: Session = Depends(get_db), current_user = Depend
     return farm
 
 
+@router.get("/{farm_id}/overview", response_model=FarmOverview)
+def read_farm_overview(farm_id: int, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
+    # ферма, её пастбища и дроны за один запрос вместо трёх; доступна владельцу и агроному фермы
+    overview = get_farm_overview(db, farm_id, current_user)
+    if not overview:
+        raise HTTPException(status_code=404, detail="Farm not found")
+    return overview
+
+
 @router.post("/", response_model=FarmResponse, status_code=status.HTTP_201_CREATED)
 def create_new_farm(farm: FarmCreate, db: Session = Depends(get_db), current_user = Depends(get_current_user)):
     if current_user.account_type != "farmer":
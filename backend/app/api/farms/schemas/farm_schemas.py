@@ -1,7 +1,9 @@
 # backend/app/api/farms/schemas/farm_schemas.py
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import date, datetime
+from app.api.drones.schemas.drone_schemas import DroneResponse
+from app.api.pastures.schemas.pasture_schemas import PastureResponse
 
 
 class FarmBase(BaseModel):
@@ -53,4 +55,51 @@ class FarmResponse(FarmBase):
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class FarmOwnerSummary(BaseModel):
+    id: int
+    full_name: str
+    phone: str
+    email: str
+
+    class Config:
+        from_attributes = True
+
+
+class MeasurementSummary(BaseModel):
+    pasture_id: int
+    measured_at: Optional[datetime] = None
+    status: Optional[str] = None
+    biomass_value: Optional[float] = None
+    ndvi_value: Optional[float] = None
+    coverage_percent: Optional[float] = None
+
+
+class PortfolioFarm(FarmResponse):
+    """Ферма в портфеле агронома: сама ферма, владелец и агрегаты"""
+    agronomist_id: Optional[int] = None
+    owner: FarmOwnerSummary
+    pasture_count: int
+    pasture_area: float
+    drone_count: int
+    measurements_30d: int
+    latest_measurement: Optional[MeasurementSummary] = None
+
+
+class PastureOverview(PastureResponse):
+    latest_measurement: Optional[MeasurementSummary] = None
+
+
+class FarmOverview(FarmResponse):
+    """Страница фермы одним запросом: ферма, агрегаты, пастбища и дроны"""
+    agronomist_id: Optional[int] = None
+    pasture_count: int
+    pasture_area: float
+    drone_count: int
+    measurements_30d: int
+    latest_measurement: Optional[MeasurementSummary] = None
+    drones_by_status: Dict[str, int]
+    pastures: List[PastureOverview]
+    drones: List[DroneResponse]
@@ -0,0 +1,18 @@
+# backend/app/api/fleet/crud/fleet_crud.py
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from database.db import SessionLocal
+from model.models import Drone, Farm
+
+
+def owner_drones(db: Session, user_id: int) -> list[tuple[int, str]]:
+    """(id, status) всех дронов пользователя — для первичного заполнения состояния парка"""
+    return [tuple(row) for row in db.execute(
+        select(Drone.id, Drone.status).join(Farm).where(Farm.owner_id == user_id)
+    )]
+
+
+def load_owner_drones(user_id: int) -> list[tuple[int, str]]:
+    with SessionLocal() as db:
+        return owner_drones(db, user_id)
@@ -0,0 +1,105 @@
+# backend/app/api/fleet/fleet_api.py
+# Живая карта парка вместо опроса списка дронов:
+#   GET /api/fleet            — текущее состояние дронов пользователя
+#   WS  /api/fleet/ws?token   — снимок при подключении, затем diff-сообщения
+#                               и geofence — входы/выходы дронов на пастбища
+#
+# Сообщения копятся в буферах сокета раньше, чем отправка начнёт ждать, поэтому
+# медленный клиент передаёт window=N и отвечает "ack" на каждое сообщение: сервер
+# держит не больше N неподтверждённых, а изменения тем временем схлопываются.
+import asyncio
+
+import orjson
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from core.security import get_current_user, user_id_from_token
+from database.db import get_db
+from model.models import User
+from app.api.fleet.crud import fleet_crud
+from app.api.fleet.fleet_state import fleet_state
+from app.api.fleet.schemas.fleet_schemas import FleetSnapshot
+
+router = APIRouter(prefix="/fleet", tags=["Fleet"])
+
+
+@router.get("", response_model=FleetSnapshot)
+async def read_fleet(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Последняя позиция и статус каждого дрона пользователя"""
+    # состояние парка меняется только в event loop — в пул потоков уходит лишь запрос к БД
+    drones = await run_in_threadpool(fleet_crud.owner_drones, db, current_user.id)
+    fleet_state.register(current_user.id, drones)
+    return fleet_state.snapshot(current_user.id)
+
+
+class _Flow:
+    """Окно неподтверждённых сообщений (window=0 — без подтверждений)"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.in_flight = 0
+        self.acked = asyncio.Event()
+
+    async def ready(self):
+        while self.window and self.in_flight >= self.window:
+            self.acked.clear()
+            await self.acked.wait()
+
+    def ack(self):
+        self.in_flight = max(0, self.in_flight - 1)
+        self.acked.set()
+
+
+async def _send_updates(websocket: WebSocket, subscription, flow: _Flow):
+    updates = fleet_state.updates(subscription)
+    while True:
+        # следующее сообщение собирается только когда клиент готов — до тех пор копятся грязные слоты
+        await flow.ready()
+        message = await anext(updates)
+        await websocket.send_text(orjson.dumps(message).decode())
+        flow.in_flight += 1
+
+
+async def _read_acks(websocket: WebSocket, flow: _Flow):
+    # чтение нужно и без подтверждений — чтобы заметить отключение
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            return
+        if message.get("text") == "ack":
+            flow.ack()
+
+
+@router.websocket("/ws")
+async def fleet_stream(
+    websocket: WebSocket,
+    token: str = Query(...),
+    window: int = Query(0, ge=0, le=100, description="Неподтверждённых сообщений в полёте; 0 — без ack"),
+):
+    user_id = user_id_from_token(token)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    fleet_state.register(user_id, await run_in_threadpool(fleet_crud.load_owner_drones, user_id))
+    # подписка до снимка: изменения между ними придут первым diff
+    subscription = fleet_state.subscribe(user_id)
+    try:
+        await websocket.send_text(orjson.dumps(fleet_state.snapshot(user_id)).decode())
+        flow = _Flow(window)
+        tasks = {
+            asyncio.create_task(_send_updates(websocket, subscription, flow)),
+            asyncio.create_task(_read_acks(websocket, flow)),
+        }
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        for task in pending:
+            task.cancel()
+        for task in done:
+            # отправка в уже закрытый сокет — тоже отключение клиента
+            if task.exception() and not isinstance(task.exception(), (WebSocketDisconnect, OSError)):
+                raise task.exception()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        fleet_state.unsubscribe(subscription)
@@ -0,0 +1,222 @@
+# backend/app/api/fleet/fleet_state.py
+# Живое состояние парка дронов в памяти воркера: последняя точка и статус каждого
+# дрона в плотных массивах (array.array по полю, слот на дрон) вместо словарей
+# объектов — ~80 байт на дрон и быстрый обход при рассылке.
+#
+# Рассылка по WebSocket идёт только подписчикам владельца дрона. Подписчик хранит
+# не очередь сообщений, а множество «грязных» слотов: медленный клиент получает
+# одно сообщение с самым свежим состоянием вместо растущего хвоста промежуточных.
+#
+# Состояние локально для процесса: телеметрия и подписчики одного владельца должны
+# попадать в один воркер (один воркер или sticky-маршрутизация по владельцу).
+import asyncio
+import math
+from collections import deque
+from array import array
+from datetime import datetime, timezone
+
+from core.metrics import REGISTRY
+
+fleet_subscribers = REGISTRY.gauge(
+    "fleet_subscribers", "Подключённые подписчики живого состояния парка")
+fleet_messages_total = REGISTRY.counter(
+    "fleet_messages_total", "Отправленные подписчикам сообщения", ("type",))
+
+COLUMNS = ("id", "lat", "lng", "altitude", "battery", "speed", "heading", "status", "recorded_at")
+POINT_FIELDS = ("lat", "lng", "altitude", "battery", "speed", "heading")
+STATUSES = ("", "active", "inactive", "maintenance")  # код 0 — неизвестен
+
+EVENTS_PENDING = 1000  # неотправленных событий геозон на подписчика, старые вытесняются
+
+NAN = float("nan")
+
+
+def _epoch(value: datetime) -> float:
+    # в телеметрии время без зоны — это UTC
+    return value.replace(tzinfo=timezone.utc).timestamp() if value.tzinfo is None else value.timestamp()
+
+
+def _value(x: float):
+    return None if math.isnan(x) else x
+
+
+class Subscription:
+    def __init__(self, owner_id: int):
+        self.owner_id = owner_id
+        self.dirty: set[int] = set()        # слоты, изменившиеся с прошлой отправки
+        self.removed: set[int] = set()      # id удалённых дронов
+        self.events: deque = deque(maxlen=EVENTS_PENDING)  # события геозон — не сворачиваются
+        self.event = asyncio.Event()
+
+
+class FleetState:
+    def __init__(self):
+        self.slots: dict[int, int] = {}                 # drone_id -> слот
+        self.ids = array("q")
+        self.owners = array("q")
+        self.status = array("b")
+        self.recorded_at = array("d")
+        self.fields = {name: array("d") for name in POINT_FIELDS}
+        self.free: list[int] = []
+        self.by_owner: dict[int, set[int]] = {}         # owner_id -> слоты
+        self.subscribers: dict[int, set[Subscription]] = {}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def _slot(self, owner_id: int, drone_id: int) -> int:
+        slot = self.slots.get(drone_id)
+        if slot is not None:
+            return slot
+        if self.free:
+            slot = self.free.pop()
+            self.ids[slot], self.owners[slot], self.status[slot], self.recorded_at[slot] = drone_id, owner_id, 0, 0.0
+            for column in self.fields.values():
+                column[slot] = NAN
+        else:
+            slot = len(self.ids)
+            self.ids.append(drone_id)
+            self.owners.append(owner_id)
+            self.status.append(0)
+            self.recorded_at.append(0.0)
+            for column in self.fields.values():
+                column.append(NAN)
+        self.slots[drone_id] = slot
+        self.by_owner.setdefault(owner_id, set()).add(slot)
+        return slot
+
+    def _notify(self, owner_id: int, slots):
+        for subscription in self.subscribers.get(owner_id, ()):
+            subscription.dirty.update(slots)
+            subscription.event.set()
+
+    def register(self, owner_id: int, drones):
+        """Сверить дроны владельца с БД: пары (drone_id, status).
+
+        Новые добавляются, исчезнувшие (удалены вместе с фермой и т.п.) убираются,
+        у известных обновляется статус (изменённый в другом воркере), позиции не
+        трогаются. Подписчики получают добавленные и изменившиеся дроны.
+        """
+        known = {drone_id for drone_id, _ in drones}
+        self.remove([self.ids[slot] for slot in self.by_owner.get(owner_id, ()) if self.ids[slot] not in known])
+        changed = []
+        for drone_id, status in drones:
+            code = STATUSES.index(status) if status in STATUSES else 0
+            slot = self.slots.get(drone_id)
+            if slot is None:
+                slot = self._slot(owner_id, drone_id)
+            elif self.status[slot] == code:
+                continue
+            self.status[slot] = code
+            changed.append(slot)
+        if changed:
+            self._notify(owner_id, changed)
+
+    def apply_points(self, owner_id: int, points: list[dict]):
+        """Принять точки телеметрии (владение уже проверено); старые точки не затирают новые"""
+        changed = set()
+        for point in points:
+            slot = self._slot(owner_id, point["drone_id"])
+            at = _epoch(point["recorded_at"])
+            if at < self.recorded_at[slot]:
+                continue
+            self.recorded_at[slot] = at
+            for name, column in self.fields.items():
+                value = point.get(name)
+                column[slot] = NAN if value is None else value
+            changed.add(slot)
+        if changed:
+            self._notify(owner_id, changed)
+
+    def set_status(self, owner_id: int, drone_id: int, status: str):
+        self.set_statuses(owner_id, [(drone_id, status)])
+
+    def set_statuses(self, owner_id: int, statuses):
+        """Новые статусы дронов владельца: пары (drone_id, status), одно уведомление на пачку"""
+        slots = []
+        for drone_id, status in statuses:
+            slot = self._slot(owner_id, drone_id)
+            self.status[slot] = STATUSES.index(status) if status in STATUSES else 0
+            slots.append(slot)
+        if slots:
+            self._notify(owner_id, slots)
+
+    def remove(self, drone_ids):
+        for drone_id in drone_ids:
+            slot = self.slots.pop(drone_id, None)
+            if slot is None:
+                continue
+            owner_id = self.owners[slot]
+            self.by_owner[owner_id].discard(slot)
+            self.free.append(slot)
+            for subscription in self.subscribers.get(owner_id, ()):
+                subscription.dirty.discard(slot)
+                subscription.removed.add(drone_id)
+                subscription.event.set()
+
+    def rows(self, slots) -> list[list]:
+        """Текущее состояние слотов строками в порядке COLUMNS"""
+        fields = [self.fields[name] for name in POINT_FIELDS]
+        rows = []
+        for slot in sorted(slots):
+            at = self.recorded_at[slot]
+            rows.append([
+                self.ids[slot],
+                *(_value(column[slot]) for column in fields),
+                STATUSES[self.status[slot]] or None,
+                at or None,
+            ])
+        return rows
+
+    def snapshot(self, owner_id: int) -> dict:
+        return {"type": "snapshot", "columns": COLUMNS, "drones": self.rows(self.by_owner.get(owner_id, ()))}
+
+    def publish_events(self, owner_id: int, events: list[dict]):
+        """События геозон (вход/выход дрона) подписчикам владельца"""
+        subscribers = self.subscribers.get(owner_id)
+        if not subscribers or not events:
+            return
+        rows = [{**e, "recorded_at": e["recorded_at"].isoformat()} for e in events]
+        for subscription in subscribers:
+            subscription.events.extend(rows)
+            subscription.event.set()
+
+    def subscribe(self, owner_id: int) -> Subscription:
+        subscription = Subscription(owner_id)
+        self.subscribers.setdefault(owner_id, set()).add(subscription)
+        fleet_subscribers.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self.subscribers.get(subscription.owner_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self.subscribers[subscription.owner_id]
+        fleet_subscribers.dec()
+
+    async def updates(self, subscription: Subscription):
+        """Сообщения подписчику: каждое — все изменения с прошлого, в самом свежем виде"""
+        while True:
+            await subscription.event.wait()
+            subscription.event.clear()
+            # слоты, освобождённые и занятые другим владельцем, пропускаются
+            dirty = [s for s in subscription.dirty if self.owners[s] == subscription.owner_id]
+            removed = sorted(subscription.removed)
+            subscription.dirty.clear()
+            subscription.removed.clear()
+            if subscription.events:
+                events = list(subscription.events)
+                subscription.events.clear()
+                fleet_messages_total.inc(("geofence",))
+                yield {"type": "geofence", "events": events}
+            if not dirty and not removed:
+                continue
+            message = {"type": "diff", "drones": self.rows(dirty)}
+            if removed:
+                message["removed"] = removed
+            fleet_messages_total.inc(("diff",))
+            yield message
+
+
+fleet_state = FleetState()
@@ -0,0 +1,11 @@
+# backend/app/api/fleet/schemas/fleet_schemas.py
+from typing import Any, List
+
+from pydantic import BaseModel
+
+
+class FleetSnapshot(BaseModel):
+    """Состояние парка: строки drones в порядке columns (id, lat, lng, ..., status, recorded_at)"""
+    type: str
+    columns: List[str]
+    drones: List[List[Any]]
@@ -0,0 +1,30 @@
+# backend/app/api/imports/crud/import_crud.py
+from sqlalchemy.orm import Session
+
+from model.models import ImportJob
+
+
+def create_import_job(db: Session, owner_id: int, kind: str, file_format: str, filename: str | None) -> ImportJob:
+    """Задание импорта без COMMIT: он — вместе с заданием очереди (start_import)"""
+    job = ImportJob(
+        owner_id=owner_id,
+        kind=kind,
+        file_format=file_format,
+        filename=filename,
+        status="pending",
+        progress=0.0,
+        processed_rows=0,
+        inserted_rows=0,
+        error_count=0,
+    )
+    db.add(job)
+    db.flush()
+    return job
+
+
+def get_import_job(db: Session, job_id: int, owner_id: int) -> ImportJob | None:
+    return db.query(ImportJob).filter(ImportJob.id == job_id, ImportJob.owner_id == owner_id).first()
+
+
+def get_import_jobs(db: Session, owner_id: int, limit: int = 50) -> list[ImportJob]:
+    return db.query(ImportJob).filter(ImportJob.owner_id == owner_id).order_by(ImportJob.id.desc()).limit(limit).all()
@@ -0,0 +1,162 @@
+# backend/app/api/imports/importer.py
+# Выполнение задания импорта: чтение строк, проверка схемами FarmCreate/PastureCreate,
+# вставка пачками через bulk_insert (COPY в PostgreSQL) и запись прогресса в import_jobs.
+#
+# Каждая пачка — отдельная транзакция: при сбое посреди файла уже вставленные
+# строки остаются, а в задании видно, сколько их (inserted_rows).
+import datetime
+import json
+import logging
+import os
+
+from pydantic import ValidationError
+from sqlalchemy import select, update
+
+from core.cache import farms_cache, pastures_cache
+from core.config import settings
+from database.bulk import bulk_insert
+from database.db import SessionLocal, engine
+from model.models import Farm, ImportJob, Pasture
+from app.api.common.crud.bulk_crud import validation_message
+from app.api.farms.schemas.farm_schemas import FarmCreate
+from app.api.pastures.schemas.pasture_schemas import PastureCreate
+from app.api.imports.readers import READERS, ImportFormatError
+from app.api.sync.changelog import record_created_since
+
+logger = logging.getLogger(__name__)
+
+TARGETS = {
+    "farms": (FarmCreate, Farm, farms_cache),
+    "pastures": (PastureCreate, Pasture, pastures_cache),
+}
+
+LIST_FIELDS = ("crops", "equipment", "photos")
+
+
+def normalize_row(row: dict) -> dict:
+    """Ключи в нижний регистр, пустые значения отбрасываются, списки из строк"""
+    normalized = {}
+    for key, value in row.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                continue
+        elif value is None:
+            continue
+        key = str(key).strip().lower()
+        if key in LIST_FIELDS and isinstance(value, str):
+            # JSON-массив или перечисление через запятую
+            value = json.loads(value) if value.startswith("[") else [v.strip() for v in value.split(",") if v.strip()]
+        elif key == "boundary" and isinstance(value, str):
+            # граница в CSV — GeoJSON-геометрия строкой
+            value = json.loads(value)
+        normalized[key] = value
+    return normalized
+
+
+class _Progress:
+    def __init__(self, db, job: ImportJob):
+        self.db = db
+        self.job = job
+        self.errors: list[dict] = []
+
+    def error(self, row_number: int, message: str):
+        self.job.error_count += 1
+        if len(self.errors) < settings.IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row_number, "error": message})
+
+    def save(self, **fields):
+        for key, value in fields.items():
+            setattr(self.job, key, value)
+        # JSON-колонка отслеживается по присваиванию — отдаём копию списка
+        self.job.errors = list(self.errors)
+        self.db.commit()
+
+
+def abandon_imports(connection, payloads: list[dict], message: str) -> list[str]:
+    """Задания очереди этих импортов больше не выполнятся (отмена, пропавший воркер):
+    import_jobs — failed в транзакции вызывающего; возвращает файлы для удаления после COMMIT"""
+    if payloads:
+        connection.execute(
+            update(ImportJob)
+            .where(ImportJob.id.in_([p["import_job_id"] for p in payloads]),
+                   ImportJob.status.in_(("pending", "running")))
+            .values(status="failed", message=message, finished_at=datetime.datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    return [p["path"] for p in payloads]
+
+
+def remove_files(paths: list[str]):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def run_import(job_id: int, path: str, defaults: dict | None = None):
+    """Обработать файл задания; вызывается фоновой задачей после загрузки"""
+    db = SessionLocal()
+    try:
+        job = db.get(ImportJob, job_id)
+        progress = _Progress(db, job)
+        progress.save(status="running", started_at=datetime.datetime.utcnow(),
+                      processed_rows=0, inserted_rows=0, error_count=0)
+        try:
+            _process(job, path, defaults or {}, progress)
+        except (ImportFormatError, ValueError, OSError) as exc:
+            progress.save(status="failed", message=str(exc), finished_at=datetime.datetime.utcnow())
+        except Exception as exc:
+            logger.exception("Импорт %s завершился ошибкой", job_id)
+            progress.save(status="failed", message=f"Внутренняя ошибка: {exc}", finished_at=datetime.datetime.utcnow())
+        else:
+            progress.save(status="completed", progress=1.0, finished_at=datetime.datetime.utcnow())
+    finally:
+        db.close()
+        remove_files([path])
+
+
+def _process(job: ImportJob, path: str, defaults: dict, progress: _Progress):
+    schema, model, cache = TARGETS[job.kind]
+    table = model.__table__
+    owner_id = job.owner_id
+    owned_farms = set()
+    if job.kind == "pastures":
+        # владение проверяется по множеству ферм пользователя, загруженному один раз
+        owned_farms = set(progress.db.scalars(select(Farm.id).where(Farm.owner_id == owner_id)))
+
+    chunk: list[dict] = []
+    fraction = 0.0
+
+    def flush():
+        if chunk:
+            with engine.begin() as conn:
+                bulk_insert(conn, table, chunk, columns=list(chunk[0]))
+                # COPY не возвращает id — журнал пишется по времени создания пачки
+                record_created_since(conn, owner_id, job.kind, chunk[0]["created_at"])
+            cache.invalidate(owner_id)
+            job.inserted_rows += len(chunk)
+            chunk.clear()
+        progress.save(progress=fraction)
+
+    for row_number, row, fraction in READERS[job.file_format](path):
+        job.processed_rows += 1
+        try:
+            item = schema.model_validate({**defaults, **normalize_row(row)})
+        except ValidationError as exc:
+            progress.error(row_number, validation_message(exc))
+            continue
+        except json.JSONDecodeError as exc:
+            progress.error(row_number, f"Некорректный JSON: {exc.msg}")
+            continue
+        if job.kind == "pastures" and item.farm_id not in owned_farms:
+            progress.error(row_number, "Ферма не найдена или не принадлежит пользователю")
+            continue
+
+        now = datetime.datetime.utcnow()
+        record = {**item.model_dump(), "created_at": now, "updated_at": now}
+        if job.kind == "farms":
+            record["owner_id"] = owner_id
+        chunk.append(record)
+        if len(chunk) >= settings.IMPORT_CHUNK_ROWS:
+            flush()
+    flush()
@@ -0,0 +1,97 @@
+# backend/app/api/imports/imports_api.py
+# Импорт ферм и пастбищ из CSV, GeoJSON и shapefile (ZIP).
+# Файл потоково сохраняется в JOB_FILES_DIR, обработка — заданием очереди (app/jobs),
+# прогресс и ошибки по строкам — в GET /imports/{job_id}.
+# Эндпоинт синхронный: копирование файла и запросы к БД идут в пуле потоков, а не
+# в цикле событий (как у POST /uploads/photos).
+import os
+import tempfile
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.security import get_current_user
+from database.db import get_db
+from model.models import User
+from app.api.imports.crud import import_crud
+from app.api.imports.readers import EXTENSIONS
+from app.api.imports.schemas.import_schemas import ImportJobResponse
+from app.jobs.queue import enqueue, job_dir
+
+router = APIRouter(prefix="/imports", tags=["Imports"])
+
+UPLOAD_CHUNK = 1024 * 1024
+
+
+def _save_upload(file: UploadFile, suffix: str) -> str:
+    """Скопировать загрузку в файл для воркера кусками, не превышая IMPORT_MAX_BYTES"""
+    written = 0
+    fd, path = tempfile.mkstemp(prefix="import-", suffix=suffix, dir=job_dir("imports"))
+    try:
+        with os.fdopen(fd, "wb") as out:
+            while chunk := file.file.read(UPLOAD_CHUNK):
+                written += len(chunk)
+                if written > settings.IMPORT_MAX_BYTES:
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Файл больше {settings.IMPORT_MAX_BYTES // (1024 * 1024)} МБ"
+                    )
+                out.write(chunk)
+    except BaseException:
+        os.remove(path)
+        raise
+    return path
+
+
+@router.post("/{kind}", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
+def start_import(
+    kind: Literal["farms", "pastures"],
+    file: UploadFile = File(...),
+    farm_id: Optional[int] = Form(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Загрузить файл импорта; farm_id — ферма по умолчанию для строк пастбищ без farm_id"""
+    if current_user.account_type != "farmer":
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Импорт доступен только фермерам")
+
+    extension = os.path.splitext(file.filename or "")[1].lower()
+    file_format = EXTENSIONS.get(extension)
+    if file_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Неподдерживаемый формат. Допустимые расширения: {', '.join(EXTENSIONS)}"
+        )
+
+    path = _save_upload(file, extension)
+    defaults = {"farm_id": farm_id} if kind == "pastures" and farm_id is not None else {}
+    try:
+        # import_jobs и задание очереди — одной транзакцией: без задания импорт навсегда остался бы pending
+        job = import_crud.create_import_job(db, current_user.id, kind, file_format, file.filename)
+        # импорт пишет строки пачками по мере чтения — повторять его с начала нельзя
+        enqueue(db, "import", {"import_job_id": job.id, "path": path, "defaults": defaults}, current_user.id,
+                max_attempts=1, commit=False)
+        db.commit()
+    except BaseException:
+        db.rollback()
+        os.remove(path)
+        raise
+    db.refresh(job)
+    return job
+
+
+@router.get("/", response_model=List[ImportJobResponse])
+def list_imports(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Последние задания импорта пользователя"""
+    return import_crud.get_import_jobs(db, current_user.id)
+
+
+@router.get("/{job_id}", response_model=ImportJobResponse)
+def get_import(job_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Статус, прогресс и ошибки по строкам"""
+    job = import_crud.get_import_job(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задание импорта не найдено")
+    return job
@@ -0,0 +1,131 @@
+# backend/app/api/imports/readers.py
+# Потоковое чтение файлов импорта: строка за строкой, без загрузки файла в память.
+# Каждый читатель отдаёт (номер строки, словарь полей, доля прочитанного файла).
+import csv
+import io
+import json
+import os
+from typing import Iterator
+
+from core.geo import GEOMETRY_TYPES, geometry_center
+
+try:
+    import shapefile  # pyshp
+except ImportError:  # pragma: no cover
+    shapefile = None
+
+Row = tuple[int, dict, float]
+
+READ_CHUNK = 64 * 1024
+MAX_FEATURE_CHARS = 16 * 1024 * 1024  # один Feature GeoJSON (граница на сотни тысяч вершин)
+
+
+class ImportFormatError(ValueError):
+    """Файл не удаётся разобрать целиком (а не отдельная строка)"""
+
+
+def feature_row(feature: dict) -> dict:
+    row = dict(feature.get("properties") or {})
+    geometry = feature.get("geometry")
+    center = geometry_center(geometry)
+    if center is not None:
+        row.setdefault("coordinates_lat", center[0])
+        row.setdefault("coordinates_lng", center[1])
+    if geometry and geometry.get("type") in GEOMETRY_TYPES:
+        row.setdefault("boundary", geometry)
+    return row
+
+
+def read_csv(path: str) -> Iterator[Row]:
+    size = os.path.getsize(path) or 1
+    with open(path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+        sample = text.read(READ_CHUNK)
+        text.seek(0)
+        try:
+            # Excel в русской локали сохраняет CSV через «;»
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.excel
+        reader = csv.DictReader(text, dialect=dialect)
+        if not reader.fieldnames:
+            raise ImportFormatError("В CSV нет строки заголовка")
+        for row in reader:
+            values = {k: v for k, v in row.items() if k is not None and isinstance(v, str)}
+            yield reader.line_num, values, raw.tell() / size
+
+
+def read_geojson(path: str) -> Iterator[Row]:
+    """FeatureCollection разбирается по одному Feature (raw_decode по буферу).
+    Буфер не растёт больше MAX_FEATURE_CHARS: битый объект не затягивает в память остаток файла"""
+    size = os.path.getsize(path) or 1
+    decoder = json.JSONDecoder()
+    with open(path, "rb") as raw:
+        text = io.TextIOWrapper(raw, encoding="utf-8-sig")
+        buffer = ""
+        while True:
+            start = buffer.find('"features"')
+            bracket = buffer.find("[", start) if start != -1 else -1
+            if bracket != -1:
+                buffer = buffer[bracket + 1:]
+                break
+            chunk = text.read(READ_CHUNK)
+            if not chunk or len(buffer) > MAX_FEATURE_CHARS:
+                raise ImportFormatError("В GeoJSON нет массива features")
+            buffer += chunk
+
+        number = 0
+        while True:
+            buffer = buffer.lstrip(" \t\r\n,")
+            if buffer.startswith("]"):
+                return
+            try:
+                feature, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if len(buffer) > MAX_FEATURE_CHARS:
+                    raise ImportFormatError(
+                        f"Объект {number + 1} в features не разбирается "
+                        f"или больше {MAX_FEATURE_CHARS // (1024 * 1024)} МБ"
+                    )
+                chunk = text.read(READ_CHUNK)
+                if not chunk:
+                    raise ImportFormatError(f"GeoJSON обрывается после объекта {number}")
+                buffer += chunk
+                continue
+            buffer = buffer[end:]
+            number += 1
+            if not isinstance(feature, dict):
+                raise ImportFormatError(f"Объект {number} в features — не Feature")
+            yield number, feature_row(feature), raw.tell() / size
+
+
+def read_shapefile(path: str) -> Iterator[Row]:
+    """ZIP-архив с .shp/.dbf (.prj игнорируется — ожидаются координаты WGS 84)"""
+    if shapefile is None:
+        raise ImportFormatError("Импорт shapefile недоступен: не установлен пакет pyshp")
+    try:
+        reader = shapefile.Reader(path)
+    except shapefile.ShapefileException as exc:
+        raise ImportFormatError(f"Не удалось открыть shapefile: {exc}") from exc
+    with reader:
+        total = len(reader) or 1
+        for number, shape_record in enumerate(reader.iterShapeRecords(), start=1):
+            row = feature_row({
+                "properties": shape_record.record.as_dict(),
+                "geometry": shape_record.shape.__geo_interface__,
+            })
+            yield number, row, number / total
+
+
+READERS = {
+    "csv": read_csv,
+    "geojson": read_geojson,
+    "shapefile": read_shapefile,
+}
+
+EXTENSIONS = {
+    ".csv": "csv",
+    ".geojson": "geojson",
+    ".json": "geojson",
+    ".zip": "shapefile",
+}
@@ -0,0 +1,30 @@
+# backend/app/api/imports/schemas/import_schemas.py
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class ImportRowError(BaseModel):
+    row: int
+    error: str
+
+
+class ImportJobResponse(BaseModel):
+    id: int
+    kind: str
+    file_format: str
+    filename: Optional[str] = None
+    status: str
+    progress: float
+    processed_rows: int
+    inserted_rows: int
+    error_count: int
+    errors: Optional[List[ImportRowError]] = None
+    message: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,19 @@
+# backend/app/api/jobs/crud/job_crud.py
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from model.models import Job
+
+
+def get_job(db: Session, job_id: int, owner_id: int) -> Job | None:
+    return db.query(Job).filter(Job.id == job_id, Job.owner_id == owner_id).first()
+
+
+def get_jobs(db: Session, owner_id: int, status: str | None = None, kind: str | None = None,
+             limit: int = 50) -> list[Job]:
+    query = select(Job).where(Job.owner_id == owner_id)
+    if status is not None:
+        query = query.where(Job.status == status)
+    if kind is not None:
+        query = query.where(Job.kind == kind)
+    return list(db.scalars(query.order_by(Job.id.desc()).limit(limit)))
@@ -0,0 +1,47 @@
+# backend/app/api/jobs/jobs_api.py
+# Статус фоновых заданий пользователя (импорт, экспорт, обработка съёмки).
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+
+from core.security import get_current_user
+from database.db import get_db
+from model.models import User
+from app.api.jobs.crud import job_crud
+from app.api.jobs.schemas.job_schemas import JobResponse
+from app.jobs.queue import cancel
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/", response_model=List[JobResponse])
+def list_jobs(
+    status: Optional[Literal["queued", "running", "completed", "failed", "cancelled"]] = None,
+    kind: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Последние задания пользователя"""
+    return job_crud.get_jobs(db, current_user.id, status, kind, limit)
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+def get_job(job_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    job = job_crud.get_job(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задание не найдено")
+    return job
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+def cancel_job(job_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Отменить задание, пока оно в очереди"""
+    job = job_crud.get_job(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Задание не найдено")
+    if not cancel(db, job_id, current_user.id):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=f"Задание в статусе {job.status}")
+    db.refresh(job)
+    return job
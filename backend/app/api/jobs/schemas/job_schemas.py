@@ -0,0 +1,23 @@
+# backend/app/api/jobs/schemas/job_schemas.py
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JobResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    kind: str
+    status: str                          # queued / running / completed / failed / cancelled
+    priority: int
+    farm_id: Optional[int] = None
+    attempts: int
+    max_attempts: int
+    run_after: datetime                  # для queued после ошибки — время следующей попытки
+    error: Optional[str] = None
+    result: Optional[Any] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,76 @@
+# backend/app/api/missions/crud/mission_crud.py
+# Маршруты кэшируются по (пастбище, updated_at, параметры): изменение границы
+# обновляет updated_at, и старые записи просто перестают запрашиваться.
+import math
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import core.cache as cache
+from model.models import Farm, Pasture
+from app.api.missions.planner import camera_footprint, path_length, plan_coverage
+from app.api.missions.schemas.mission_schemas import MissionParams
+
+PASTURE_COLUMNS = (Pasture.id, Pasture.updated_at, Pasture.boundary)
+
+
+def plan_mission(pasture_id: int, version, boundary: dict, params: MissionParams) -> dict:
+    spacing = camera_footprint(params.altitude, params.fov_across) * (1 - params.side_overlap)
+    trigger = camera_footprint(params.altitude, params.fov_along) * (1 - params.front_overlap)
+    plan = plan_coverage(boundary, spacing, params.home)
+    length = path_length(plan["waypoints"])
+    return {
+        "pasture_id": pasture_id,
+        "pasture_version": version.isoformat(),
+        "altitude": params.altitude,
+        "line_spacing": round(spacing, 2),
+        "trigger_distance": round(trigger, 2),
+        "sweep_bearing": plan["sweep_bearing"],
+        "passes": plan["passes"],
+        "length": round(length, 1),
+        "duration": round(length / params.speed, 1),
+        "photos": math.floor(length / trigger) + 1,
+        "waypoints": plan["waypoints"],
+    }
+
+
+def cached_mission(pasture_id: int, version, boundary: dict, params: MissionParams) -> dict:
+    key = f"mission:{pasture_id}:{version.isoformat()}:{tuple(params.model_dump().values())!r}"
+    mission = cache.backend.get(key)
+    if mission is not None:
+        cache.cache_requests_total.inc(("missions", "hit"))
+        return mission
+    cache.cache_requests_total.inc(("missions", "miss"))
+    mission = plan_mission(pasture_id, version, boundary, params)
+    cache.backend.set(key, mission)
+    return mission
+
+
+def get_pasture_mission(db: Session, pasture_id: int, user_id: int, params: MissionParams) -> dict | None:
+    """Маршрут облёта пастбища; None — пастбище не найдено, ValueError — нет границы или она вырождена"""
+    row = db.execute(
+        select(*PASTURE_COLUMNS).join(Farm).where(Pasture.id == pasture_id, Farm.owner_id == user_id)
+    ).first()
+    if row is None:
+        return None
+    if row.boundary is None:
+        raise ValueError("У пастбища не задана граница")
+    return cached_mission(row.id, row.updated_at, row.boundary, params)
+
+
+def get_farm_missions(db: Session, farm_id: int, user_id: int, params: MissionParams) -> dict | None:
+    """Маршруты всех пастбищ фермы одним запросом; пастбища без границы
+    или с вырожденной границей — в skipped"""
+    if db.scalar(select(Farm.id).where(Farm.id == farm_id, Farm.owner_id == user_id)) is None:
+        return None
+    rows = db.execute(select(*PASTURE_COLUMNS).where(Pasture.farm_id == farm_id).order_by(Pasture.id)).all()
+    missions, skipped = [], []
+    for r in rows:
+        if r.boundary is None:
+            skipped.append(r.id)
+            continue
+        try:
+            missions.append(cached_mission(r.id, r.updated_at, r.boundary, params))
+        except ValueError:
+            skipped.append(r.id)
+    return {"farm_id": farm_id, "missions": missions, "skipped": skipped}
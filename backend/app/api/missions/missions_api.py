@@ -0,0 +1,60 @@
+# backend/app/api/missions/missions_api.py
+# Планирование облёта пастбищ для съёмки:
+#   GET /api/missions/pastures/{pasture_id}  — маршрут «змейкой» (JSON или WPL для QGroundControl)
+#   GET /api/missions/farms/{farm_id}        — маршруты всех пастбищ фермы
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.orm import Session
+
+from core.security import get_current_user
+from database.db import get_db
+from model.models import User
+from app.api.missions.crud import mission_crud
+from app.api.missions.schemas.mission_schemas import FarmMissions, MissionParams, MissionResponse
+from app.api.missions.writers import to_wpl
+
+router = APIRouter(prefix="/missions", tags=["Missions"])
+
+
+@router.get("/pastures/{pasture_id}", response_model=MissionResponse)
+def plan_pasture_mission(
+    pasture_id: int,
+    format: Literal["json", "wpl"] = "json",
+    params: MissionParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Маршрут облёта пастбища по его границе"""
+    if (params.home_lat is None) != (params.home_lng is None):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Точка взлёта задаётся парой home_lat и home_lng"
+        )
+    try:
+        mission = mission_crud.get_pasture_mission(db, pasture_id, current_user.id, params)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e))
+    if mission is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пастбище не найдено")
+    if format == "wpl":
+        return PlainTextResponse(
+            to_wpl(mission, params.home),
+            headers={"Content-Disposition": f'attachment; filename="pasture-{pasture_id}.waypoints"'},
+        )
+    return mission
+
+
+@router.get("/farms/{farm_id}", response_model=FarmMissions)
+def plan_farm_missions(
+    farm_id: int,
+    params: MissionParams = Depends(),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Маршруты облёта всех пастбищ фермы с заданной границей"""
+    missions = mission_crud.get_farm_missions(db, farm_id, current_user.id, params)
+    if missions is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ферма не найдена")
+    return missions
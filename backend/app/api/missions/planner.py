@@ -0,0 +1,181 @@
+# backend/app/api/missions/planner.py
+# Планирование облёта пастбища «змейкой» (boustrophedon): параллельные галсы
+# через весь полигон с разворотами на краях.
+#
+# Расчёт идёт в локальной метрической проекции вокруг пастбища (равнопромежуточная,
+# для полей до десятков км ошибка ниже шага галсов):
+#   1. Направление галсов — вдоль ребра выпуклой оболочки с минимальной шириной
+#      (вращающиеся штангенциркули, все рёбра разом): меньше галсов — меньше разворотов.
+#   2. Галсы — горизонтальные прямые в повёрнутых координатах; пересечения со всеми
+#      рёбрами (включая дырки и части MultiPolygon) считаются матрицей
+#      (галс x ребро) блоками по LINE_CHUNK галсов, отрезки внутри — по правилу чётности.
+#      Число галсов и точек ограничено (MAX_PASSES, MAX_WAYPOINTS): малый шаг на
+#      большом пастбище иначе исчерпает память воркера.
+#   3. Чётные галсы проходятся слева направо, нечётные — обратно. Из четырёх углов
+#      старта выбирается ближайший к точке взлёта, если она задана.
+# На невыпуклом пастбище галс пересекает «заливы» по прямой, не выходя на новый заход.
+import math
+
+import numpy as np
+
+EARTH_RADIUS = 6_371_008.8
+DEGREE = math.pi / 180 * EARTH_RADIUS  # метров в градусе широты
+
+MAX_PASSES = 2000      # галсов в маршруте; больше — шаг слишком мал для пастбища
+MAX_WAYPOINTS = 20_000
+LINE_CHUNK = 256       # галсов в одном блоке матрицы пересечений
+
+
+def camera_footprint(altitude: float, fov: float) -> float:
+    """Ширина кадра на земле (м) для угла обзора fov (градусы) с высоты altitude"""
+    return 2 * altitude * math.tan(math.radians(fov) / 2)
+
+
+def _rings(geometry: dict) -> list[np.ndarray]:
+    polygons = [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+    return [np.asarray(ring, dtype=np.float64)[:, :2] for polygon in polygons for ring in polygon]
+
+
+class _Projection:
+    """lng/lat <-> метры вокруг начала координат origin"""
+
+    def __init__(self, lng0: float, lat0: float):
+        self.lng0, self.lat0 = lng0, lat0
+        self.kx = DEGREE * math.cos(math.radians(lat0))
+
+    def forward(self, lnglat: np.ndarray) -> np.ndarray:
+        return np.column_stack([(lnglat[:, 0] - self.lng0) * self.kx, (lnglat[:, 1] - self.lat0) * DEGREE])
+
+    def inverse(self, xy: np.ndarray) -> np.ndarray:
+        return np.column_stack([xy[:, 0] / self.kx + self.lng0, xy[:, 1] / DEGREE + self.lat0])
+
+
+def convex_hull(points: np.ndarray) -> np.ndarray:
+    """Выпуклая оболочка (монотонная цепь Эндрю), против часовой стрелки"""
+    points = np.unique(points, axis=0)
+    if len(points) < 3:
+        return points
+
+    def chain(sequence):
+        # на десятках вершин скаляры Python быстрее поэлементных вызовов numpy
+        hull = []
+        for x, y in sequence:
+            while len(hull) >= 2:
+                (x1, y1), (x2, y2) = hull[-2], hull[-1]
+                if (x2 - x1) * (y - y1) - (y2 - y1) * (x - x1) > 0:
+                    break
+                hull.pop()
+            hull.append((x, y))
+        return hull[:-1]
+
+    sequence = points.tolist()
+    return np.array(chain(sequence) + chain(sequence[::-1]))
+
+
+def sweep_angle(hull: np.ndarray) -> tuple[float, float]:
+    """(угол галсов в радианах, ширина поперёк галсов) с минимальной шириной"""
+    if len(hull) < 3:
+        return 0.0, 0.0
+    edges = np.roll(hull, -1, axis=0) - hull
+    angles = np.arctan2(edges[:, 1], edges[:, 0])
+    normals = np.column_stack([-np.sin(angles), np.cos(angles)])
+    # проекции всех вершин на нормали всех рёбер: ширина полосы для каждого направления
+    projections = hull @ normals.T
+    widths = projections.max(axis=0) - projections.min(axis=0)
+    best = int(np.argmin(widths))
+    return float(angles[best]), float(widths[best])
+
+
+def _rotation(angle: float) -> np.ndarray:
+    """Матрица поворота на -angle: галсы становятся горизонтальными (для xy @ R)"""
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[c, -s], [s, c]])
+
+
+def sweep_lines(rings: list[np.ndarray], spacing: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Пересечения галсов с полигоном в повёрнутых координатах: (y галсов, x пересечений, число на галс).
+    ValueError — галсов больше MAX_PASSES"""
+    p1 = np.concatenate([ring[:-1] for ring in rings])
+    p2 = np.concatenate([ring[1:] for ring in rings])
+    low, high = float(min(p1[:, 1].min(), p2[:, 1].min())), float(max(p1[:, 1].max(), p2[:, 1].max()))
+    count = max(1, math.ceil((high - low) / spacing))
+    if count > MAX_PASSES:
+        raise ValueError(f"Слишком много галсов ({count}, не более {MAX_PASSES}): увеличьте высоту или уменьшите перекрытие")
+    # галсы симметрично внутри полосы: крайние — на полшага от края
+    ys = (low + high) / 2 + (np.arange(count) - (count - 1) / 2) * spacing
+
+    dy = np.where(p2[:, 1] == p1[:, 1], 1.0, p2[:, 1] - p1[:, 1])
+    blocks, counts = [], np.empty(count, dtype=np.int64)
+    for start in range(0, count, LINE_CHUNK):
+        y = ys[start:start + LINE_CHUNK, None]
+        crosses = (p1[None, :, 1] > y) != (p2[None, :, 1] > y)
+        xs = p1[None, :, 0] + (y - p1[None, :, 1]) * (p2[None, :, 0] - p1[None, :, 0]) / dy[None, :]
+        block_counts = crosses.sum(axis=1)
+        counts[start:start + LINE_CHUNK] = block_counts
+        # после сортировки inf в конце: хранятся только столбцы с пересечениями
+        blocks.append(np.sort(np.where(crosses, xs, np.inf), axis=1)[:, :int(block_counts.max())])
+    width = max(block.shape[1] for block in blocks)
+    xs = np.full((count, width), np.inf)
+    for start, block in zip(range(0, count, LINE_CHUNK), blocks):
+        xs[start:start + len(block), :block.shape[1]] = block
+    return ys, xs, counts
+
+
+def _serpentine(ys: np.ndarray, xs: np.ndarray, counts: np.ndarray,
+                reverse_lines: bool, reverse_first: bool) -> np.ndarray:
+    """Точки маршрута: галсы по порядку, направление чередуется"""
+    keep = counts > 0
+    ys, xs, counts = ys[keep], xs[keep], counts[keep]
+    if reverse_lines:
+        ys, xs, counts = ys[::-1], xs[::-1], counts[::-1]
+    backward = (np.arange(len(ys)) % 2 == 1) != reverse_first
+    # обратный проход: конечные значения в убывающем порядке, inf уходят в конец
+    flipped = -np.sort(np.where(np.isfinite(xs), -xs, np.inf), axis=1)
+    ordered = np.where(backward[:, None], flipped, xs)
+    valid = np.isfinite(ordered)
+    return np.column_stack([ordered[valid], np.repeat(ys, counts)])
+
+
+def plan_coverage(geometry: dict, spacing: float, home: tuple[float, float] | None = None) -> dict:
+    """Маршрут облёта: точки [lat, lng], направление галсов и их число.
+    ValueError — граница вырождена или маршрут слишком велик"""
+    rings = _rings(geometry)
+    outer = np.concatenate(rings)
+    projection = _Projection(*outer.mean(axis=0))
+    rings = [projection.forward(ring) for ring in rings]
+
+    angle, width = sweep_angle(convex_hull(np.concatenate(rings)))
+    rotation = _rotation(angle)
+    ys, xs, counts = sweep_lines([ring @ rotation for ring in rings], spacing)
+    if not counts.any():
+        # вырожденная граница (сохранена до проверки площади): ни один галс её не пересекает
+        raise ValueError("Граница пастбища вырождена: маршрут не строится")
+    if counts.sum() > MAX_WAYPOINTS:
+        raise ValueError(f"Слишком много точек маршрута (не более {MAX_WAYPOINTS}): увеличьте шаг галсов")
+
+    variants = [_serpentine(ys, xs, counts, reverse_lines, reverse_first)
+                for reverse_lines in (False, True) for reverse_first in (False, True)]
+    path = variants[0]
+    if home is not None:
+        start = projection.forward(np.array([[home[1], home[0]]])) @ rotation
+        path = min(variants, key=lambda v: float(np.hypot(*(v[0] - start[0]))))
+    path = projection.inverse(path @ rotation.T)
+
+    # курс галсов: азимут от севера по часовой стрелке, 0..180
+    bearing = (90 - math.degrees(angle)) % 180
+    return {
+        "waypoints": path[:, ::-1].round(7).tolist(),
+        "passes": int((counts > 0).sum()),
+        "sweep_bearing": round(bearing, 2),
+        "width": round(width, 1),
+    }
+
+
+def path_length(waypoints: list[list[float]]) -> float:
+    """Длина маршрута в метрах (локальная проекция)"""
+    if len(waypoints) < 2:
+        return 0.0
+    points = np.asarray(waypoints)
+    projection = _Projection(points[:, 1].mean(), points[:, 0].mean())
+    xy = projection.forward(points[:, ::-1])
+    return float(np.hypot(*np.diff(xy, axis=0).T).sum())
@@ -0,0 +1,43 @@
+# backend/app/api/missions/schemas/mission_schemas.py
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, Field
+
+
+class MissionParams(BaseModel):
+    """Параметры съёмки; по умолчанию — DJI Mavic 3 на 60 м с перекрытием для ортофотоплана"""
+    altitude: float = Field(60, gt=5, le=120, description="Высота полёта над точкой взлёта, м")
+    fov_across: float = Field(72, gt=1, lt=170, description="Угол обзора камеры поперёк галса, градусы")
+    fov_along: float = Field(57, gt=1, lt=170, description="Угол обзора камеры вдоль галса, градусы")
+    side_overlap: float = Field(0.7, ge=0, le=0.95, description="Перекрытие соседних галсов")
+    front_overlap: float = Field(0.8, ge=0, le=0.95, description="Перекрытие соседних кадров")
+    speed: float = Field(8, gt=0, le=25, description="Скорость на галсе, м/с")
+    home_lat: Optional[float] = Field(None, ge=-90, le=90, description="Точка взлёта: маршрут начнётся с ближайшего угла")
+    home_lng: Optional[float] = Field(None, ge=-180, le=180)
+
+    @property
+    def home(self) -> Optional[tuple[float, float]]:
+        if self.home_lat is None or self.home_lng is None:
+            return None
+        return self.home_lat, self.home_lng
+
+
+class MissionResponse(BaseModel):
+    pasture_id: int
+    pasture_version: datetime            # updated_at пастбища, по которому построен маршрут
+    altitude: float
+    line_spacing: float                  # м между галсами
+    trigger_distance: float              # м между кадрами
+    sweep_bearing: float                 # азимут галсов, градусы 0..180
+    passes: int
+    length: float                        # м, весь маршрут
+    duration: float                      # с, без взлёта и возврата
+    photos: int
+    waypoints: List[List[float]]         # [lat, lng]
+
+
+class FarmMissions(BaseModel):
+    farm_id: int
+    missions: List[MissionResponse]
+    skipped: List[int]                   # пастбища без границы или с вырожденной границей
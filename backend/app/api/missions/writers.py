@@ -0,0 +1,27 @@
+# backend/app/api/missions/writers.py
+# Выгрузка маршрута в формате QGroundControl WPL 110 (читают QGC, Mission Planner, ArduPilot).
+# Колонки: номер, текущая, система координат, команда MAVLink, param1..4, lat, lng, alt, автопродолжение.
+FRAME_GLOBAL, FRAME_RELATIVE_ALT = 0, 3
+NAV_WAYPOINT, NAV_RETURN_TO_LAUNCH, NAV_TAKEOFF = 16, 20, 22
+DO_SET_CAM_TRIGG_DIST = 206
+
+
+def to_wpl(mission: dict, home: tuple[float, float] | None = None) -> str:
+    waypoints = mission["waypoints"]
+    home = home or tuple(waypoints[0])
+    altitude = mission["altitude"]
+    items = [
+        (FRAME_GLOBAL, NAV_WAYPOINT, (0, 0, 0, 0), home[0], home[1], 0),
+        (FRAME_RELATIVE_ALT, NAV_TAKEOFF, (0, 0, 0, 0), home[0], home[1], altitude),
+        # фотографирование по пройденному расстоянию — на весь облёт
+        (FRAME_RELATIVE_ALT, DO_SET_CAM_TRIGG_DIST, (mission["trigger_distance"], 0, 1, 0), 0, 0, 0),
+        *((FRAME_RELATIVE_ALT, NAV_WAYPOINT, (0, 0, 0, 0), lat, lng, altitude) for lat, lng in waypoints),
+        (FRAME_RELATIVE_ALT, DO_SET_CAM_TRIGG_DIST, (0, 0, 0, 0), 0, 0, 0),
+        (FRAME_RELATIVE_ALT, NAV_RETURN_TO_LAUNCH, (0, 0, 0, 0), 0, 0, 0),
+    ]
+    lines = ["QGC WPL 110"]
+    for number, (frame, command, params, lat, lng, alt) in enumerate(items):
+        current = 1 if number == 0 else 0
+        values = [number, current, frame, command, *params, f"{lat:.7f}", f"{lng:.7f}", f"{alt:.2f}", 1]
+        lines.append("\t".join(map(str, values)))
+    return "\n".join(lines) + "\n"
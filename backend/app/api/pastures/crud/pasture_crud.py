@@ -1,8 +1,19 @@
 # backend/app/api/pastures/crud/pasture_crud.py
+import datetime
+
+from pydantic import ValidationError
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from core.cache import pastures_cache
 from model.models import Pasture, Farm
-from app.api.pastures.schemas.pasture_schemas import PastureCreate, PastureUpdate
+from app.api.common.crud.bulk_crud import add_result, owned_farm_ids, validation_message
+from app.api.sync.changelog import DELETE, UPSERT, record_changes
+from app.api.pastures.schemas.pasture_schemas import (
+    PastureBulkUpdateItem,
+    PastureCreate,
+    PastureUpdate,
+)
 
 def get_pasture(db: Session, pasture_id: int, user_id: int) -> Optional[Pasture]:
     """Получить пастбище по ID (с проверкой владельца)"""
@@ -11,19 +22,37 @@ def get_pasture(db: Session, pasture_id: int, user_id: int) -> Optional[Pasture]
         Farm.owner_id == user_id
     ).first()
 
-def get_pastures(db: Session, user_id: int, skip: int = 0, limit: int = 100) -> List[Pasture]:
-    """Получить все пастбища пользователя"""
-    return db.query(Pasture).join(Farm).filter(
-        Farm.owner_id == user_id
-    ).offset(skip).limit(limit).all()
+def get_pastures(db: Session, user_id: int, skip: int = 0, limit: int = 100, columns=None, version=None) -> List[dict]:
+    """Получить все пастбища пользователя (строки из колонок columns, через кэш)"""
+    columns = columns or list(Pasture.__table__.columns)
 
-def get_pastures_by_farm(db: Session, farm_id: int, user_id: int) -> List[Pasture]:
-    """Получить все пастбища конкретной фермы"""
-    farm = db.query(Farm).filter(Farm.id == farm_id, Farm.owner_id == user_id).first()
+    def load():
+        rows = db.execute(
+            select(*columns).select_from(Pasture).join(Farm).where(
+                Farm.owner_id == user_id
+            ).offset(skip).limit(limit)
+        ).mappings()
+        return [dict(row) for row in rows]
+
+    return pastures_cache.get_or_load(user_id, (tuple(c.key for c in columns), skip, limit, version), load)
+
+def get_pastures_version(db: Session, user_id: int) -> tuple:
+    """Версия коллекции пастбищ пользователя для ETag: (количество, max(updated_at))"""
+    return tuple(db.execute(
+        select(func.count(Pasture.id), func.max(Pasture.updated_at)).select_from(Pasture).join(Farm).where(
+            Farm.owner_id == user_id
+        )
+    ).one())
+
+def get_pastures_by_farm(db: Session, farm_id: int, user_id: int, columns=None) -> List[dict]:
+    """Получить все пастбища конкретной фермы (строки из колонок columns)"""
+    farm = db.query(Farm.id).filter(Farm.id == farm_id, Farm.owner_id == user_id).first()
     if not farm:
         return []
     
-    return db.query(Pasture).filter(Pasture.farm_id == farm_id).all()
+    columns = columns or list(Pasture.__table__.columns)
+    rows = db.execute(select(*columns).where(Pasture.farm_id == farm_id)).mappings()
+    return [dict(row) for row in rows]
 
 def create_pasture(db: Session, pasture_data: PastureCreate, user_id: int) -> Pasture:
     """Создать новое пастбище"""
@@ -35,6 +64,7 @@ def create_pasture(db: Session, pasture_data: PastureCreate, user_id: int) -> Pa
     db_pasture = Pasture(**pasture_data.dict())
     db.add(db_pasture)
     db.commit()
+    pastures_cache.invalidate(user_id)
     db.refresh(db_pasture)
     return db_pasture
 
@@ -59,6 +89,7 @@ def update_pasture(db: Session, pasture_id: int, pasture_data: PastureUpdate, us
         setattr(db_pasture, field, value)
     
     db.commit()
+    pastures_cache.invalidate(user_id)
     db.refresh(db_pasture)
     return db_pasture
 
@@ -70,4 +101,102 @@ def delete_pasture(db: Session, pasture_id: int, user_id: int) -> bool:
     
     db.delete(db_pasture)
     db.commit()
-    return True
\ No newline at end of file
+    pastures_cache.invalidate(user_id)
+    return True
+
+
+# --- Пакетные операции ---------------------------------------------------------
+
+def bulk_create_pastures(db: Session, items: List[dict], user_id: int) -> List[dict]:
+    """Создать пастбища пачкой: владение проверяется один раз на каждую ферму,
+    вставка — один многострочный INSERT ... RETURNING в одной транзакции"""
+    results, valid = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, PastureCreate.model_validate(item)))
+        except ValidationError as exc:
+            add_result(results, index, "error", error=validation_message(exc))
+
+    owned = owned_farm_ids(db, {p.farm_id for _, p in valid}, user_id)
+    now = datetime.datetime.utcnow()
+    rows, row_indexes = [], []
+    for index, pasture in valid:
+        if pasture.farm_id not in owned:
+            add_result(results, index, "error", error="Ферма не найдена или не принадлежит пользователю")
+            continue
+        rows.append({**pasture.model_dump(), "created_at": now, "updated_at": now})
+        row_indexes.append(index)
+
+    if rows:
+        ids = db.scalars(
+            insert(Pasture).returning(Pasture.id, sort_by_parameter_order=True), rows
+        ).all()
+        record_changes(db, user_id, "pastures", ids, UPSERT)
+        db.commit()
+        pastures_cache.invalidate(user_id)
+        for index, pasture_id in zip(row_indexes, ids):
+            add_result(results, index, "created", id=pasture_id)
+
+    return sorted(results, key=lambda r: r["index"])
+
+def bulk_update_pastures(db: Session, items: List[dict], user_id: int) -> List[dict]:
+    """Обновить пастбища пачкой (UPDATE по первичному ключу, одна транзакция)"""
+    results, valid = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, PastureBulkUpdateItem.model_validate(item)))
+        except ValidationError as exc:
+            item_id = item.get("id") if isinstance(item.get("id"), int) else None
+            add_result(results, index, "error", id=item_id, error=validation_message(exc))
+
+    existing = set(db.scalars(
+        select(Pasture.id).join(Farm).where(
+            Pasture.id.in_({p.id for _, p in valid}),
+            Farm.owner_id == user_id
+        )
+    )) if valid else set()
+    owned = owned_farm_ids(db, {p.farm_id for _, p in valid if p.farm_id is not None}, user_id)
+
+    now = datetime.datetime.utcnow()
+    rows, row_indexes = [], []
+    for index, pasture in valid:
+        data = pasture.model_dump(exclude_unset=True)
+        if pasture.id not in existing:
+            add_result(results, index, "error", id=pasture.id, error="Пастбище не найдено")
+        elif "farm_id" in data and data["farm_id"] not in owned:
+            add_result(results, index, "error", id=pasture.id, error="Ферма не найдена или не принадлежит пользователю")
+        else:
+            rows.append({**data, "updated_at": now})
+            row_indexes.append(index)
+
+    if rows:
+        # ORM bulk UPDATE by primary key: строки группируются по набору колонок
+        db.execute(update(Pasture), rows)
+        record_changes(db, user_id, "pastures", [row["id"] for row in rows], UPSERT)
+        db.commit()
+        pastures_cache.invalidate(user_id)
+        for index, row in zip(row_indexes, rows):
+            add_result(results, index, "updated", id=row["id"])
+
+    return sorted(results, key=lambda r: r["index"])
+
+def bulk_delete_pastures(db: Session, ids: List[int], user_id: int) -> List[dict]:
+    """Удалить пастбища пачкой одним DELETE ... WHERE id IN (...)"""
+    existing = set(db.scalars(
+        select(Pasture.id).join(Farm).where(Pasture.id.in_(set(ids)), Farm.owner_id == user_id)
+    ))
+    if existing:
+        db.execute(
+            delete(Pasture).where(Pasture.id.in_(existing)).execution_options(synchronize_session=False)
+        )
+        record_changes(db, user_id, "pastures", sorted(existing), DELETE)
+        db.commit()
+        pastures_cache.invalidate(user_id)
+
+    results = []
+    for index, pasture_id in enumerate(ids):
+        if pasture_id in existing:
+            add_result(results, index, "deleted", id=pasture_id)
+        else:
+            add_result(results, index, "error", id=pasture_id, error="Пастбище не найдено")
+    return results
@@ -1,11 +1,14 @@
 # backend/app/api/pastures/pasture_api.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 from database.db import get_db
+from core.etag import etag_headers, etag_matches, make_etag, not_modified
 from core.security import get_current_user
-from model.models import User
+from core.serialization import ListSerializer
+from model.models import Pasture, User
+from app.api.common.schemas.bulk_schemas import BulkDelete, BulkItems, BulkResponse
 from app.api.pastures.schemas.pasture_schemas import (
     PastureCreate,
     PastureUpdate,
@@ -15,26 +18,37 @@ from app.api.pastures.crud import pasture_crud
 
 router = APIRouter(prefix="/pastures", tags=["Pastures"])
 
+pasture_list = ListSerializer(PastureResponse, Pasture)
+
 @router.get("/", response_model=List[PastureResponse])
-async def get_all_pastures(
+def get_all_pastures(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = Query(None, description=pasture_list.fields_description),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Получить все пастбища текущего пользователя"""
-    pastures = pasture_crud.get_pastures(db, current_user.id, skip, limit)
-    return pastures
+    columns = pasture_list.select(fields)
+    version = pasture_crud.get_pastures_version(db, current_user.id)
+    etag = make_etag("pastures", current_user.id, skip, limit, *version, *(c.key for c in columns))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    pastures = pasture_crud.get_pastures(db, current_user.id, skip, limit, columns, version=version)
+    return pasture_list.response(pastures, headers=etag_headers(etag), columns=columns)
 
 @router.get("/farm/{farm_id}", response_model=List[PastureResponse])
 async def get_farm_pastures(
     farm_id: int,
+    fields: Optional[str] = Query(None, description=pasture_list.fields_description),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """Получить все пастбища конкретной фермы"""
-    pastures = pasture_crud.get_pastures_by_farm(db, farm_id, current_user.id)
-    return pastures
+    columns = pasture_list.select(fields)
+    pastures = pasture_crud.get_pastures_by_farm(db, farm_id, current_user.id, columns)
+    return pasture_list.response(pastures, columns=columns)
 
 @router.get("/{pasture_id}", response_model=PastureResponse)
 async def get_pasture(
@@ -102,4 +116,33 @@ async def delete_pasture(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Пастбище не найдено"
         )
-    return None
\ No newline at end of file
+    return None
+
+# Пакетные операции. Обычные def: FastAPI выполняет их в пуле потоков,
+# и вставка тысяч строк не блокирует event loop.
+@router.post("/bulk", response_model=BulkResponse)
+def bulk_create_pastures(
+    payload: BulkItems,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Создать пастбища пачкой (до 10 000 за запрос), результат по каждому элементу"""
+    return BulkResponse.from_results(pasture_crud.bulk_create_pastures(db, payload.items, current_user.id))
+
+@router.patch("/bulk", response_model=BulkResponse)
+def bulk_update_pastures(
+    payload: BulkItems,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Обновить пастбища пачкой: каждый элемент — id и изменяемые поля"""
+    return BulkResponse.from_results(pasture_crud.bulk_update_pastures(db, payload.items, current_user.id))
+
+@router.post("/bulk/delete", response_model=BulkResponse)
+def bulk_delete_pastures(
+    payload: BulkDelete,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Удалить пастбища пачкой по списку id"""
+    return BulkResponse.from_results(pasture_crud.bulk_delete_pastures(db, payload.ids, current_user.id))
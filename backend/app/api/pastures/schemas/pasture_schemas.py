@@ -1,8 +1,10 @@
 # backend/app/api/pastures/schemas/pasture_schemas.py
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Any, Optional
 from datetime import datetime
 
+from core.geo import geometry_center, validate_boundary
+
 class PastureBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200)
     farm_id: int
@@ -10,9 +12,22 @@ class PastureBase(BaseModel):
     pasture_type: Optional[str] = None
     coordinates_lat: Optional[float] = None
     coordinates_lng: Optional[float] = None
+    boundary: Optional[dict[str, Any]] = None
     description: Optional[str] = None
     status: str = "active"
 
+    @field_validator("boundary")
+    @classmethod
+    def check_boundary(cls, value):
+        return validate_boundary(value) if value is not None else None
+
+    @model_validator(mode="after")
+    def center_from_boundary(self):
+        # без явной центральной точки берём центр границы
+        if self.boundary and (self.coordinates_lat is None or self.coordinates_lng is None):
+            self.coordinates_lat, self.coordinates_lng = geometry_center(self.boundary)
+        return self
+
 class PastureCreate(PastureBase):
     pass
 
@@ -23,13 +38,24 @@ class PastureUpdate(BaseModel):
     pasture_type: Optional[str] = None
     coordinates_lat: Optional[float] = None
     coordinates_lng: Optional[float] = None
+    boundary: Optional[dict[str, Any]] = None
     description: Optional[str] = None
     status: Optional[str] = None
 
+    @field_validator("boundary")
+    @classmethod
+    def check_boundary(cls, value):
+        return validate_boundary(value) if value is not None else None
+
 class PastureResponse(PastureBase):
     id: int
     created_at: datetime
     updated_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+# Элемент пакетного обновления; остальные пакетные схемы — общие (bulk_schemas)
+class PastureBulkUpdateItem(PastureUpdate):
+    id: int
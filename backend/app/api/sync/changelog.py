@@ -0,0 +1,86 @@
+# backend/app/api/sync/changelog.py
+# Запись в change_log для дельта-синхронизации.
+#
+# Изменения через ORM (db.add / setattr / db.delete, включая каскадное удаление
+# пастбищ и дронов вместе с фермой) пишутся событиями маппера в той же транзакции.
+# Массовые пути (INSERT ... RETURNING, UPDATE по первичному ключу, DELETE ... IN,
+# COPY при импорте) событий не вызывают — они вызывают record_changes явно.
+#
+# id журнала — курсор синхронизации, и клиент не должен получить курсор, за
+# которым позже появится запись с меньшим id (транзакция взяла id раньше, а
+# закоммитилась позже). Поэтому в PostgreSQL запись в журнал владельца идёт под
+# транзакционной advisory-блокировкой владельца: следующая транзакция получает
+# id только после коммита предыдущей, и у владельца id растут в порядке коммитов.
+# В SQLite записи и так последовательны.
+import datetime
+
+from sqlalchemy import event, func, insert, literal, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from model.models import ChangeLog, Drone, Farm, Pasture
+
+ENTITIES = {
+    "farms": Farm,
+    "pastures": Pasture,
+    "drones": Drone,
+}
+
+UPSERT, DELETE = "upsert", "delete"
+
+LOG_COLUMNS = ["owner_id", "entity", "entity_id", "op", "changed_at"]
+
+OWNER_LOCK = 48_002  # первый ключ двухключевой advisory-блокировки журнала владельца
+
+
+def _lock_owner(db: Session | Connection, owner_id: int):
+    """Дождаться коммита других транзакций, пишущих в журнал владельца (до конца транзакции)"""
+    bind = db.get_bind() if isinstance(db, Session) else db
+    if bind.dialect.name == "postgresql":
+        db.execute(select(func.pg_advisory_xact_lock(OWNER_LOCK, owner_id)))
+
+
+def record_changes(db: Session | Connection, owner_id: int, entity: str, ids, op: str):
+    """Записать изменения строк ids одного владельца одним INSERT"""
+    now = datetime.datetime.utcnow()
+    rows = [
+        {"owner_id": owner_id, "entity": entity, "entity_id": entity_id, "op": op, "changed_at": now}
+        for entity_id in ids
+    ]
+    if rows:
+        _lock_owner(db, owner_id)
+        db.execute(insert(ChangeLog.__table__), rows)
+
+
+def record_created_since(connection: Connection, owner_id: int, entity: str, since: datetime.datetime):
+    """Записать upsert для строк владельца, созданных начиная с since (вставка без RETURNING, COPY).
+
+    Лишние записи безвредны: клиент лишь ещё раз получит актуальную строку.
+    """
+    _lock_owner(connection, owner_id)
+    model = ENTITIES[entity]
+    query = select(
+        Farm.owner_id, literal(entity), model.id, literal(UPSERT), literal(datetime.datetime.utcnow())
+    ).where(Farm.owner_id == owner_id, model.created_at >= since)
+    if model is not Farm:
+        query = query.join_from(model, Farm, model.farm_id == Farm.id)
+    connection.execute(insert(ChangeLog.__table__).from_select(LOG_COLUMNS, query))
+
+
+def _listener(entity: str, op: str):
+    def record(mapper, connection: Connection, target):
+        if isinstance(target, Farm):
+            record_changes(connection, target.owner_id, entity, [target.id], op)
+            return
+        # владелец пастбища и дрона — владелец фермы; при каскадном удалении
+        # дочерние строки удаляются раньше фермы, так что она ещё на месте
+        owner_id = connection.scalar(select(Farm.owner_id).where(Farm.id == target.farm_id))
+        if owner_id is not None:
+            record_changes(connection, owner_id, entity, [target.id], op)
+    return record
+
+
+for _entity, _model in ENTITIES.items():
+    event.listen(_model, "after_insert", _listener(_entity, UPSERT))
+    event.listen(_model, "after_update", _listener(_entity, UPSERT))
+    event.listen(_model, "after_delete", _listener(_entity, DELETE))
@@ -0,0 +1,65 @@
+# backend/app/api/sync/crud/sync_crud.py
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from core.serialization import ListSerializer
+from model.models import ChangeLog, Farm
+from app.api.drones.schemas.drone_schemas import DroneResponse
+from app.api.farms.schemas.farm_schemas import FarmResponse
+from app.api.pastures.schemas.pasture_schemas import PastureResponse
+from app.api.sync.changelog import DELETE, ENTITIES
+
+# колонки строк в ответе синхронизации — те же, что в списках
+SERIALIZERS = {
+    "farms": ListSerializer(FarmResponse, ENTITIES["farms"]),
+    "pastures": ListSerializer(PastureResponse, ENTITIES["pastures"]),
+    "drones": ListSerializer(DroneResponse, ENTITIES["drones"]),
+}
+
+
+def get_cursor(db: Session, owner_id: int) -> int:
+    """Последний курсор владельца (0 — изменений ещё не было)"""
+    return db.scalar(select(func.coalesce(func.max(ChangeLog.id), 0)).where(ChangeLog.owner_id == owner_id))
+
+
+def _current_rows(db: Session, entity: str, ids: list[int], owner_id: int) -> list[dict]:
+    model = ENTITIES[entity]
+    query = select(*SERIALIZERS[entity].columns).where(model.id.in_(ids), Farm.owner_id == owner_id)
+    if model is not Farm:
+        query = query.join_from(model, Farm, model.farm_id == Farm.id)
+    return [dict(row) for row in db.execute(query.order_by(model.id)).mappings()]
+
+
+def get_changes(db: Session, owner_id: int, since: int, limit: int) -> dict:
+    """Изменения после курсора since: не больше limit записей журнала.
+
+    Несколько записей об одной строке схлопываются в последнюю; для upsert
+    отдаётся текущее состояние строки, для delete — только id (tombstone).
+    """
+    log = db.execute(
+        select(ChangeLog.id, ChangeLog.entity, ChangeLog.entity_id, ChangeLog.op)
+        .where(ChangeLog.owner_id == owner_id, ChangeLog.id > since)
+        .order_by(ChangeLog.id)
+        .limit(limit + 1)
+    ).all()
+    has_more = len(log) > limit
+    log = log[:limit]
+
+    latest: dict[tuple[str, int], str] = {}
+    for entry in log:
+        latest[entry.entity, entry.entity_id] = entry.op
+
+    changes = {}
+    for entity in ENTITIES:
+        upserted = [entity_id for (e, entity_id), op in latest.items() if e == entity and op != DELETE]
+        deleted = {entity_id for (e, entity_id), op in latest.items() if e == entity and op == DELETE}
+        rows = _current_rows(db, entity, upserted, owner_id) if upserted else []
+        # строка удалена позже этой страницы журнала — сразу отдаём tombstone
+        deleted.update(set(upserted) - {row["id"] for row in rows})
+        changes[entity] = {"upserted": rows, "deleted": sorted(deleted)}
+
+    return {
+        "cursor": log[-1].id if log else since,
+        "has_more": has_more,
+        **changes,
+    }
@@ -0,0 +1,29 @@
+# backend/app/api/sync/schemas/sync_schemas.py
+from typing import Any, Generic, List, TypeVar, Union
+
+from pydantic import BaseModel
+
+from app.api.drones.schemas.drone_schemas import DroneResponse
+from app.api.farms.schemas.farm_schemas import FarmResponse
+from app.api.pastures.schemas.pasture_schemas import PastureResponse
+
+Row = TypeVar("Row")
+
+
+class CompactRows(BaseModel):
+    """Компактная форма: имена колонок один раз, строки — массивами значений"""
+    columns: List[str]
+    rows: List[List[Any]]
+
+
+class EntityChanges(BaseModel, Generic[Row]):
+    upserted: Union[List[Row], CompactRows]
+    deleted: List[int]
+
+
+class SyncResponse(BaseModel):
+    cursor: int
+    has_more: bool
+    farms: EntityChanges[FarmResponse]
+    pastures: EntityChanges[PastureResponse]
+    drones: EntityChanges[DroneResponse]
@@ -0,0 +1,44 @@
+# backend/app/api/sync/sync_api.py
+# Дельта-синхронизация для полевых устройств со слабой связью: после переподключения
+# клиент передаёт последний курсор и получает только изменённые и удалённые строки.
+#
+#   GET /api/sync?since=0                  — первая синхронизация (всё из журнала)
+#   GET /api/sync?since=<cursor>           — изменения после курсора
+#   GET /api/sync?since=<cursor>&compact=1 — строки массивами, колонки один раз
+#
+# Пока has_more=true, клиент повторяет запрос с новым cursor.
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.security import get_current_user
+from database.db import get_db
+from model.models import User
+from app.api.sync.crud import sync_crud
+from app.api.sync.schemas.sync_schemas import SyncResponse
+
+router = APIRouter(tags=["Sync"])
+
+
+def _compact(changes: dict) -> dict:
+    for entity, serializer in sync_crud.SERIALIZERS.items():
+        names = [column.key for column in serializer.columns]
+        rows = changes[entity]["upserted"]
+        changes[entity]["upserted"] = {"columns": names, "rows": [[row[n] for n in names] for row in rows]}
+    return changes
+
+
+@router.get("/sync", response_model=SyncResponse)
+def sync(
+    since: int = Query(0, ge=0, description="Курсор из предыдущего ответа; 0 — полная синхронизация"),
+    compact: bool = Query(False, description="Строки массивами значений вместо объектов"),
+    limit: int = Query(None, ge=1, le=50_000, description="Записей журнала на страницу"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Изменения ферм, пастбищ и дронов пользователя после курсора since"""
+    changes = sync_crud.get_changes(db, current_user.id, since, limit or settings.SYNC_PAGE_SIZE)
+    if compact:
+        changes = _compact(changes)
+    return ORJSONResponse(changes, headers={"Cache-Control": "private, no-store"})
@@ -0,0 +1,190 @@
+# backend/app/api/telemetry/buffer.py
+# Буфер телеметрии в памяти воркера: точки копятся и пишутся пачками
+# (COPY в PostgreSQL) фоновой задачей, запущенной в lifespan.
+#
+# Обратное давление: если запись отстаёт и в буфере TELEMETRY_MAX_BUFFER точек,
+# HTTP получает 429 с Retry-After, а WebSocket ждёт места и перестаёт читать
+# сокет — отправитель упирается в TCP-окно.
+#
+# Ошибки записи: временные (обрыв соединения, недоступная БД, таймаут пула,
+# deadlock) — пачка возвращается в начало буфера и повторяется, но не больше
+# TELEMETRY_FLUSH_RETRIES раз подряд. Остальные (DataError, IntegrityError —
+# например, дрон удалён, пока точки были в буфере) вызваны самими точками:
+# пачка делится пополам, пока плохие точки не останутся по одной; отбрасываются
+# только они, остальные записываются.
+import asyncio
+import logging
+import time
+
+from sqlalchemy.exc import DBAPIError, OperationalError, TimeoutError as PoolTimeoutError
+
+from core.config import settings
+from core.metrics import REGISTRY
+from app.api.telemetry.crud.telemetry_crud import write_points
+
+logger = logging.getLogger(__name__)
+
+telemetry_points_total = REGISTRY.counter(
+    "telemetry_points_total", "Точки телеметрии по исходу", ("result",))
+telemetry_buffer_points = REGISTRY.gauge(
+    "telemetry_buffer_points", "Точек телеметрии в буфере, ожидающих записи")
+telemetry_flush_seconds = REGISTRY.histogram(
+    "telemetry_flush_seconds", "Длительность записи пачки телеметрии")
+
+RETRY_DELAY = 1.0
+
+
+def is_transient(exc: Exception) -> bool:
+    """Ошибка не из-за данных: повтор той же пачки может пройти"""
+    if isinstance(exc, (OperationalError, PoolTimeoutError)):
+        return True
+    return isinstance(exc, DBAPIError) and exc.connection_invalidated
+
+
+class _Interrupted(Exception):
+    """Временная ошибка посреди поиска плохих точек: pending ещё не записаны"""
+
+    def __init__(self, cause: Exception, pending: list[dict], written: int, rejected: int):
+        super().__init__(str(cause))
+        self.cause, self.pending, self.written, self.rejected = cause, pending, written, rejected
+
+
+class TelemetryBuffer:
+    def __init__(self, batch_size: int, max_points: int, flush_interval: float, max_retries: int,
+                 writer=write_points):
+        self.batch_size = batch_size
+        self.max_points = max_points
+        self.flush_interval = flush_interval
+        self.writer = writer
+        self.max_retries = max_retries
+        self.rows: list[dict] = []
+        self._failures = 0  # временных ошибок подряд на пачке в начале буфера
+        self._task: asyncio.Task | None = None
+        self._wake: asyncio.Event | None = None
+        self._space: asyncio.Event | None = None
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def offer(self, rows: list[dict]) -> bool:
+        """Принять точки, если есть место; вызывается из event loop"""
+        # пачку больше лимита принимаем в пустой буфер — иначе она не пройдёт никогда
+        if self.rows and len(self.rows) + len(rows) > self.max_points:
+            telemetry_points_total.inc(("rejected",), len(rows))
+            return False
+        self.rows.extend(rows)
+        telemetry_points_total.inc(("accepted",), len(rows))
+        telemetry_buffer_points.set(len(self.rows))
+        if self._wake is not None and len(self.rows) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    async def put(self, rows: list[dict]):
+        """Принять точки, дождавшись места в буфере"""
+        while not self.offer(rows):
+            self._space.clear()
+            await self._space.wait()
+
+    def start(self):
+        self._wake, self._space = asyncio.Event(), asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Остановить фоновую запись и дописать остаток буфера"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        while self.rows:
+            if not await self._flush():
+                break
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            while self.rows:
+                if not await self._flush():
+                    await asyncio.sleep(RETRY_DELAY)
+                    break
+                if len(self.rows) < self.batch_size:
+                    break
+
+    def _write_isolating(self, batch: list[dict]) -> tuple[int, int]:
+        """Записать пачку с постоянной ошибкой по частям: делить пополам до
+        отдельных плохих точек и отбросить только их. Возвращает (записано, отброшено)"""
+        written = rejected = 0
+        parts = [batch]
+        while parts:
+            part = parts.pop()
+            try:
+                self.writer(part)
+            except Exception as exc:
+                if is_transient(exc):
+                    pending = [row for chunk in [part, *reversed(parts)] for row in chunk]
+                    raise _Interrupted(exc, pending, written, rejected) from exc
+                if len(part) > 1:
+                    middle = len(part) // 2
+                    parts += [part[middle:], part[:middle]]
+                    continue
+                logger.warning("Точка телеметрии отброшена: %s (%s)", part[0], exc)
+                rejected += 1
+            else:
+                written += len(part)
+        return written, rejected
+
+    def _requeue(self, rows: list[dict], exc: Exception) -> bool:
+        """Вернуть точки в начало буфера для повтора; после max_retries подряд — отбросить"""
+        self._failures += 1
+        if self._failures > self.max_retries:
+            logger.error("Телеметрия не записана после %s попыток, отброшено %s точек: %s",
+                         self.max_retries, len(rows), exc)
+            telemetry_points_total.inc(("dropped",), len(rows))
+            self._failures = 0
+            return True
+        logger.warning("Не удалось записать телеметрию (%s), повтор %s/%s через %s с",
+                       exc, self._failures, self.max_retries, RETRY_DELAY)
+        self.rows[:0] = rows
+        return False
+
+    async def _flush(self) -> bool:
+        batch = self.rows[:self.batch_size]
+        del self.rows[:len(batch)]
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(self.writer, batch)
+        except Exception as exc:
+            if is_transient(exc):
+                return self._requeue(batch, exc)
+            # ошибка в данных: ищем плохие точки, остальные записываем
+            logger.warning("Пачка телеметрии из %s точек не записана (%s), поиск плохих точек", len(batch), exc)
+            try:
+                written, rejected = await asyncio.to_thread(self._write_isolating, batch)
+            except _Interrupted as interrupted:
+                telemetry_points_total.inc(("written",), interrupted.written)
+                telemetry_points_total.inc(("dropped",), interrupted.rejected)
+                return self._requeue(interrupted.pending, interrupted.cause)
+            telemetry_points_total.inc(("written",), written)
+            telemetry_points_total.inc(("dropped",), rejected)
+        else:
+            telemetry_points_total.inc(("written",), len(batch))
+            telemetry_flush_seconds.observe(time.perf_counter() - started)
+        finally:
+            telemetry_buffer_points.set(len(self.rows))
+            self._space.set()
+        self._failures = 0
+        return True
+
+telemetry_buffer = TelemetryBuffer(
+    batch_size=settings.TELEMETRY_BATCH_SIZE,
+    max_points=settings.TELEMETRY_MAX_BUFFER,
+    flush_interval=settings.TELEMETRY_FLUSH_INTERVAL,
+    max_retries=settings.TELEMETRY_FLUSH_RETRIES,
+)
@@ -0,0 +1,104 @@
+# backend/app/api/telemetry/crud/telemetry_crud.py
+import datetime
+import logging
+
+from sqlalchemy import select, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from database.bulk import bulk_insert
+from database.db import SessionLocal, engine
+from model.models import Drone, DroneTelemetry, Farm, GeofenceEvent, Pasture
+
+logger = logging.getLogger(__name__)
+
+POINT_COLUMNS = ["drone_id", "recorded_at", "lat", "lng", "altitude", "battery", "speed", "heading"]
+
+
+def owned_drones(db: Session, user_id: int) -> dict[int, int]:
+    """{id дрона: id фермы} пользователя — проверка владения один раз на пачку точек"""
+    return dict(db.execute(select(Drone.id, Drone.farm_id).join(Farm).where(Farm.owner_id == user_id)).all())
+
+
+def write_points(rows: list[dict]) -> int:
+    """Записать пачку точек одной транзакцией (COPY в PostgreSQL)"""
+    with engine.begin() as conn:
+        return bulk_insert(conn, DroneTelemetry.__table__, rows, columns=POINT_COLUMNS)
+
+
+def get_track(db: Session, drone_id: int, since: datetime.datetime | None, limit: int) -> list[dict]:
+    """Последние точки дрона (по индексу drone_id, recorded_at), в хронологическом порядке"""
+    query = select(*(DroneTelemetry.__table__.c[c] for c in POINT_COLUMNS)).where(DroneTelemetry.drone_id == drone_id)
+    if since is not None:
+        query = query.where(DroneTelemetry.recorded_at >= since)
+    rows = db.execute(query.order_by(DroneTelemetry.recorded_at.desc()).limit(limit)).mappings()
+    return [dict(row) for row in rows][::-1]
+
+
+def get_track_between(db: Session, drone_id: int, start: datetime.datetime,
+                      end: datetime.datetime) -> list[tuple[datetime.datetime, float, float]]:
+    """(recorded_at, lat, lng) дрона за интервал — для привязки кадров видео к координатам"""
+    return [tuple(row) for row in db.execute(
+        select(DroneTelemetry.recorded_at, DroneTelemetry.lat, DroneTelemetry.lng)
+        .where(DroneTelemetry.drone_id == drone_id, DroneTelemetry.recorded_at.between(start, end))
+        .order_by(DroneTelemetry.recorded_at)
+    )]
+
+
+def load_boundaries() -> list[tuple[int, int, dict]]:
+    """(id, farm_id, boundary) всех пастбищ с границей — для индекса геозон"""
+    with SessionLocal() as db:
+        return [tuple(row) for row in db.execute(
+            select(Pasture.id, Pasture.farm_id, Pasture.boundary).where(Pasture.boundary.isnot(None))
+        )]
+
+
+def write_events(events: list[dict]):
+    with engine.begin() as conn:
+        conn.execute(GeofenceEvent.__table__.insert(), events)
+
+
+def get_geofence_events(db: Session, user_id: int, drone_id: int | None,
+                        since: datetime.datetime | None, limit: int) -> list[GeofenceEvent]:
+    query = (
+        select(GeofenceEvent)
+        .join(Drone, Drone.id == GeofenceEvent.drone_id)
+        .join(Farm, Farm.id == Drone.farm_id)
+        .where(Farm.owner_id == user_id)
+    )
+    if drone_id is not None:
+        query = query.where(GeofenceEvent.drone_id == drone_id)
+    if since is not None:
+        query = query.where(GeofenceEvent.recorded_at >= since)
+    return list(db.scalars(query.order_by(GeofenceEvent.recorded_at.desc(), GeofenceEvent.id.desc()).limit(limit)))
+
+
+def _month_start(day: datetime.date, offset: int = 0) -> datetime.date:
+    year, month = divmod(day.month - 1 + offset, 12)
+    return datetime.date(day.year + year, month + 1, 1)
+
+
+def ensure_partitions(connection: Connection, months_ahead: int | None = None):
+    """Создать месячные секции drone_telemetry наперёд (только PostgreSQL).
+
+    Секция, которую создать не удалось (например, в DEFAULT уже есть строки её
+    месяца), пропускается с предупреждением — старт воркера из-за неё не падает.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+    months_ahead = settings.TELEMETRY_PARTITIONS_AHEAD if months_ahead is None else months_ahead
+    # воркеры стартуют одновременно: без блокировки параллельные CREATE конфликтуют
+    connection.execute(text("SELECT pg_advisory_xact_lock(hashtext('drone_telemetry_partitions'))"))
+    today = datetime.date.today()
+    for offset in range(months_ahead + 1):
+        start, end = _month_start(today, offset), _month_start(today, offset + 1)
+        try:
+            with connection.begin_nested():
+                connection.execute(text(
+                    f"CREATE TABLE IF NOT EXISTS drone_telemetry_{start:%Y_%m} PARTITION OF drone_telemetry "
+                    f"FOR VALUES FROM ('{start}') TO ('{end}')"
+                ))
+        except DBAPIError as exc:
+            logger.warning("Секция drone_telemetry_%s не создана: %s", f"{start:%Y_%m}", exc.orig)
@@ -0,0 +1,148 @@
+# backend/app/api/telemetry/geofence.py
+# Геозоны: каждая пачка телеметрии проверяется по границам пастбищ одним
+# векторным проходом (core.geo.PolygonIndex), а смена пастбища под дроном
+# превращается в события exit/enter. own=false — пастбище чужой фермы.
+#
+# Индекс строится по всем пастбищам с границей (соседние фермы тоже нужны),
+# перестраивается в пуле потоков после изменения пастбищ в этом воркере
+# и не реже GEOFENCE_REFRESH_SECONDS — чтобы увидеть изменения из других.
+# Новый индекс, id пастбищ и их фермы собираются в неизменяемый снимок Zones,
+# который подменяется одной ссылкой: пачка, обрабатываемая во время перестройки,
+# целиком проверяется по одной версии геозон.
+#
+# Первая точка дрона после старта воркера лишь запоминает его пастбище:
+# событие возникает только при наблюдаемом переходе.
+import asyncio
+import datetime
+import time
+
+import numpy as np
+
+from core.cache import pastures_cache
+from core.config import settings
+from core.geo import PolygonIndex
+from core.metrics import REGISTRY
+from app.api.telemetry.crud.telemetry_crud import load_boundaries
+
+geofence_events_total = REGISTRY.counter(
+    "geofence_events_total", "События геозон", ("event", "own"))
+geofence_points_total = REGISTRY.counter(
+    "geofence_points_total", "Точки телеметрии, проверенные по границам пастбищ")
+
+OUTSIDE = 0  # «ни в одном пастбище»
+
+
+def _epoch(value: datetime.datetime) -> float:
+    return value.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+
+class Zones:
+    """Снимок геозон: индекс, id пастбища по позиции в индексе, ферма пастбища. Не изменяется"""
+    __slots__ = ("index", "pasture_ids", "pasture_farms")
+
+    def __init__(self, rows: list[tuple[int, int, dict]]):
+        self.index = PolygonIndex([row[0] for row in rows], [row[2] for row in rows])
+        self.pasture_ids = np.asarray(self.index.keys, dtype=np.int64)
+        self.pasture_ids.flags.writeable = False
+        self.pasture_farms = {pasture_id: farm_id for pasture_id, farm_id, _ in rows}
+
+    def locate(self, lng: np.ndarray, lat: np.ndarray) -> np.ndarray:
+        """id пастбища под каждой точкой, 0 — вне пастбищ"""
+        if not len(self.index):
+            return np.zeros(len(lng), dtype=np.int64)
+        position = self.index.locate(lng, lat)
+        return np.where(position >= 0, self.pasture_ids[np.maximum(position, 0)], OUTSIDE)
+
+
+EMPTY = Zones([])
+
+
+class GeofenceEngine:
+    def __init__(self, loader=load_boundaries, refresh_seconds: float = settings.GEOFENCE_REFRESH_SECONDS):
+        self.loader = loader
+        self.refresh_seconds = refresh_seconds
+        self.zones = EMPTY
+        self.stale = True
+        self.built_at = 0.0
+        self._building: asyncio.Future | None = None
+        # drone_id -> (pasture_id под дроном, время последней учтённой точки)
+        self.current: dict[int, tuple[int, float]] = {}
+
+    def invalidate(self, owner_id: int | None = None):
+        self.stale = True
+
+    def build(self):
+        """Перестроить геозоны из БД (в пуле потоков — это запрос и numpy)"""
+        # сбрасываем до чтения: изменение во время загрузки снова пометит индекс
+        self.stale = False
+        self.zones = Zones(self.loader())
+        self.built_at = time.monotonic()
+
+    async def refresh(self):
+        if not self.stale and time.monotonic() - self.built_at < self.refresh_seconds:
+            return
+        if self._building is None:
+            self._building = asyncio.ensure_future(asyncio.to_thread(self.build))
+        building = self._building
+        try:
+            await building
+        finally:
+            if self._building is building:
+                self._building = None
+
+    def process(self, points: list[dict], drone_farms: dict[int, int]) -> list[dict]:
+        """События входа/выхода по пачке точек (владение дронами уже проверено)"""
+        n = len(points)
+        if not n:
+            return []
+        geofence_points_total.inc(amount=n)
+        drone = np.fromiter((p["drone_id"] for p in points), dtype=np.int64, count=n)
+        at = np.fromiter((_epoch(p["recorded_at"]) for p in points), dtype=np.float64, count=n)
+        lng = np.fromiter((p["lng"] for p in points), dtype=np.float64, count=n)
+        lat = np.fromiter((p["lat"] for p in points), dtype=np.float64, count=n)
+
+        # точки старше уже учтённых (догнавшая пачка) не меняют состояние
+        drones, inverse = np.unique(drone, return_inverse=True)
+        known_at = np.array([self.current.get(d, (OUTSIDE, -np.inf))[1] for d in drones.tolist()])
+        fresh = at >= known_at[inverse]
+        if not fresh.all():
+            drone, at, lng, lat = drone[fresh], at[fresh], lng[fresh], lat[fresh]
+            points = [p for p, keep in zip(points, fresh) if keep]
+        if not len(drone):
+            return []
+
+        zones = self.zones  # одна версия геозон на всю пачку
+        pasture = zones.locate(lng, lat)
+        order = np.lexsort((at, drone))
+        drone, at, pasture = drone[order], at[order], pasture[order]
+        first = np.ones(len(drone), dtype=bool)
+        first[1:] = drone[1:] != drone[:-1]
+        previous = np.empty_like(pasture)
+        previous[1:] = pasture[:-1]
+        for i in np.flatnonzero(first).tolist():
+            # без состояния — первая точка дрона, события нет
+            previous[i] = self.current.get(int(drone[i]), (int(pasture[i]), 0.0))[0]
+        last = np.ones(len(drone), dtype=bool)
+        last[:-1] = drone[1:] != drone[:-1]
+        for i in np.flatnonzero(last).tolist():
+            self.current[int(drone[i])] = (int(pasture[i]), float(at[i]))
+
+        events = []
+        for i in np.flatnonzero(previous != pasture).tolist():
+            drone_id = int(drone[i])
+            recorded_at = points[int(order[i])]["recorded_at"]
+            for kind, pasture_id in (("exit", int(previous[i])), ("enter", int(pasture[i]))):
+                if pasture_id == OUTSIDE:
+                    continue
+                farm_id = zones.pasture_farms.get(pasture_id)
+                own = farm_id == drone_farms.get(drone_id)
+                geofence_events_total.inc((kind, "true" if own else "false"))
+                events.append({
+                    "drone_id": drone_id, "pasture_id": pasture_id, "pasture_farm_id": farm_id,
+                    "event": kind, "own": own, "recorded_at": recorded_at,
+                })
+        return events
+
+
+geofence = GeofenceEngine()
+pastures_cache.listeners.append(geofence.invalidate)
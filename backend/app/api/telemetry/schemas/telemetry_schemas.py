@@ -0,0 +1,59 @@
+# backend/app/api/telemetry/schemas/telemetry_schemas.py
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from core.config import settings
+
+BATCH_MAX_POINTS = 10_000
+
+
+class TelemetryPoint(BaseModel):
+    drone_id: int
+    recorded_at: datetime
+    lat: float = Field(..., ge=-90, le=90)
+    lng: float = Field(..., ge=-180, le=180)
+    altitude: Optional[float] = None
+    battery: Optional[float] = Field(None, ge=0, le=100)
+    speed: Optional[float] = Field(None, ge=0)
+    heading: Optional[float] = Field(None, ge=0, lt=360)
+
+    @field_validator("recorded_at")
+    @classmethod
+    def to_naive_utc(cls, value: datetime) -> datetime:
+        # в БД время хранится без зоны, в UTC
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+class TelemetryBatch(BaseModel):
+    points: List[TelemetryPoint] = Field(..., min_length=1, max_length=BATCH_MAX_POINTS)
+
+    @field_validator("points")
+    @classmethod
+    def not_in_future(cls, points: List[TelemetryPoint]) -> List[TelemetryPoint]:
+        # сбитые часы дрона: точка за пределами созданных секций легла бы в
+        # DEFAULT-секцию, и CREATE её месяца при старте воркера упал бы
+        limit = datetime.utcnow() + timedelta(seconds=settings.TELEMETRY_MAX_CLOCK_SKEW)
+        late = [i for i, point in enumerate(points) if point.recorded_at > limit]
+        if late:
+            raise ValueError(f"Время точек {late[:10]} в будущем: проверьте часы дрона")
+        return points
+
+
+class TelemetryAccepted(BaseModel):
+    accepted: int
+
+
+class GeofenceEventResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    drone_id: int
+    pasture_id: Optional[int] = None     # пастбище удалено — остаётся ферма
+    pasture_farm_id: Optional[int] = None
+    event: str                           # enter / exit
+    own: bool                            # пастбище фермы, к которой приписан дрон
+    recorded_at: datetime
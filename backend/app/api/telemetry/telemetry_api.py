@@ -0,0 +1,137 @@
+# backend/app/api/telemetry/telemetry_api.py
+# Приём полётной телеметрии дронов:
+#   POST /api/telemetry          — пачка точек (до 10 000), 202 или 429 при переполнении буфера
+#   WS   /api/telemetry/ws?token — поток пачек; на каждую — {"accepted": N}
+#   GET  /api/telemetry/events   — события геозон (вход/выход дронов на пастбища)
+#   GET  /api/telemetry/{drone_id} — последние точки трека
+import datetime
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.security import get_current_user, user_id_from_token
+from database.db import SessionLocal, get_db
+from model.models import User
+from app.api.drones.crud.drone_crud import get_drone
+from app.api.fleet.fleet_state import fleet_state
+from app.api.telemetry.buffer import telemetry_buffer
+from app.api.telemetry.crud import telemetry_crud
+from app.api.telemetry.geofence import geofence
+from app.api.telemetry.schemas.telemetry_schemas import (
+    GeofenceEventResponse,
+    TelemetryAccepted,
+    TelemetryBatch,
+    TelemetryPoint,
+)
+
+router = APIRouter(prefix="/telemetry", tags=["Telemetry"])
+
+
+def _foreign_drones(points: List[TelemetryPoint], owned: dict[int, int]) -> set[int]:
+    return {p.drone_id for p in points} - owned.keys()
+
+
+def _load_owned(user_id: int) -> dict[int, int]:
+    with SessionLocal() as db:
+        return telemetry_crud.owned_drones(db, user_id)
+
+
+async def _check_geofences(user_id: int, points: list[dict], owned: dict[int, int]):
+    """Переходы между пастбищами: запись в geofence_events и рассылка подписчикам парка"""
+    if not settings.GEOFENCE_ENABLED:
+        return
+    await geofence.refresh()
+    events = geofence.process(points, owned)
+    if events:
+        await run_in_threadpool(telemetry_crud.write_events, events)
+        fleet_state.publish_events(user_id, events)
+
+
+@router.post("", response_model=TelemetryAccepted, status_code=status.HTTP_202_ACCEPTED)
+async def ingest_telemetry(
+    batch: TelemetryBatch,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Принять пачку точек телеметрии дронов пользователя"""
+    # та же сессия, что у get_current_user: одно соединение из пула на запрос
+    owned = await run_in_threadpool(telemetry_crud.owned_drones, db, current_user.id)
+    foreign = _foreign_drones(batch.points, owned)
+    if foreign:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Дроны не найдены или доступ запрещен: {', '.join(map(str, sorted(foreign)))}"
+        )
+    points = [p.model_dump() for p in batch.points]
+    if not telemetry_buffer.offer(points):
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Запись телеметрии не успевает, повторите позже",
+            headers={"Retry-After": str(max(1, round(settings.TELEMETRY_FLUSH_INTERVAL * 2)))},
+        )
+    fleet_state.apply_points(current_user.id, points)
+    await _check_geofences(current_user.id, points, owned)
+    return {"accepted": len(batch.points)}
+
+
+@router.websocket("/ws")
+async def telemetry_stream(websocket: WebSocket, token: str = Query(...)):
+    """Поток пачек {"points": [...]}; при отстающей записи сервер ждёт, не читая сокет"""
+    user_id = user_id_from_token(token)
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    owned = await run_in_threadpool(_load_owned, user_id)
+    try:
+        while True:
+            message = await websocket.receive_text()
+            try:
+                batch = TelemetryBatch.model_validate_json(message)
+            except ValidationError as exc:
+                await websocket.send_json({"error": exc.errors(include_url=False, include_context=False)})
+                continue
+            if _foreign_drones(batch.points, owned):
+                # дрон мог быть добавлен после подключения
+                owned = await run_in_threadpool(_load_owned, user_id)
+                foreign = _foreign_drones(batch.points, owned)
+                if foreign:
+                    await websocket.send_json({"error": f"Дроны не найдены или доступ запрещен: {sorted(foreign)}"})
+                    continue
+            points = [p.model_dump() for p in batch.points]
+            await telemetry_buffer.put(points)
+            fleet_state.apply_points(user_id, points)
+            await _check_geofences(user_id, points, owned)
+            await websocket.send_json({"accepted": len(batch.points)})
+    except WebSocketDisconnect:
+        pass
+
+
+@router.get("/events", response_model=List[GeofenceEventResponse])
+def read_geofence_events(
+    drone_id: Optional[int] = None,
+    since: Optional[datetime.datetime] = None,
+    limit: int = Query(100, ge=1, le=10_000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Последние входы и выходы дронов пользователя на пастбища (свои и соседние)"""
+    return telemetry_crud.get_geofence_events(db, current_user.id, drone_id, since, limit)
+
+
+@router.get("/{drone_id}", response_model=List[TelemetryPoint])
+def read_track(
+    drone_id: int,
+    since: Optional[datetime.datetime] = None,
+    limit: int = Query(1000, ge=1, le=50_000),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Последние точки трека дрона (уже записанные из буфера)"""
+    if not get_drone(db, drone_id, current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Дрон не найден")
+    return telemetry_crud.get_track(db, drone_id, since, limit)
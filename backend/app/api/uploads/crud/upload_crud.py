@@ -0,0 +1,186 @@
+# backend/app/api/uploads/crud/upload_crud.py
+import datetime
+from collections import defaultdict
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.geo import PolygonIndex
+from model.models import Farm, Measurement, MeasurementFrame, Pasture, UploadSession
+from app.api.uploads import storage
+from app.jobs.queue import enqueue
+from app.api.uploads.schemas.upload_schemas import UploadCreate
+
+
+PHOTOS_PER_JOB = 50  # измерений в одном задании превью/биомассы пакетной загрузки
+
+
+def _expires_at() -> datetime.datetime:
+    return datetime.datetime.utcnow() + datetime.timedelta(hours=settings.UPLOAD_SESSION_TTL_HOURS)
+
+
+def measurement_method(content_type: str | None) -> str:
+    return "photo_upload" if content_type and content_type.startswith("image/") else "drone_video"
+
+
+def expire_sessions(db: Session) -> int:
+    """Брошенные загрузки: файлы частей удаляются, сессии помечаются expired"""
+    expired = list(db.scalars(select(UploadSession.id).where(
+        UploadSession.status.in_(("uploading", "completing")),
+        UploadSession.expires_at < datetime.datetime.utcnow(),
+    )))
+    for upload_id in expired:
+        storage.remove_part(upload_id)
+    if expired:
+        db.execute(update(UploadSession).where(UploadSession.id.in_(expired)).values(status="expired"))
+        db.commit()
+    return len(expired)
+
+
+def create_upload(db: Session, data: UploadCreate, owner_id: int) -> UploadSession:
+    expire_sessions(db)
+    upload = UploadSession(**data.model_dump(), owner_id=owner_id, received=0, status="uploading",
+                           expires_at=_expires_at())
+    db.add(upload)
+    db.flush()
+    storage.create_part(upload.id)
+    db.commit()
+    db.refresh(upload)
+    return upload
+
+
+def get_upload(db: Session, upload_id: int, owner_id: int) -> UploadSession | None:
+    return db.query(UploadSession).filter(UploadSession.id == upload_id, UploadSession.owner_id == owner_id).first()
+
+
+def advance(db: Session, upload: UploadSession, offset: int, new_offset: int) -> bool:
+    """Подтвердить смещение, только если его не сдвинул другой воркер"""
+    result = db.execute(
+        update(UploadSession)
+        .where(UploadSession.id == upload.id, UploadSession.received == offset, UploadSession.status == "uploading")
+        .values(received=new_offset, expires_at=_expires_at(), updated_at=datetime.datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(upload)
+    return result.rowcount == 1
+
+
+def claim_completion(db: Session, upload: UploadSession) -> bool:
+    """Перевести полностью принятую загрузку в completing. Условный UPDATE:
+    из одновременных /complete дальше проходит только один"""
+    result = db.execute(
+        update(UploadSession)
+        .where(UploadSession.id == upload.id, UploadSession.status == "uploading",
+               UploadSession.received == UploadSession.size)
+        .values(status="completing", updated_at=datetime.datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    db.refresh(upload)
+    return result.rowcount == 1
+
+
+def release_completion(db: Session, upload: UploadSession) -> bool:
+    """Завершение сорвалось — вернуть загрузку в uploading, чтобы /complete можно было повторить.
+    False — загрузка уже не в completing (завершена или помечена failed)"""
+    db.rollback()
+    result = db.execute(
+        update(UploadSession)
+        .where(UploadSession.id == upload.id, UploadSession.status == "completing")
+        .values(status="uploading", updated_at=datetime.datetime.utcnow())
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return result.rowcount == 1
+
+
+def fail_upload(db: Session, upload: UploadSession, message: str):
+    storage.remove_part(upload.id)
+    upload.status = "failed"
+    upload.message = message
+    db.commit()
+
+
+def complete_upload(db: Session, upload: UploadSession, path: str) -> UploadSession:
+    """Файл собран: измерение в статусе processing и задания его обработки"""
+    method = measurement_method(upload.content_type)
+    measurement = Measurement(
+        pasture_id=upload.pasture_id,
+        drone_id=upload.drone_id,
+        method=method,
+        status="processing",
+        media_url=storage.media_url(path),
+        description=upload.filename,
+    )
+    db.add(measurement)
+    db.flush()
+    upload.measurement_id = measurement.id
+    upload.status = "completed"
+    # измерение и задания — одной транзакцией: без заданий измерение навсегда осталось бы в processing
+    farm_id = db.scalar(select(Pasture.farm_id).where(Pasture.id == upload.pasture_id))
+    if method == "drone_video":
+        # биомассу по кадрам задание video_frames поставит само
+        enqueue(db, "video_frames", {"measurement_id": measurement.id}, upload.owner_id, farm_id=farm_id, commit=False)
+    else:
+        enqueue(db, "thumbnail", {"measurement_ids": [measurement.id]}, upload.owner_id, farm_id=farm_id, commit=False)
+        enqueue(db, "biomass", {"measurement_ids": [measurement.id]}, upload.owner_id, farm_id=farm_id, commit=False)
+    db.commit()
+    db.refresh(upload)
+    return upload
+
+
+def delete_upload(db: Session, upload: UploadSession):
+    storage.remove_part(upload.id)
+    db.delete(upload)
+    db.commit()
+
+
+def get_frames(db: Session, measurement_id: int) -> list[MeasurementFrame]:
+    return list(db.scalars(
+        select(MeasurementFrame).where(MeasurementFrame.measurement_id == measurement_id).order_by(MeasurementFrame.offset)
+    ))
+
+
+def pasture_index(db: Session, owner_id: int) -> PolygonIndex:
+    """Индекс границ пастбищ пользователя: ключ — id пастбища"""
+    rows = db.execute(
+        select(Pasture.id, Pasture.boundary).join(Farm, Farm.id == Pasture.farm_id)
+        .where(Farm.owner_id == owner_id, Pasture.boundary.isnot(None))
+    ).all()
+    return PolygonIndex([r.id for r in rows], [r.boundary for r in rows])
+
+
+def create_photo_measurements(db: Session, owner_id: int, photos: list[dict], drone_id: int | None) -> list[int]:
+    """Измерения пакетной загрузки фото и задания их обработки одной транзакцией; возвращает id заданий"""
+    now = datetime.datetime.utcnow()
+    measurements = [Measurement(
+        pasture_id=photo["pasture_id"],
+        drone_id=drone_id,
+        method="photo_upload",
+        status="processing",
+        media_url=storage.media_url(photo["path"]),
+        description=photo["filename"],
+        measured_at=photo["taken_at"] or now,
+    ) for photo in photos]
+    db.add_all(measurements)
+    db.flush()
+    for photo, measurement in zip(photos, measurements):
+        photo["measurement_id"] = measurement.id
+
+    farms = dict(db.execute(select(Pasture.id, Pasture.farm_id).where(
+        Pasture.id.in_({photo["pasture_id"] for photo in photos}))).all()) if photos else {}
+    by_farm = defaultdict(list)
+    for measurement in measurements:
+        by_farm[farms[measurement.pasture_id]].append(measurement.id)
+    jobs = []
+    for farm_id, ids in by_farm.items():
+        for start in range(0, len(ids), PHOTOS_PER_JOB):
+            chunk = {"measurement_ids": ids[start:start + PHOTOS_PER_JOB]}
+            jobs.append(enqueue(db, "thumbnail", chunk, owner_id, farm_id=farm_id, commit=False))
+            jobs.append(enqueue(db, "biomass", chunk, owner_id, farm_id=farm_id, commit=False))
+    db.flush()
+    job_ids = [job.id for job in jobs]
+    db.commit()
+    return job_ids
@@ -0,0 +1,66 @@
+# backend/app/api/uploads/schemas/upload_schemas.py
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from core.config import settings
+
+
+class UploadCreate(BaseModel):
+    pasture_id: int
+    drone_id: Optional[int] = None
+    filename: str = Field(..., min_length=1, max_length=255)
+    size: int = Field(..., gt=0)
+    content_type: Optional[str] = Field(None, max_length=100)
+    sha256: Optional[str] = Field(None, pattern=r"^[0-9a-f]{64}$", description="Сумма всего файла, проверяется при завершении")
+
+
+class UploadResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    pasture_id: int
+    drone_id: Optional[int] = None
+    filename: str
+    content_type: Optional[str] = None
+    size: int
+    received: int                        # смещение, с которого продолжать (Upload-Offset)
+    chunk_size: int = settings.UPLOAD_CHUNK_SIZE
+    status: str
+    message: Optional[str] = None
+    measurement_id: Optional[int] = None
+    created_at: datetime
+    expires_at: datetime
+
+
+class FrameResponse(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    offset: float                        # секунды от начала видео
+    captured_at: Optional[datetime] = None
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    image_url: str
+    phash: Optional[str] = None
+    scene_score: Optional[float] = None
+
+
+class PhotoResult(BaseModel):
+    filename: str
+    status: Literal["assigned", "unassigned"]
+    assigned_by: Optional[Literal["gps", "fallback"]] = None
+    reason: Optional[Literal["not_image", "no_gps", "outside_pastures"]] = None
+    pasture_id: Optional[int] = None
+    measurement_id: Optional[int] = None
+    lat: Optional[float] = None
+    lng: Optional[float] = None
+    taken_at: Optional[datetime] = None  # UTC
+
+
+class PhotoBatchResponse(BaseModel):
+    assigned: int
+    unassigned: int
+    photos: List[PhotoResult]            # в порядке файлов запроса
+    job_ids: List[int]                   # превью и оценка биомассы, GET /api/jobs/{id}
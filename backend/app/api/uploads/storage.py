@@ -0,0 +1,166 @@
+# backend/app/api/uploads/storage.py
+# Файлы возобновляемых загрузок: часть пишется на своё смещение (pwrite) прямо
+# из потока тела запроса, без накопления в памяти, и сбрасывается на диск (fsync)
+# до того, как смещение подтверждается в БД. Запись и хэширование идут в пуле
+# потоков блоками по WRITE_BUFFER — event loop не ждёт диск.
+#
+# Одновременные PATCH одной загрузки (повтор по таймауту, пока первый ещё идёт)
+# исключаются блокировкой flock на файле — она общая для всех воркеров хоста.
+#
+# Медиа съёмки раздаётся StaticFiles /uploads без авторизации, поэтому в имя
+# каждого файла (и каталога кадров) входит секретная часть — HMAC от его
+# идентификаторов: URL знает только тот, кому его выдал API, а перебрать
+# соседние id по предсказуемым путям нельзя.
+import fcntl
+import hashlib
+import hmac
+import os
+import re
+import shutil
+from contextlib import contextmanager
+from typing import AsyncIterator, BinaryIO
+
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+
+from core.config import settings
+
+HASH_CHUNK = 4 * 1024 * 1024
+WRITE_BUFFER = 1024 * 1024  # байт тела запроса на один pwrite
+
+
+class ChunkTooLarge(ValueError):
+    """Часть выходит за объявленный размер файла"""
+
+
+class UploadLocked(RuntimeError):
+    """Файл загрузки занят другим запросом"""
+
+
+def part_path(upload_id: int) -> str:
+    return os.path.join(settings.UPLOAD_PARTIAL_DIR, f"{upload_id}.part")
+
+
+def _safe_name(filename: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", os.path.basename(filename)).strip("._") or "upload"
+
+
+def secret_suffix(*parts) -> str:
+    """Неугадываемая, но стабильная часть имени медиафайла (128 бит HMAC)"""
+    message = ":".join(["media", *map(str, parts)]).encode()
+    return hmac.new(settings.JWT_SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()[:32]
+
+
+def media_path(owner_id: int, upload_id: int, filename: str) -> str:
+    name = f"{upload_id}-{secret_suffix('upload', upload_id)}-{_safe_name(filename)}"
+    return os.path.join(settings.UPLOAD_DIR, "drone_media", str(owner_id), name)
+
+
+def photo_path(owner_id: int, batch: str, index: int, filename: str) -> str:
+    """Фото из пакетной загрузки (POST /uploads/photos)"""
+    name = f"{batch}-{index}-{secret_suffix('photo', owner_id, batch, index)}-{_safe_name(filename)}"
+    return os.path.join(settings.UPLOAD_DIR, "drone_media", str(owner_id), "photos", name)
+
+
+def save_photo(fp: BinaryIO, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fp.seek(0)
+    with open(path, "wb") as out:
+        shutil.copyfileobj(fp, out, HASH_CHUNK)
+
+
+def media_url(path: str) -> str:
+    """URL файла под StaticFiles /uploads"""
+    return "/uploads/" + os.path.relpath(path, settings.UPLOAD_DIR).replace(os.sep, "/")
+
+
+def media_file(url: str) -> str:
+    """Путь файла по URL из media_url"""
+    return os.path.join(settings.UPLOAD_DIR, url.removeprefix("/uploads/"))
+
+
+def create_part(upload_id: int):
+    path = part_path(upload_id)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "wb").close()
+
+
+def remove_part(upload_id: int):
+    try:
+        os.remove(part_path(upload_id))
+    except FileNotFoundError:
+        pass
+
+
+@contextmanager
+def locked_part(upload_id: int):
+    """Дескриптор файла части под эксклюзивной блокировкой; UploadLocked — если занят"""
+    fd = os.open(part_path(upload_id), os.O_WRONLY)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadLocked(upload_id)
+        yield fd
+    finally:
+        os.close(fd)  # снимает и блокировку
+
+
+def _write_block(fd: int, block: bytes, position: int, digest):
+    os.pwrite(fd, block, position)
+    digest.update(block)
+
+
+async def write_chunk(fd: int, offset: int, stream: AsyncIterator[bytes], limit: int) -> tuple[int, bytes, bool]:
+    """Записать тело запроса с offset: (записано байт, sha256 части, клиент отключился)"""
+    digest = hashlib.sha256()
+    written = 0
+    pending = bytearray()
+    disconnected = False
+    try:
+        async for chunk in stream:
+            if written + len(pending) + len(chunk) > limit:
+                raise ChunkTooLarge(limit)
+            pending += chunk
+            if len(pending) >= WRITE_BUFFER:
+                await run_in_threadpool(_write_block, fd, bytes(pending), offset + written, digest)
+                written += len(pending)
+                pending.clear()
+    except ClientDisconnect:
+        disconnected = True
+    if pending:
+        # при обрыве принятое до него тоже сохраняется
+        await run_in_threadpool(_write_block, fd, bytes(pending), offset + written, digest)
+        written += len(pending)
+    return written, digest.digest(), disconnected
+
+
+def commit_chunk(fd: int):
+    os.fsync(fd)
+
+
+def rollback_chunk(fd: int, offset: int):
+    """Отбросить непроверенные байты после подтверждённого смещения"""
+    os.ftruncate(fd, offset)
+
+
+def file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(HASH_CHUNK):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def publish(upload_id: int, owner_id: int, filename: str) -> str:
+    """Перенести собранный файл к медиа владельца; вернуть путь"""
+    path = media_path(owner_id, upload_id, filename)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    os.replace(part_path(upload_id), path)
+    return path
+
+
+def unpublish(upload_id: int, path: str):
+    """Вернуть файл из медиа в части загрузки (завершение не удалось)"""
+    if os.path.exists(path):
+        os.replace(path, part_path(upload_id))
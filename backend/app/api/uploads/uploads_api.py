@@ -0,0 +1,282 @@
+# backend/app/api/uploads/uploads_api.py
+# Возобновляемая загрузка многогигабайтной съёмки по частям (по образцу протокола tus):
+#   POST   /api/uploads                 — создать сессию (пастбище, имя, размер, sha256 файла)
+#   HEAD   /api/uploads/{id}            — Upload-Offset: с какого байта продолжать
+#   PATCH  /api/uploads/{id}            — часть с Upload-Offset и Upload-Checksum: sha256 <base64>
+#   POST   /api/uploads/{id}/complete   — проверить файл и создать измерение
+#   GET    /api/uploads/{id}, DELETE /api/uploads/{id}
+#   GET    /api/uploads/{id}/frames     — кадры, отобранные из загруженного видео
+#   POST   /api/uploads/photos          — пакет фото; пастбище каждого — по GPS из EXIF
+#
+# Часть с контрольной суммой принимается целиком или не принимается: при обрыве
+# связи или несовпадении суммы файл обрезается до прежнего смещения. Часть без
+# суммы сохраняется до места обрыва. После обрыва клиент спрашивает HEAD и шлёт с него.
+import base64
+import binascii
+import logging
+import time
+import uuid
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Request, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.security import get_current_user
+from database.db import get_db
+from model.models import UploadSession, User
+from app.api.drones.crud.drone_crud import get_drone
+from app.api.pastures.crud.pasture_crud import get_pasture
+from app.api.uploads import storage
+from app.api.uploads.crud import upload_crud
+from app.api.uploads.schemas.upload_schemas import (
+    FrameResponse, PhotoBatchResponse, PhotoResult, UploadCreate, UploadResponse,
+)
+from app.processing.exif import read_photo_exif
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+HTTP_460_CHECKSUM_MISMATCH = 460  # код tus для несовпадения суммы части
+
+
+def _offset_headers(upload: UploadSession) -> dict:
+    return {
+        "Upload-Offset": str(upload.received),
+        "Upload-Length": str(upload.size),
+        "Cache-Control": "no-store",
+    }
+
+
+def _get_upload(db: Session, upload_id: int, user: User) -> UploadSession:
+    upload = upload_crud.get_upload(db, upload_id, user.id)
+    if not upload:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Загрузка не найдена")
+    return upload
+
+
+def _require_uploading(upload: UploadSession):
+    if upload.status != "uploading":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Загрузка в статусе {upload.status}",
+            headers=_offset_headers(upload),
+        )
+
+
+def _parse_checksum(value: Optional[str]) -> Optional[bytes]:
+    if value is None:
+        return None
+    algorithm, _, encoded = value.partition(" ")
+    if algorithm.lower() != "sha256":
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Upload-Checksum: поддерживается только sha256")
+    try:
+        digest = base64.b64decode(encoded.strip(), validate=True)
+    except binascii.Error:
+        digest = b""
+    if len(digest) != 32:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Upload-Checksum: ожидается sha256 в base64")
+    return digest
+
+
+@router.post("", response_model=UploadResponse, status_code=status.HTTP_201_CREATED)
+def create_upload(
+    data: UploadCreate,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Начать загрузку фото или видео с дрона для пастбища"""
+    if data.size > settings.UPLOAD_MAX_BYTES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Файл больше {settings.UPLOAD_MAX_BYTES // 1024 ** 3} ГБ"
+        )
+    if not get_pasture(db, data.pasture_id, current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пастбище не найдено")
+    if data.drone_id is not None and not get_drone(db, data.drone_id, current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Дрон не найден")
+    upload = upload_crud.create_upload(db, data, current_user.id)
+    response.headers["Location"] = f"/api/uploads/{upload.id}"
+    response.headers.update(_offset_headers(upload))
+    return upload
+
+
+@router.post("/photos", response_model=PhotoBatchResponse, status_code=status.HTTP_201_CREATED)
+def upload_photos(
+    files: List[UploadFile] = File(...),
+    pasture_id: Optional[int] = Form(None, description="Для фото без GPS или вне границ пастбищ"),
+    drone_id: Optional[int] = Form(None),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Пакет фото с поля: пастбище каждого определяется по координатам EXIF и границам пастбищ"""
+    if len(files) > settings.PHOTO_BATCH_MAX_FILES:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Не больше {settings.PHOTO_BATCH_MAX_FILES} фото за раз"
+        )
+    if pasture_id is not None and not get_pasture(db, pasture_id, current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Пастбище не найдено")
+    if drone_id is not None and not get_drone(db, drone_id, current_user.id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Дрон не найден")
+
+    started = time.perf_counter()
+    # только заголовки: пиксели не декодируются
+    tags = [read_photo_exif(file.file) for file in files]
+    located = [i for i, t in enumerate(tags) if t is not None and t["lat"] is not None]
+    index = upload_crud.pasture_index(db, current_user.id)
+    positions = index.locate([tags[i]["lng"] for i in located], [tags[i]["lat"] for i in located])
+    pastures = dict(zip(located, (index.keys[p] if p >= 0 else None for p in positions.tolist())))
+    logger.info("Пакет фото: %d файлов разобрано за %.0f мс", len(files), (time.perf_counter() - started) * 1000)
+
+    batch = uuid.uuid4().hex[:12]
+    results, assigned = [], []
+    for number, (file, tag) in enumerate(zip(files, tags)):
+        result = PhotoResult(filename=file.filename or f"photo-{number}", status="unassigned", **(tag or {}))
+        if tag is None:
+            result.reason = "not_image"
+        elif pastures.get(number) is not None:
+            result.status, result.assigned_by, result.pasture_id = "assigned", "gps", pastures[number]
+        else:
+            result.reason = "no_gps" if tag["lat"] is None else "outside_pastures"
+            if pasture_id is not None:
+                result.status, result.assigned_by, result.pasture_id = "assigned", "fallback", pasture_id
+        if result.status == "assigned":
+            path = storage.photo_path(current_user.id, batch, number, result.filename)
+            storage.save_photo(file.file, path)
+            assigned.append({"path": path, "filename": result.filename, "pasture_id": result.pasture_id,
+                             "taken_at": result.taken_at, "result": result})
+        results.append(result)
+
+    job_ids = upload_crud.create_photo_measurements(db, current_user.id, assigned, drone_id)
+    for photo in assigned:
+        photo["result"].measurement_id = photo["measurement_id"]
+    return PhotoBatchResponse(assigned=len(assigned), unassigned=len(results) - len(assigned),
+                              photos=results, job_ids=job_ids)
+
+
+@router.head("/{upload_id}")
+def upload_offset(upload_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Сколько байт уже принято — с этого смещения продолжать"""
+    upload = _get_upload(db, upload_id, current_user)
+    return Response(headers=_offset_headers(upload))
+
+
+@router.get("/{upload_id}", response_model=UploadResponse)
+def get_upload(upload_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    return _get_upload(db, upload_id, current_user)
+
+
+@router.patch("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def upload_chunk(
+    upload_id: int,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    upload_checksum: Optional[str] = Header(None, alias="Upload-Checksum"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Дописать часть файла с подтверждённого смещения"""
+    # async — чтобы читать тело потоком; БД и диск — только через пул потоков
+    upload = await run_in_threadpool(_get_upload, db, upload_id, current_user)
+    _require_uploading(upload)
+    expected = _parse_checksum(upload_checksum)
+    try:
+        with storage.locked_part(upload.id) as fd:
+            # под блокировкой — смещение могла сдвинуть предыдущая попытка той же части
+            await run_in_threadpool(db.refresh, upload)
+            _require_uploading(upload)
+            if upload_offset != upload.received:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Смещение не совпадает с принятым",
+                    headers=_offset_headers(upload),
+                )
+            try:
+                written, digest, disconnected = await storage.write_chunk(
+                    fd, upload_offset, request.stream(), upload.size - upload_offset)
+            except storage.ChunkTooLarge:
+                await run_in_threadpool(storage.rollback_chunk, fd, upload_offset)
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail="Часть выходит за объявленный размер файла",
+                    headers=_offset_headers(upload),
+                )
+            if expected is not None and (disconnected or digest != expected):
+                await run_in_threadpool(storage.rollback_chunk, fd, upload_offset)
+                raise HTTPException(
+                    status_code=HTTP_460_CHECKSUM_MISMATCH,
+                    detail="Контрольная сумма части не совпадает",
+                    headers=_offset_headers(upload),
+                )
+            await run_in_threadpool(storage.commit_chunk, fd)
+            if not await run_in_threadpool(upload_crud.advance, db, upload, upload_offset, upload_offset + written):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Загрузка изменена другим запросом",
+                    headers=_offset_headers(upload),
+                )
+    except storage.UploadLocked:
+        raise HTTPException(
+            status_code=status.HTTP_423_LOCKED,
+            detail="Предыдущая часть ещё принимается, повторите позже",
+            headers={"Retry-After": "1"},
+        )
+    except FileNotFoundError:
+        # файл удалён истечением сессии или отменой
+        raise HTTPException(status_code=status.HTTP_410_GONE, detail="Загрузка больше не доступна")
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=_offset_headers(upload))
+
+
+@router.post("/{upload_id}/complete", response_model=UploadResponse)
+def complete_upload(upload_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Завершить загрузку: проверить размер и sha256, создать измерение и задание его обработки"""
+    upload = _get_upload(db, upload_id, current_user)
+    if upload.status == "completed":
+        return upload
+    _require_uploading(upload)
+    if upload.received != upload.size:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Принято {upload.received} из {upload.size} байт",
+            headers=_offset_headers(upload),
+        )
+    if not upload_crud.claim_completion(db, upload):
+        # одновременный /complete: повтор после таймаута, пока первый ещё проверяет файл
+        if upload.status == "completed":
+            return upload
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Загрузка в статусе {upload.status}",
+            headers={**_offset_headers(upload), "Retry-After": "1"},
+        )
+    path = storage.media_path(current_user.id, upload.id, upload.filename)
+    try:
+        if upload.sha256 and storage.file_sha256(storage.part_path(upload.id)) != upload.sha256:
+            upload_crud.fail_upload(db, upload, "Контрольная сумма файла не совпадает")
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=upload.message)
+        storage.publish(upload.id, current_user.id, upload.filename)
+        return upload_crud.complete_upload(db, upload, path)
+    except Exception:
+        if upload_crud.release_completion(db, upload):
+            storage.unpublish(upload.id, path)
+        raise
+
+
+@router.get("/{upload_id}/frames", response_model=List[FrameResponse])
+def get_upload_frames(upload_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Кадры видео с временем и координатами; пусто, пока обработка не закончилась"""
+    upload = _get_upload(db, upload_id, current_user)
+    if upload.measurement_id is None:
+        return []
+    return upload_crud.get_frames(db, upload.measurement_id)
+
+
+@router.delete("/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+def cancel_upload(upload_id: int, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """Отменить загрузку и удалить принятые части (собранный файл и измерение остаются)"""
+    upload_crud.delete_upload(db, _get_upload(db, upload_id, current_user))
+    return None
@@ -0,0 +1,110 @@
+# backend/app/jobs/handlers.py
+# Обработчики заданий очереди: kind -> функция(job) -> результат (JSON).
+# Исключение — неудачная попытка (повтор с задержкой); PermanentJobError — без повтора.
+import datetime
+import logging
+import os
+
+from sqlalchemy import select, update
+
+from core.config import settings
+from database.db import SessionLocal, engine
+from model.models import Job, User
+from app.api.exports.crud.export_crud import export_query, stream_partitions
+from app.api.exports.writers import FORMATS, WRITERS
+from app.api.imports.importer import run_import
+from app.processing.biomass import estimate_measurements
+from app.processing.thumbnails import make_thumbnail
+from app.processing.video_frames import process_measurement_video
+from app.jobs.queue import enqueue, job_dir
+
+logger = logging.getLogger(__name__)
+
+
+class PermanentJobError(Exception):
+    """Повтор не поможет: неверные параметры, нет данных"""
+
+
+def run_import_job(job: dict):
+    payload = job["payload"]
+    # прогресс и ошибки по строкам пишет сам импорт — в import_jobs
+    run_import(payload["import_job_id"], payload["path"], payload.get("defaults"))
+    return {"import_job_id": payload["import_job_id"]}
+
+
+def run_export_job(job: dict):
+    dataset, file_format = job["payload"]["dataset"], job["payload"]["format"]
+    with SessionLocal() as db:
+        user = db.get(User, job["owner_id"])
+        if user is None:
+            raise PermanentJobError("Пользователь удалён")
+        query = export_query(dataset, user)
+    media_type, extension = FORMATS[file_format]
+    path = os.path.join(job_dir("exports"), f"{job['id']}.{extension}")
+    # пишем во временный файл: оборванная попытка не оставит полувыгрузку
+    with open(path + ".tmp", "wb") as out:
+        for chunk in WRITERS[file_format](list(query.selected_columns), stream_partitions(query)):
+            out.write(chunk)
+    os.replace(path + ".tmp", path)
+    return {"path": path, "filename": f"{dataset}.{extension}", "media_type": media_type,
+            "size": os.path.getsize(path)}
+
+
+def run_video_frames_job(job: dict):
+    result = process_measurement_video(job["payload"]["measurement_id"])
+    if result is None:
+        raise PermanentJobError("Видео измерения не найдено или не декодируется")
+    # оценка биомассы — по отобранным кадрам, отдельным заданием
+    with SessionLocal() as db:
+        enqueue(db, "biomass", {"measurement_ids": [job["payload"]["measurement_id"]]},
+                job["owner_id"], farm_id=job["farm_id"])
+    return {key: round(result[key], 2) if isinstance(result[key], float) else result[key]
+            for key in ("decoded", "duplicates", "duration", "seconds", "fps")} | {"frames": len(result["frames"])}
+
+
+def run_thumbnail_job(job: dict):
+    # пакет (measurement_ids) или одно измерение (measurement_id — задания старого формата)
+    payload = job["payload"]
+    measurement_ids = payload.get("measurement_ids") or [payload["measurement_id"]]
+    urls, failed = {}, 0
+    for measurement_id in measurement_ids:
+        # битое фото не должно валить превью остальных фото пакета
+        try:
+            urls[measurement_id] = make_thumbnail(measurement_id)
+        except (OSError, ValueError) as exc:
+            logger.warning("Превью измерения %s не построено: %s", measurement_id, exc)
+            urls[measurement_id] = None
+            failed += 1
+    if not any(urls.values()):
+        raise PermanentJobError("Фото измерений не найдены или не читаются")
+    return {"thumbnail_urls": urls, "failed": failed}
+
+
+def run_biomass_job(job: dict):
+    return estimate_measurements(job["payload"]["measurement_ids"])
+
+
+HANDLERS = {
+    "import": run_import_job,
+    "export": run_export_job,
+    "video_frames": run_video_frames_job,
+    "thumbnail": run_thumbnail_job,
+    "biomass": run_biomass_job,
+}
+
+
+def purge_exports() -> int:
+    """Удалить выгрузки старше JOB_RESULT_TTL_HOURS; result задания очищается"""
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(hours=settings.JOB_RESULT_TTL_HOURS)
+    with engine.begin() as conn:
+        rows = conn.execute(select(Job.id, Job.result).where(
+            Job.kind == "export", Job.status == "completed", Job.finished_at < cutoff, Job.result.isnot(None)
+        )).all()
+        for job_id, result in rows:
+            try:
+                os.remove(result["path"])
+            except FileNotFoundError:
+                pass
+        if rows:
+            conn.execute(update(Job).where(Job.id.in_([r.id for r in rows])).values(result=None))
+    return len(rows)
@@ -0,0 +1,181 @@
+# backend/app/jobs/queue.py
+# Очередь фоновых заданий в таблице jobs.
+#
+# Захват: самые приоритетные готовые задания (queued, run_after <= now) выбираются
+# с FOR UPDATE SKIP LOCKED — параллельные воркеры не ждут друг друга и не берут
+# одно задание дважды. Ограничение JOB_FARM_CONCURRENCY проверяется под
+# транзакционной advisory-блокировкой фермы, так что два воркера не превысят его
+# одновременно. В SQLite (локальная разработка) записи и так последовательны, а
+# задание достаётся тому, чей условный UPDATE queued -> running сработал.
+#
+# Выполняющееся задание продлевает heartbeat_at; задание, чей воркер пропал дольше
+# JOB_LEASE_SECONDS назад, возвращается в очередь как ещё одна попытка.
+#
+# Импорт ведёт и собственный статус в import_jobs: если его задание отменено или
+# провалено без запуска обработчика, import_jobs закрывается в той же транзакции,
+# а загруженный файл удаляется.
+import datetime
+import os
+import random
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from database.db import engine
+from model.models import Job
+
+jobs = Job.__table__
+
+# Приоритеты по умолчанию: пользователь ждёт превью и импорт, видео терпит
+PRIORITIES = {
+    "thumbnail": 20,
+    "import": 10,
+    "export": 10,
+    "biomass": 5,
+    "video_frames": 0,
+}
+
+CLAIM_CANDIDATES = 20
+FARM_LOCK = 48_001  # первый ключ двухключевой advisory-блокировки фермы
+
+
+def job_dir(name: str) -> str:
+    """Каталог в JOB_FILES_DIR — общий для API и воркеров"""
+    path = os.path.join(settings.JOB_FILES_DIR, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.utcnow()
+
+
+def enqueue(db: Session, kind: str, payload: dict, owner_id: int, farm_id: int | None = None,
+            priority: int | None = None, max_attempts: int | None = None, commit: bool = True) -> Job:
+    """Поставить задание; commit=False — в транзакции вызывающего (пачка заданий одним COMMIT)"""
+    job = Job(
+        kind=kind,
+        payload=payload,
+        owner_id=owner_id,
+        farm_id=farm_id,
+        priority=PRIORITIES.get(kind, 0) if priority is None else priority,
+        status="queued",
+        attempts=0,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_after=_now(),
+    )
+    db.add(job)
+    if commit:
+        db.commit()
+        db.refresh(job)
+    return job
+
+
+def _farm_has_slot(conn, farm_id: int) -> bool:
+    if conn.dialect.name == "postgresql" and not conn.scalar(select(func.pg_try_advisory_xact_lock(FARM_LOCK, farm_id))):
+        return False  # ферму прямо сейчас проверяет другой воркер
+    running = conn.scalar(select(func.count()).select_from(jobs).where(
+        jobs.c.farm_id == farm_id, jobs.c.status == "running"))
+    return running < settings.JOB_FARM_CONCURRENCY
+
+
+def claim(worker: str) -> dict | None:
+    """Взять следующее задание (статус running); None — готовых заданий нет"""
+    now = _now()
+    with engine.begin() as conn:
+        query = (
+            select(jobs.c.id, jobs.c.farm_id)
+            .where(jobs.c.status == "queued", jobs.c.run_after <= now)
+            .order_by(jobs.c.priority.desc(), jobs.c.id)
+            .limit(CLAIM_CANDIDATES)
+        )
+        if conn.dialect.name == "postgresql":
+            query = query.with_for_update(skip_locked=True)
+        busy_farms = set()
+        for job_id, farm_id in conn.execute(query).all():
+            if farm_id is not None:
+                if farm_id in busy_farms or not _farm_has_slot(conn, farm_id):
+                    busy_farms.add(farm_id)
+                    continue
+            claimed = conn.execute(
+                update(jobs)
+                .where(jobs.c.id == job_id, jobs.c.status == "queued")
+                .values(status="running", attempts=jobs.c.attempts + 1, worker=worker,
+                        started_at=now, heartbeat_at=now, error=None)
+            )
+            if claimed.rowcount:
+                return dict(conn.execute(select(jobs).where(jobs.c.id == job_id)).mappings().one())
+    return None
+
+
+def heartbeat(job_id: int):
+    with engine.begin() as conn:
+        conn.execute(update(jobs).where(jobs.c.id == job_id, jobs.c.status == "running").values(heartbeat_at=_now()))
+
+
+def finish(job_id: int, result=None):
+    with engine.begin() as conn:
+        conn.execute(update(jobs).where(jobs.c.id == job_id).values(
+            status="completed", result=result, finished_at=_now()))
+
+
+def retry_delay(attempts: int) -> float:
+    """Экспоненциальная задержка с разбросом ±10%, чтобы повторы не шли пачкой"""
+    delay = min(settings.JOB_RETRY_BACKOFF * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_DELAY)
+    return delay * random.uniform(0.9, 1.1)
+
+
+def fail(job: dict, error: str, retry: bool = True):
+    """Ошибка попытки: повтор с задержкой, пока попытки не кончились"""
+    now = _now()
+    if retry and job["attempts"] < job["max_attempts"]:
+        values = {"status": "queued", "run_after": now + datetime.timedelta(seconds=retry_delay(job["attempts"]))}
+    else:
+        values = {"status": "failed", "finished_at": now}
+    with engine.begin() as conn:
+        conn.execute(update(jobs).where(jobs.c.id == job["id"]).values(error=error[:10_000], **values))
+
+
+def _abandon(connection, rows, message: str) -> list[str]:
+    """Закрыть import_jobs заданий rows (kind, payload); файлы — удалить после COMMIT"""
+    from app.api.imports.importer import abandon_imports
+
+    return abandon_imports(connection, [payload for kind, payload in rows if kind == "import"], message)
+
+
+def requeue_stale() -> int:
+    """Задания пропавших воркеров: снова в очередь или failed, если попытки кончились"""
+    from app.api.imports.importer import remove_files
+
+    now = _now()
+    expired = jobs.c.heartbeat_at < now - datetime.timedelta(seconds=settings.JOB_LEASE_SECONDS)
+    with engine.begin() as conn:
+        failed = conn.execute(
+            update(jobs).where(jobs.c.status == "running", expired, jobs.c.attempts >= jobs.c.max_attempts)
+            .values(status="failed", finished_at=now, error="Воркер перестал отвечать")
+            .returning(jobs.c.kind, jobs.c.payload)
+        ).all()
+        paths = _abandon(conn, failed, "Воркер перестал отвечать")
+        requeued = conn.execute(
+            update(jobs).where(jobs.c.status == "running", expired)
+            .values(status="queued", run_after=now, error="Воркер перестал отвечать")
+        ).rowcount
+    remove_files(paths)
+    return len(failed) + requeued
+
+
+def cancel(db: Session, job_id: int, owner_id: int) -> bool:
+    """Отменить задание, которое ещё не начало выполняться"""
+    from app.api.imports.importer import remove_files
+
+    cancelled = db.execute(
+        update(Job).where(Job.id == job_id, Job.owner_id == owner_id, Job.status == "queued")
+        .values(status="cancelled", finished_at=_now())
+        .returning(Job.kind, Job.payload)
+        .execution_options(synchronize_session=False)
+    ).all()
+    paths = _abandon(db, cancelled, "Задание отменено")
+    db.commit()
+    remove_files(paths)
+    return len(cancelled) == 1
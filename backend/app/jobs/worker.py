@@ -0,0 +1,121 @@
+# backend/app/jobs/worker.py
+# Воркер очереди заданий — отдельно от веб-сервера:
+#
+#   cd backend && python -m app.jobs.worker --processes 4
+#
+# Главный процесс запускает процессы-исполнители (spawn) и перезапускает упавшие.
+# SIGTERM/SIGINT: исполнители доделывают текущее задание и выходят.
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import threading
+import time
+import traceback
+
+from core.config import settings
+from app.jobs import queue
+from app.jobs.handlers import HANDLERS, PermanentJobError, purge_exports
+
+logger = logging.getLogger("app.jobs.worker")
+
+MAINTENANCE_INTERVAL = 60.0
+
+
+class _Heartbeat(threading.Thread):
+    """Продлевает аренду задания, пока выполняется обработчик"""
+
+    def __init__(self, job_id: int):
+        super().__init__(daemon=True)
+        self.job_id = job_id
+        self.done = threading.Event()
+
+    def run(self):
+        while not self.done.wait(settings.JOB_LEASE_SECONDS / 3):
+            queue.heartbeat(self.job_id)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.done.set()
+        self.join()
+
+
+def run_job(job: dict):
+    handler = HANDLERS.get(job["kind"])
+    if handler is None:
+        queue.fail(job, f"Неизвестный вид задания: {job['kind']}", retry=False)
+        return
+    started = time.perf_counter()
+    try:
+        with _Heartbeat(job["id"]):
+            result = handler(job)
+    except PermanentJobError as exc:
+        logger.warning("Задание %s (%s) отклонено: %s", job["id"], job["kind"], exc)
+        queue.fail(job, str(exc), retry=False)
+    except Exception as exc:
+        logger.exception("Задание %s (%s), попытка %s", job["id"], job["kind"], job["attempts"])
+        queue.fail(job, f"{exc.__class__.__name__}: {exc}\n{traceback.format_exc(limit=5)}")
+    else:
+        queue.finish(job["id"], result)
+        logger.info("Задание %s (%s) выполнено за %.1f с", job["id"], job["kind"], time.perf_counter() - started)
+
+
+def work(stop, name: str):
+    """Цикл исполнителя: захват, выполнение, ожидание при пустой очереди"""
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(message)s")
+    # SIGINT от терминала приходит всей группе — останавливает главный процесс через stop
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    maintenance_at = 0.0
+    while not stop.is_set():
+        if time.monotonic() >= maintenance_at:
+            queue.requeue_stale()
+            purge_exports()
+            maintenance_at = time.monotonic() + MAINTENANCE_INTERVAL
+        job = queue.claim(name)
+        if job is None:
+            stop.wait(settings.JOB_POLL_INTERVAL)
+            continue
+        run_job(job)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--processes", type=int, default=settings.JOB_WORKERS)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(processName)s %(message)s")
+
+    context = multiprocessing.get_context("spawn")
+    stop = context.Event()
+    prefix = f"{socket.gethostname()}:{os.getpid()}"
+
+    def start(number: int):
+        process = context.Process(target=work, args=(stop, f"{prefix}-{number}"), name=f"job-worker-{number}")
+        process.start()
+        return process
+
+    # обработчик сигнала только ставит флаг: stop.set() из него может прийтись на
+    # момент, когда главный поток держит блокировку того же Event
+    stopping = []
+    signal.signal(signal.SIGTERM, lambda *_: stopping.append(True))
+    signal.signal(signal.SIGINT, lambda *_: stopping.append(True))
+    processes = [start(n) for n in range(args.processes)]
+    logger.info("Воркер очереди: %d процессов", len(processes))
+    while not stopping:
+        time.sleep(1.0)
+        for number, process in enumerate(processes):
+            if not process.is_alive() and not stopping:
+                logger.warning("Процесс %s завершился с кодом %s, перезапуск", process.name, process.exitcode)
+                processes[number] = start(number)
+    stop.set()
+    for process in processes:
+        process.join()
+    logger.info("Воркер очереди остановлен")
+
+
+if __name__ == "__main__":
+    main()
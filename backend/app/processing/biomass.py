@@ -0,0 +1,265 @@
+# backend/app/processing/biomass.py
+# Оценка биомассы (кг/га) по RGB-снимкам измерения.
+#
+# Снимок уменьшается при декодировании JPEG (draft) и вписывается в квадрат
+# image_size калибровки (признаки вроде текстуры зависят от разрешения), снимки складываются в пачку (N, H, W, 3), признаки считаются
+# векторно по всей пачке:
+#   canopy_cover — доля пикселей с ExG выше порога (проективное покрытие);
+#   exg_mean     — средний индекс избытка зелёного ExG = 2g - r - b по хроматическим
+#                  координатам (r = R / (R + G + B) ...), не зависит от освещённости;
+#   exg_canopy   — средний ExG по растительности: густота и «зелень» травостоя;
+#   texture      — средний модуль градиента яркости: высокая трава даёт больше теней.
+# Биомасса — линейная регрессия по признакам с коэффициентами из калибровки
+# (JSON с версией, BIOMASS_CALIBRATION); версия пишется в measurements.biomass_model.
+#
+# Измерение photo_upload — одно фото, drone_video — кадры из measurement_frames;
+# по нескольким снимкам берётся медиана биомассы.
+#
+#   cd backend && python -m app.processing.biomass fit samples.csv --version rgb-v2 --out calibration.json
+#   cd backend && python -m app.processing.biomass recompute     # заново по текущей калибровке
+import argparse
+import csv
+import datetime
+import json
+import logging
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
+from sqlalchemy import or_, select, update
+
+from core.config import settings
+from core.metrics import REGISTRY
+from database.db import SessionLocal
+from model.models import Farm, Measurement, MeasurementFrame, Pasture
+from app.api.uploads.storage import media_file
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover
+    Image = ImageOps = None
+
+logger = logging.getLogger(__name__)
+
+biomass_images_total = REGISTRY.counter(
+    "biomass_images_total", "Снимки, обработанные оценкой биомассы", ("result",))
+
+FEATURES = ("canopy_cover", "exg_mean", "exg_canopy", "texture")
+CLIPPED = (0.02, 0.98)  # яркость пересвета/провала, доля от максимума
+RECOMPUTE_MEASUREMENTS = 50  # измерений в одном задании пересчёта
+
+
+class CalibrationError(ValueError):
+    """Файл калибровки не подходит к модели"""
+
+
+@lru_cache(maxsize=4)
+def load_calibration(path: str | None = None) -> dict:
+    path = path or settings.BIOMASS_CALIBRATION
+    with open(path, encoding="utf-8") as f:
+        calibration = json.load(f)
+    missing = {"version", "image_size", "features", "intercept", "coefficients", "exg_threshold"} - calibration.keys()
+    if missing:
+        raise CalibrationError(f"В калибровке {path} нет полей: {', '.join(sorted(missing))}")
+    unknown = set(calibration["features"]) - set(FEATURES)
+    if unknown or len(calibration["features"]) != len(calibration["coefficients"]):
+        raise CalibrationError(f"Признаки калибровки {path} не совпадают с моделью")
+    return calibration
+
+
+def load_image(path: str, size: int) -> np.ndarray:
+    """Снимок (size, size, 3) uint8: центральный квадрат, поворот по EXIF"""
+    with Image.open(path) as image:
+        # JPEG декодируется сразу в 1/2..1/8 масштаба — основная экономия времени
+        image.draft("RGB", (size, size))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        return np.asarray(ImageOps.fit(image, (size, size), Image.Resampling.BILINEAR))
+
+
+def extract_features(batch: np.ndarray, exg_threshold: float) -> dict[str, np.ndarray]:
+    """Признаки пачки (N, H, W, 3) uint8: по массиву длины N на признак и quality"""
+    red, green, blue = (batch[..., c].astype(np.float32) for c in range(3))
+    total = red + green + blue
+    # ExG в хроматических координатах: (2G - R - B) / (R + G + B)
+    exg = 2 * green - red - blue
+    exg /= np.maximum(total, 1.0)
+
+    canopy = exg > exg_threshold
+    canopy_pixels = canopy.sum(axis=(1, 2))
+    brightness = 0.299 * red + 0.587 * green + 0.114 * blue
+    brightness /= 255
+    texture = (np.abs(np.diff(brightness, axis=1)).mean(axis=(1, 2))
+               + np.abs(np.diff(brightness, axis=2)).mean(axis=(1, 2))) / 2
+    clipped = ((brightness < CLIPPED[0]) | (brightness > CLIPPED[1])).mean(axis=(1, 2))
+    return {
+        "canopy_cover": canopy.mean(axis=(1, 2)),
+        "exg_mean": exg.mean(axis=(1, 2)),
+        "exg_canopy": (exg * canopy).sum(axis=(1, 2)) / np.maximum(canopy_pixels, 1),
+        "texture": texture,
+        # качество снимка — доля пикселей без пересвета и провала в тень
+        "quality": 1.0 - clipped,
+    }
+
+
+def predict(features: dict[str, np.ndarray], calibration: dict) -> np.ndarray:
+    matrix = np.stack([features[name] for name in calibration["features"]], axis=1)
+    biomass = calibration["intercept"] + matrix @ np.asarray(calibration["coefficients"], dtype=np.float32)
+    return np.clip(biomass, calibration.get("min_kg_ha", 0.0), calibration.get("max_kg_ha", np.inf))
+
+
+def estimate_images(paths: list[str], calibration: dict, batch_size: int | None = None) -> list[dict | None]:
+    """Оценка по каждому снимку (None — снимок не читается); пачками по batch_size"""
+    if Image is None:
+        raise RuntimeError("Оценка биомассы недоступна: не установлен пакет Pillow")
+    batch_size = batch_size or settings.BIOMASS_BATCH_SIZE
+    size = calibration["image_size"]
+    results: list[dict | None] = [None] * len(paths)
+    for start in range(0, len(paths), batch_size):
+        images, indexes = [], []
+        for index in range(start, min(start + batch_size, len(paths))):
+            try:
+                images.append(load_image(paths[index], size))
+                indexes.append(index)
+            except (OSError, ValueError) as exc:
+                logger.warning("Снимок %s не прочитан: %s", paths[index], exc)
+                biomass_images_total.inc(("unreadable",))
+        if not images:
+            continue
+        features = extract_features(np.stack(images), calibration["exg_threshold"])
+        biomass = predict(features, calibration)
+        for row, index in enumerate(indexes):
+            results[index] = {"biomass": float(biomass[row])} | {k: float(v[row]) for k, v in features.items()}
+        biomass_images_total.inc(("estimated",), len(images))
+    return results
+
+
+def _measurement_images(db, measurement_ids: list[int]) -> dict[int, list[str]]:
+    measurements = db.execute(
+        select(Measurement.id, Measurement.method, Measurement.media_url).where(Measurement.id.in_(measurement_ids))
+    ).all()
+    images = {m.id: [media_file(m.media_url)] for m in measurements if m.method == "photo_upload" and m.media_url}
+    video_ids = [m.id for m in measurements if m.method == "drone_video"]
+    if video_ids:
+        frames = db.execute(
+            select(MeasurementFrame.measurement_id, MeasurementFrame.image_url)
+            .where(MeasurementFrame.measurement_id.in_(video_ids))
+            .order_by(MeasurementFrame.measurement_id, MeasurementFrame.offset)
+        )
+        for measurement_id, image_url in frames:
+            images.setdefault(measurement_id, []).append(media_file(image_url))
+    for measurement in measurements:
+        images.setdefault(measurement.id, [])
+    return images
+
+
+def estimate_measurements(measurement_ids: list[int], calibration: dict | None = None) -> dict:
+    """Записать биомассу, покрытие и качество снимков измерений; снимки всех измерений — общими пачками"""
+    calibration = calibration or load_calibration()
+    with SessionLocal() as db:
+        images = _measurement_images(db, measurement_ids)
+        paths = [path for measurement_paths in images.values() for path in measurement_paths]
+        estimates = iter(estimate_images(paths, calibration))
+
+        now = datetime.datetime.utcnow()
+        rows, failed = [], 0
+        for measurement_id, measurement_paths in images.items():
+            found = [e for e in (next(estimates) for _ in measurement_paths) if e is not None]
+            if not found:
+                failed += 1
+                rows.append({"id": measurement_id, "status": "failed", "updated_at": now})
+                continue
+            rows.append({
+                "id": measurement_id,
+                "status": "completed",
+                "biomass_value": round(float(np.median([e["biomass"] for e in found])), 1),
+                "coverage_percent": round(100 * float(np.mean([e["canopy_cover"] for e in found])), 1),
+                "quality_score": round(float(np.mean([e["quality"] for e in found])), 3),
+                "biomass_model": calibration["version"],
+                "updated_at": now,
+            })
+        if rows:
+            # ORM bulk UPDATE по первичному ключу: строки группируются по набору колонок
+            db.execute(update(Measurement), rows)
+            db.commit()
+    return {"estimated": len(rows) - failed, "failed": failed, "images": len(paths), "model": calibration["version"]}
+
+
+def fit_calibration(features: dict[str, np.ndarray], biomass: np.ndarray, version: str, image_size: int,
+                    exg_threshold: float, names: tuple[str, ...] = ("canopy_cover", "exg_canopy", "texture")) -> dict:
+    """Коэффициенты регрессии по снимкам с известной биомассой (укосы с учётных площадок)"""
+    matrix = np.column_stack([np.ones(len(biomass))] + [features[name] for name in names])
+    coefficients, *_ = np.linalg.lstsq(matrix, biomass, rcond=None)
+    residuals = biomass - matrix @ coefficients
+    return {
+        "version": version,
+        "fitted_at": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+        "samples": int(len(biomass)),
+        "rmse_kg_ha": round(float(np.sqrt(np.mean(residuals ** 2))), 1),
+        "image_size": image_size,
+        "exg_threshold": exg_threshold,
+        "features": list(names),
+        "intercept": round(float(coefficients[0]), 3),
+        "coefficients": [round(float(c), 3) for c in coefficients[1:]],
+        "min_kg_ha": 0.0,
+        "max_kg_ha": round(float(biomass.max()) * 1.5, 1),
+    }
+
+
+def _fit(args):
+    """CSV с колонками path;biomass_kg_ha -> новый файл калибровки"""
+    with open(args.samples, encoding="utf-8-sig", newline="") as f:
+        samples = [(row["path"], float(row["biomass_kg_ha"])) for row in csv.DictReader(f, delimiter=args.delimiter)]
+    current = load_calibration()
+    threshold = current["exg_threshold"] if args.exg_threshold is None else args.exg_threshold
+    size = args.image_size or current["image_size"]
+    features = extract_features(np.stack([load_image(path, size) for path, _ in samples]), threshold)
+    calibration = fit_calibration(features, np.array([b for _, b in samples]), args.version, size, threshold)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(calibration, f, ensure_ascii=False, indent=2)
+    print(f"{args.version}: {calibration['samples']} снимков, RMSE {calibration['rmse_kg_ha']} кг/га -> {args.out}")
+
+
+def _recompute(args):
+    """Поставить в очередь измерения, оценённые другой версией калибровки"""
+    from app.jobs.queue import enqueue
+
+    version = load_calibration()["version"]
+    with SessionLocal() as db:
+        rows = db.execute(
+            select(Measurement.id, Pasture.farm_id, Farm.owner_id)
+            .join(Pasture, Pasture.id == Measurement.pasture_id).join(Farm, Farm.id == Pasture.farm_id)
+            .where(Measurement.status == "completed", Measurement.media_url.isnot(None),
+                   or_(Measurement.biomass_model.is_(None), Measurement.biomass_model != version))
+            .order_by(Pasture.farm_id, Measurement.id)
+        ).all()
+        by_farm = defaultdict(list)
+        for measurement_id, farm_id, owner_id in rows:
+            by_farm[(farm_id, owner_id)].append(measurement_id)
+        jobs = 0
+        for (farm_id, owner_id), ids in by_farm.items():
+            for start in range(0, len(ids), RECOMPUTE_MEASUREMENTS):
+                enqueue(db, "biomass", {"measurement_ids": ids[start:start + RECOMPUTE_MEASUREMENTS]},
+                        owner_id, farm_id=farm_id)
+                jobs += 1
+    print(f"{version}: {len(rows)} измерений, {jobs} заданий")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    commands = parser.add_subparsers(dest="command", required=True)
+    fit = commands.add_parser("fit", help="подобрать калибровку по снимкам с известной биомассой")
+    fit.add_argument("samples", help="CSV: path;biomass_kg_ha")
+    fit.add_argument("--version", required=True)
+    fit.add_argument("--out", required=True)
+    fit.add_argument("--delimiter", default=";")
+    fit.add_argument("--exg-threshold", type=float, default=None, help="по умолчанию — из текущей калибровки")
+    fit.add_argument("--image-size", type=int, default=None, help="по умолчанию — из текущей калибровки")
+    fit.set_defaults(handler=_fit)
+    recompute = commands.add_parser("recompute", help="пересчитать измерения по текущей калибровке")
+    recompute.set_defaults(handler=_recompute)
+    args = parser.parse_args()
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
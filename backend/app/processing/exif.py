@@ -0,0 +1,82 @@
+# backend/app/processing/exif.py
+# Координаты и время съёмки из EXIF фото. Image.open читает только заголовки,
+# пиксели не декодируются — разбор JPEG занимает доли миллисекунды.
+#
+# Время — UTC без часового пояса (как везде в БД): GPS-дата и время (всегда UTC),
+# иначе DateTimeOriginal со сдвигом OffsetTimeOriginal, иначе DateTimeOriginal как есть.
+import datetime
+import math
+from typing import BinaryIO
+
+try:
+    from PIL import Image, UnidentifiedImageError
+except ImportError:  # pragma: no cover
+    Image = UnidentifiedImageError = None
+
+GPS_IFD = 0x8825
+EXIF_IFD = 0x8769
+
+GPS_LATITUDE_REF, GPS_LATITUDE = 1, 2
+GPS_LONGITUDE_REF, GPS_LONGITUDE = 3, 4
+GPS_TIMESTAMP, GPS_DATESTAMP = 7, 29
+DATETIME_ORIGINAL, OFFSET_TIME_ORIGINAL = 0x9003, 0x9011
+
+
+def _degrees(value, ref) -> float | None:
+    try:
+        degrees, minutes, seconds = (float(part) for part in value)
+    except (TypeError, ValueError, ZeroDivisionError):
+        return None
+    result = degrees + minutes / 60 + seconds / 3600
+    return -result if ref in ("S", "W") else result
+
+
+def _gps_time(gps) -> datetime.datetime | None:
+    date, time = gps.get(GPS_DATESTAMP), gps.get(GPS_TIMESTAMP)
+    if not date or not time:
+        return None
+    try:
+        hours, minutes, seconds = parts = [float(part) for part in time]
+        # 0/0 (камера без фиксации) даёт nan, мусор — переполнение datetime
+        if not all(math.isfinite(part) for part in parts):
+            return None
+        day = datetime.datetime.strptime(date.strip("\x00 "), "%Y:%m:%d")
+        return day + datetime.timedelta(hours=hours, minutes=minutes, seconds=seconds)
+    except (TypeError, ValueError, ZeroDivisionError, OverflowError):
+        return None
+
+
+def _original_time(exif_ifd) -> datetime.datetime | None:
+    value = exif_ifd.get(DATETIME_ORIGINAL)
+    if not value:
+        return None
+    try:
+        taken = datetime.datetime.strptime(value.strip("\x00 "), "%Y:%m:%d %H:%M:%S")
+    except ValueError:
+        return None
+    offset = exif_ifd.get(OFFSET_TIME_ORIGINAL)
+    if offset:
+        try:
+            shift = datetime.datetime.strptime(offset.strip("\x00 "), "%z").utcoffset()
+        except ValueError:
+            return taken
+        taken -= shift
+    return taken
+
+
+def read_photo_exif(fp: BinaryIO) -> dict | None:
+    """{"lat", "lng", "taken_at"} (каждое может быть None); None — файл не изображение"""
+    if Image is None:
+        raise RuntimeError("Разбор EXIF недоступен: не установлен пакет Pillow")
+    try:
+        with Image.open(fp) as image:
+            exif = image.getexif()
+    except (UnidentifiedImageError, OSError, SyntaxError, ValueError):
+        return None
+    gps = exif.get_ifd(GPS_IFD)
+    lat = _degrees(gps.get(GPS_LATITUDE), gps.get(GPS_LATITUDE_REF))
+    lng = _degrees(gps.get(GPS_LONGITUDE), gps.get(GPS_LONGITUDE_REF))
+    if lat is None or lng is None or not (-90 <= lat <= 90 and -180 <= lng <= 180) or (lat == 0 and lng == 0):
+        # 0, 0 пишут камеры без фиксации спутников
+        lat = lng = None
+    return {"lat": lat, "lng": lng, "taken_at": _gps_time(gps) or _original_time(exif.get_ifd(EXIF_IFD))}
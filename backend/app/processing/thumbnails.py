@@ -0,0 +1,35 @@
+# backend/app/processing/thumbnails.py
+# Превью фото измерения: JPEG декодируется сразу в уменьшенном масштабе (draft),
+# поворот берётся из EXIF. Результат — uploads/thumbnails/{measurement_id}-{секрет}.jpg.
+import os
+
+from core.config import settings
+from database.db import SessionLocal
+from model.models import Measurement
+from app.api.uploads.storage import media_file, media_url, secret_suffix
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover
+    Image = ImageOps = None
+
+
+def make_thumbnail(measurement_id: int) -> str | None:
+    """URL превью фото измерения; None — измерения или файла нет"""
+    if Image is None:
+        raise RuntimeError("Превью недоступны: не установлен пакет Pillow")
+    with SessionLocal() as db:
+        measurement = db.get(Measurement, measurement_id)
+        if measurement is None or not measurement.media_url:
+            return None
+        source = media_file(measurement.media_url)
+    name = f"{measurement_id}-{secret_suffix('thumbnail', measurement_id)}.jpg"
+    target = os.path.join(settings.UPLOAD_DIR, "thumbnails", name)
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    size = (settings.THUMBNAIL_SIZE, settings.THUMBNAIL_SIZE)
+    with Image.open(source) as image:
+        image.draft("RGB", size)
+        thumbnail = ImageOps.exif_transpose(image)
+        thumbnail.thumbnail(size)
+        thumbnail.convert("RGB").save(target, "JPEG", quality=85)
+    return media_url(target)
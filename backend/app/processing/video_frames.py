@@ -0,0 +1,208 @@
+# backend/app/processing/video_frames.py
+# Отбор кадров из видео съёмки (измерение drone_video) для оценки биомассы.
+#
+# Выполняется заданием video_frames в процессах воркера очереди (app/jobs):
+# один файл — один процесс, кадры читаются потоком из контейнера и в памяти не копятся. Кадр берётся, если
+# с прошлого отобранного прошло VIDEO_FRAME_INTERVAL секунд или сменилась сцена
+# (средняя разница серых миниатюр 64x36 выше VIDEO_SCENE_THRESHOLD). Почти
+# дубликаты (зависший дрон) отбрасываются по dHash: расстояние Хэмминга до уже
+# сохранённых кадров не больше VIDEO_HASH_DISTANCE бит.
+#
+# Время кадра — смещение от начала видео; если в контейнере есть creation_time,
+# кадр получает абсолютное время и координаты, интерполированные по телеметрии дрона.
+import datetime
+import logging
+import math
+import os
+import time
+
+import numpy as np
+
+from core.config import settings
+from core.metrics import REGISTRY
+from database.bulk import bulk_insert
+from database.db import SessionLocal, engine
+from model.models import Measurement, MeasurementFrame
+from app.api.telemetry.crud.telemetry_crud import get_track_between
+from app.api.uploads.storage import media_file, media_url, secret_suffix
+
+try:
+    import av
+except ImportError:  # pragma: no cover
+    av = None
+
+logger = logging.getLogger(__name__)
+
+video_frames_total = REGISTRY.counter(
+    "video_frames_total", "Кадры видео съёмки", ("result",))
+video_decode_fps = REGISTRY.gauge(
+    "video_decode_fps", "Скорость декодирования последнего обработанного видео, кадров/с")
+
+THUMBNAIL = (64, 36)
+GPS_MAX_GAP = 5.0  # с: дальше от точек телеметрии координаты кадру не присваиваются
+
+
+class VideoError(ValueError):
+    """Видео не удаётся обработать целиком"""
+
+
+def dhash(gray: np.ndarray) -> int:
+    """Разностный хэш по серому кадру 9x8: бит — ярче ли пиксель соседа справа"""
+    bits = (gray[:, 1:] > gray[:, :-1]).ravel()
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+def _creation_time(container) -> datetime.datetime | None:
+    value = container.metadata.get("creation_time") or container.streams.video[0].metadata.get("creation_time")
+    if not value:
+        return None
+    try:
+        parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def extract_frames(path: str, out_dir: str, interval: float, scene_threshold: float,
+                   hash_distance: int, max_width: int) -> dict:
+    """Отобрать кадры в out_dir (JPEG)"""
+    if av is None:
+        raise VideoError("Обработка видео недоступна: не установлен пакет av (PyAV)")
+    try:
+        container = av.open(path)
+    except av.AVError as exc:
+        raise VideoError(f"Не удалось открыть видео: {exc}") from exc
+    os.makedirs(out_dir, exist_ok=True)
+    started = time.perf_counter()
+    frames, hashes = [], np.empty(0, dtype=np.uint64)
+    decoded = duplicates = 0
+    previous, last_taken, offset = None, -math.inf, 0.0
+    with container:
+        if not container.streams.video:
+            raise VideoError("В файле нет видеодорожки")
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        start_time = _creation_time(container)
+        try:
+            for frame in container.decode(stream):
+                decoded += 1
+                if frame.time is None:
+                    continue
+                offset = float(frame.time)
+                thumbnail = frame.to_ndarray(width=THUMBNAIL[0], height=THUMBNAIL[1], format="gray").astype(np.int16)
+                score = 1.0 if previous is None else float(np.abs(thumbnail - previous).mean()) / 255
+                previous = thumbnail
+                due = interval > 0 and offset - last_taken >= interval
+                cut = scene_threshold > 0 and score >= scene_threshold
+                if not (due or cut):
+                    continue
+                last_taken = offset
+
+                frame_hash = dhash(frame.to_ndarray(width=9, height=8, format="gray"))
+                if len(hashes) and np.bitwise_count(hashes ^ np.uint64(frame_hash)).min() <= hash_distance:
+                    duplicates += 1
+                    continue
+                hashes = np.append(hashes, np.uint64(frame_hash))
+
+                width, height = frame.width, frame.height
+                if width > max_width:
+                    width, height = max_width, round(height * max_width / width) // 2 * 2
+                name = f"{round(offset * 1000):09d}.jpg"
+                frame.to_image(width=width, height=height).save(os.path.join(out_dir, name), quality=90)
+                frames.append({"offset": offset, "file": name, "phash": f"{frame_hash:016x}",
+                               "scene_score": min(score, 1.0)})
+        except av.AVError as exc:
+            if not frames:
+                raise VideoError(f"Ошибка декодирования: {exc}") from exc
+            # обрезанный файл: оставляем то, что успели отобрать
+            logger.warning("Видео %s обрывается после %.1f с: %s", path, offset, exc)
+    elapsed = time.perf_counter() - started
+    return {
+        "frames": frames,
+        "decoded": decoded,
+        "duplicates": duplicates,
+        "duration": offset,
+        "seconds": elapsed,
+        "fps": decoded / elapsed if elapsed else 0.0,
+        "start_time": start_time,
+    }
+
+
+def frame_positions(db, drone_id: int | None, start_time: datetime.datetime | None,
+                    offsets: list[float]) -> list[tuple]:
+    """(captured_at, lat, lng) для каждого кадра; None там, где время или трек неизвестны"""
+    if start_time is None:
+        return [(None, None, None)] * len(offsets)
+    captured = [start_time + datetime.timedelta(seconds=o) for o in offsets]
+    if drone_id is None or not offsets:
+        return [(c, None, None) for c in captured]
+    margin = datetime.timedelta(seconds=GPS_MAX_GAP)
+    track = get_track_between(db, drone_id, captured[0] - margin, captured[-1] + margin)
+    if not track:
+        return [(c, None, None) for c in captured]
+    base = track[0][0]
+    at = np.array([(t - base).total_seconds() for t, _, _ in track])
+    lat = np.array([p[1] for p in track])
+    lng = np.array([p[2] for p in track])
+    x = np.array([(c - base).total_seconds() for c in captured])
+    # координаты — только рядом с точками трека, без экстраполяции через пропуски связи
+    right = np.searchsorted(at, x).clip(0, len(at) - 1)
+    left = (right - 1).clip(0, len(at) - 1)
+    known = np.minimum(np.abs(at[right] - x), np.abs(at[left] - x)) <= GPS_MAX_GAP
+    lats, lngs = np.interp(x, at, lat), np.interp(x, at, lng)
+    return [(c, float(a) if k else None, float(b) if k else None)
+            for c, a, b, k in zip(captured, lats, lngs, known)]
+
+
+def process_measurement_video(measurement_id: int) -> dict | None:
+    """Отобрать кадры видео измерения и записать их в measurement_frames"""
+    with SessionLocal() as db:
+        measurement = db.get(Measurement, measurement_id)
+        if measurement is None or measurement.method != "drone_video" or not measurement.media_url:
+            return None
+        path, drone_id = media_file(measurement.media_url), measurement.drone_id
+
+    relative = os.path.join("frames", f"{measurement_id}-{secret_suffix('frames', measurement_id)}")
+    try:
+        result = extract_frames(
+            path, os.path.join(settings.UPLOAD_DIR, relative),
+            settings.VIDEO_FRAME_INTERVAL, settings.VIDEO_SCENE_THRESHOLD,
+            settings.VIDEO_HASH_DISTANCE, settings.VIDEO_FRAME_MAX_WIDTH,
+        )
+    except VideoError as exc:
+        logger.warning("Видео измерения %s не обработано: %s", measurement_id, exc)
+        with SessionLocal() as db:
+            db.get(Measurement, measurement_id).status = "failed"
+            db.commit()
+        return None
+
+    frames = result["frames"]
+    video_frames_total.inc(("decoded",), result["decoded"])
+    video_frames_total.inc(("kept",), len(frames))
+    video_frames_total.inc(("duplicate",), result["duplicates"])
+    video_decode_fps.set(result["fps"])
+    logger.info("Видео измерения %s: %d кадров из %d за %.1f с (%.0f кадров/с)",
+                measurement_id, len(frames), result["decoded"], result["seconds"], result["fps"])
+
+    with SessionLocal() as db:
+        positions = frame_positions(db, drone_id, result["start_time"], [f["offset"] for f in frames])
+    now = datetime.datetime.utcnow()
+    rows = [{
+        "measurement_id": measurement_id,
+        "offset": frame["offset"],
+        "captured_at": captured_at,
+        "lat": lat,
+        "lng": lng,
+        "image_url": media_url(os.path.join(settings.UPLOAD_DIR, relative, frame["file"])),
+        "phash": frame["phash"],
+        "scene_score": frame["scene_score"],
+        "created_at": now,
+    } for frame, (captured_at, lat, lng) in zip(frames, positions)]
+    with engine.begin() as conn:
+        # повторная обработка заменяет прежние кадры
+        conn.execute(MeasurementFrame.__table__.delete().where(MeasurementFrame.measurement_id == measurement_id))
+        if rows:
+            bulk_insert(conn, MeasurementFrame.__table__, rows, columns=list(rows[0]))
+    return result
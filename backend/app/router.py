@@ -6,6 +6,14 @@ from app.api.farms.farm_api import router as farm_router
 from app.api.pastures.pasture_api import router as pasture_router
 from app.api.drones.drone_api import router as drone_router  
 from app.api.ai.ai_api import router as ai_router
+from app.api.imports.imports_api import router as imports_router
+from app.api.exports.exports_api import router as exports_router
+from app.api.sync.sync_api import router as sync_router
+from app.api.telemetry.telemetry_api import router as telemetry_router
+from app.api.fleet.fleet_api import router as fleet_router
+from app.api.missions.missions_api import router as missions_router
+from app.api.uploads.uploads_api import router as uploads_router
+from app.api.jobs.jobs_api import router as jobs_router
 
 router = APIRouter(prefix="/api")
 
@@ -13,4 +21,12 @@ router.include_router(user_router, prefix="/users")
 router.include_router(farm_router)
 router.include_router(pasture_router)
 router.include_router(drone_router)  
-router.include_router(ai_router)
\ No newline at end of file
+router.include_router(ai_router)
+router.include_router(imports_router)
+router.include_router(exports_router)
+router.include_router(sync_router)
+router.include_router(telemetry_router)
+router.include_router(fleet_router)
+router.include_router(missions_router)
+router.include_router(uploads_router)
+router.include_router(jobs_router)
\ No newline at end of file
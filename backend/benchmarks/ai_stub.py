@@ -0,0 +1,39 @@
+# backend/benchmarks/ai_stub.py
+# Заглушка OpenAI-совместимого API для нагрузочных тестов /api/ai/chat.
+#
+#   cd backend && python -m benchmarks.ai_stub --port 8099 --delay-ms 300
+#   OPENAI_API_KEY=stub OPENAI_BASE_URL=http://127.0.0.1:8099 gunicorn -c gunicorn_conf.py main:app
+import argparse
+import asyncio
+
+from aiohttp import web
+
+ANSWER = "Это тестовый ответ заглушки. Для оценки биомассы загрузите фото пастбища."
+
+
+def make_app(delay: float) -> web.Application:
+    async def chat_completions(request: web.Request):
+        await request.json()
+        if delay:
+            await asyncio.sleep(delay)
+        return web.json_response({
+            "id": "stub",
+            "object": "chat.completion",
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": ANSWER}, "finish_reason": "stop"}],
+        })
+
+    app = web.Application()
+    app.router.add_post("/chat/completions", chat_completions)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--delay-ms", type=float, default=0, help="имитация задержки модели")
+    args = parser.parse_args()
+    web.run_app(make_app(args.delay_ms / 1000), host="127.0.0.1", port=args.port)
+
+
+if __name__ == "__main__":
+    main()
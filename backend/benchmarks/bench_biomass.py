@@ -0,0 +1,83 @@
+# backend/benchmarks/bench_biomass.py
+# Оценка биомассы по снимкам: синтетические JPEG «травостоя» с известной долей
+# зелени (пятна травы на почве) обрабатываются пачками разного размера.
+# Печатает снимков в секунду (всего и отдельно декодирование / признаки) и
+# ошибку проективного покрытия относительно заданного.
+#
+#   cd backend && python -m benchmarks.bench_biomass --images 64 --width 4000 --height 3000
+#
+# Нужны Pillow и numpy; БД не нужна.
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from app.processing.biomass import estimate_images, extract_features, load_calibration, load_image
+
+
+def write_photo(path: str, width: int, height: int, cover: float, seed: int):
+    """Почва с пятнами травы; доля травы примерно cover"""
+    rng = np.random.default_rng(seed)
+    cell = 32  # куртина ~ 5-10 см при съёмке с 30 м
+    mask = rng.random((height // cell + 1, width // cell + 1)) < cover
+    mask = mask.repeat(cell, axis=0).repeat(cell, axis=1)[:height, :width]
+    shade = rng.integers(0, 40, (height, width), dtype=np.uint8)
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[..., 0] = np.where(mask, 80, 130) + shade
+    image[..., 1] = np.where(mask, 115, 110) + shade
+    image[..., 2] = np.where(mask, 50, 90) + shade
+    Image.fromarray(image).save(path, "JPEG", quality=90)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--images", type=int, default=64)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 8, 32])
+    args = parser.parse_args()
+
+    calibration = load_calibration()
+    workdir = tempfile.mkdtemp(prefix="kokmaisa-biomass-")
+    try:
+        covers = np.linspace(0.1, 0.9, args.images)
+        paths = []
+        for i, cover in enumerate(covers):
+            path = os.path.join(workdir, f"photo-{i}.jpg")
+            write_photo(path, args.width, args.height, cover, seed=i)
+            paths.append(path)
+        size_mb = sum(os.path.getsize(p) for p in paths) / len(paths) / 1024 / 1024
+        print(f"снимки: {args.images} шт. {args.width}x{args.height}, {size_mb:.1f} МБ в среднем, "
+              f"калибровка {calibration['version']}")
+
+        started = time.perf_counter()
+        images = np.stack([load_image(path, calibration["image_size"]) for path in paths])
+        decode = time.perf_counter() - started
+        print(f"декодирование: {args.images / decode:8.1f} снимков/с")
+
+        print(f"{'пачка':>6} {'признаки, сн/с':>15} {'всего, сн/с':>12}")
+        for batch_size in args.batches:
+            started = time.perf_counter()
+            for start in range(0, args.images, batch_size):
+                extract_features(images[start:start + batch_size], calibration["exg_threshold"])
+            features = time.perf_counter() - started
+            started = time.perf_counter()
+            results = estimate_images(paths, calibration, batch_size)
+            total = time.perf_counter() - started
+            print(f"{batch_size:6} {args.images / features:15.1f} {args.images / total:12.1f}")
+
+        estimated = np.array([r["canopy_cover"] for r in results])
+        biomass = np.array([r["biomass"] for r in results])
+        print(f"покрытие: средняя ошибка {np.abs(estimated - covers).mean() * 100:.1f} п.п.; "
+              f"биомасса {biomass.min():.0f}..{biomass.max():.0f} кг/га, "
+              f"растёт с покрытием: {bool(np.all(np.diff(biomass) > 0))}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# backend/benchmarks/bench_bulk.py
+# Онбординг крупного хозяйства: N пастбищ последовательными POST /api/pastures/
+# против одного POST /api/pastures/bulk. Последовательный путь меряется на выборке
+# (--sample) и пересчитывается на N.
+#
+#   cd backend && python -m benchmarks.bench_bulk --items 10000
+#
+# Использует DATABASE_URL из .env; создаёт отдельного фермера с одной фермой.
+import argparse
+import datetime
+import time
+
+from fastapi.testclient import TestClient
+
+from benchmarks.bench_conditional_get import seed
+from core.security import create_access_token
+from database.db import SessionLocal
+from main import app
+from model.models import Farm
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=10_000)
+    parser.add_argument("--sample", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id = seed(1)
+    with SessionLocal() as db:
+        farm_id = db.query(Farm.id).filter(Farm.owner_id == user_id).scalar()
+    token = create_access_token({"user_id": user_id}, datetime.timedelta(minutes=30))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def item(i: int) -> dict:
+        return {"farm_id": farm_id, "name": f"Участок {i}", "area": 10 + i % 90, "pasture_type": "степное",
+                "coordinates_lat": 51.1, "coordinates_lng": 71.4}
+
+    with TestClient(app) as client:
+        started = time.perf_counter()
+        for i in range(args.sample):
+            assert client.post("/api/pastures/", json=item(i), headers=headers).status_code == 201
+        sequential = (time.perf_counter() - started) / args.sample * args.items
+
+        started = time.perf_counter()
+        resp = client.post("/api/pastures/bulk", json={"items": [item(i) for i in range(args.items)]}, headers=headers)
+        bulk = time.perf_counter() - started
+        assert resp.status_code == 200 and resp.json()["failed"] == 0, resp.text[:500]
+
+    print(f"последовательно ({args.sample} шт., пересчёт на {args.items}): {sequential:8.2f} с")
+    print(f"пачкой ({args.items} шт.):                          {bulk:8.2f} с  (x{sequential / bulk:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# backend/benchmarks/bench_conditional_get.py
+# Байты на проводе и время обработки для списков ферм/пастбищ/дронов:
+# без сжатия, gzip, brotli и повторный запрос с If-None-Match (304).
+#
+#   cd backend && python -m benchmarks.bench_conditional_get --farms 500
+#
+# Использует DATABASE_URL из .env; создаёт отдельного фермера с фермами.
+import argparse
+import datetime
+import time
+import uuid
+
+from fastapi.testclient import TestClient
+
+from core.security import create_access_token
+from database.bulk import bulk_insert
+from database.db import engine
+from main import app
+from model.models import Drone, Farm, Pasture, User
+
+
+def seed(farms: int) -> int:
+    suffix = uuid.uuid4().hex[:10]
+    now = datetime.datetime.utcnow()
+    with engine.begin() as conn:
+        user_id = conn.execute(User.__table__.insert().values(
+            full_name="Bench", phone=f"+7{suffix}", email=f"etag-{suffix}@kokmaisa.kz", hashed_password="x",
+            account_type="farmer", country="Казахстан", city="Астана",
+        )).inserted_primary_key[0]
+        farm_ids = []
+        for i in range(farms):
+            farm_ids.append(conn.execute(Farm.__table__.insert().values(
+                owner_id=user_id, name=f"КХ {i}", address="с. Акмол", region="Акмолинская", area=1000 + i,
+                description="Смешанное хозяйство, отгонное животноводство. " * 4,
+                coordinates_lat=51.1, coordinates_lng=71.4, owner_iin="990101300123", farm_type="mixed",
+                crops=["пшеница", "ячмень", "люцерна"], equipment=["трактор", "сеялка", "косилка"],
+                photos=[f"/uploads/farms/{i}_{n}.jpg" for n in range(3)], status="active",
+                created_at=now, updated_at=now,
+            )).inserted_primary_key[0])
+        bulk_insert(conn, Pasture.__table__, ({
+            "farm_id": farm_id, "name": f"Пастбище {farm_id}", "area": 50.0, "pasture_type": "степное",
+            "coordinates_lat": 51.1, "coordinates_lng": 71.4, "status": "active", "created_at": now, "updated_at": now,
+        } for farm_id in farm_ids), columns=["farm_id", "name", "area", "pasture_type", "coordinates_lat", "coordinates_lng", "status", "created_at", "updated_at"])
+        bulk_insert(conn, Drone.__table__, ({
+            "farm_id": farm_id, "model": "DJI Mavic 3", "serial_number": f"{suffix}-{farm_id}", "status": "active",
+            "created_at": now, "updated_at": now,
+        } for farm_id in farm_ids[:100]), columns=["farm_id", "model", "serial_number", "status", "created_at", "updated_at"])
+    return user_id
+
+
+def timed(client: TestClient, path: str, headers: dict, repeat: int):
+    best = float("inf")
+    resp = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        resp = client.get(path, headers=headers)
+        best = min(best, time.perf_counter() - started)
+    wire = int(resp.headers.get("content-length", len(resp.content)))
+    return resp, wire, best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--farms", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    user_id = seed(args.farms)
+    token = create_access_token({"user_id": user_id}, datetime.timedelta(minutes=30))
+    auth = {"Authorization": f"Bearer {token}"}
+
+    print(f"{'эндпоинт':18} {'вариант':16} {'статус':>6} {'байт':>10} {'мс/запрос':>10}")
+    with TestClient(app) as client:
+        for path in ("/api/farms/", "/api/pastures/?limit=1000", "/api/drones/"):
+            resp, _, _ = timed(client, path, {**auth, "Accept-Encoding": "identity"}, 1)
+            etag = resp.headers["etag"]
+            for label, extra in (
+                ("без сжатия", {"Accept-Encoding": "identity"}),
+                ("gzip", {"Accept-Encoding": "gzip"}),
+                ("brotli", {"Accept-Encoding": "br"}),
+                ("If-None-Match", {"Accept-Encoding": "br", "If-None-Match": etag}),
+            ):
+                resp, wire, ms = timed(client, path, {**auth, **extra}, args.repeat)
+                print(f"{path.split('?')[0]:18} {label:16} {resp.status_code:>6} {wire:>10} {ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
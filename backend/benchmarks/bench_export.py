@@ -0,0 +1,74 @@
+# backend/benchmarks/bench_export.py
+# Пропускная способность экспорта измерений на миллионах строк: строк/с, МБ/с
+# и пиковая память для CSV, NDJSON и Parquet.
+#
+#   cd backend && python -m benchmarks.bench_export --rows 2000000
+#
+# Использует DATABASE_URL из .env; создаёт фермера с одной фермой и пастбищем
+# и заливает --rows измерений через bulk_insert (COPY в PostgreSQL).
+import argparse
+import datetime
+import random
+import resource
+import time
+
+from benchmarks.bench_conditional_get import seed
+from database.bulk import bulk_insert
+from database.db import SessionLocal, engine
+from model.models import Measurement, Pasture, User
+from app.api.exports.crud.export_crud import export_query, stream_partitions
+from app.api.exports.writers import WRITERS
+
+
+def seed_measurements(rows: int) -> User:
+    user_id = seed(1)
+    with SessionLocal() as db:
+        user = db.get(User, user_id)
+        pasture_id = db.query(Pasture.id).join(Pasture.farm).filter_by(owner_id=user_id).scalar()
+        db.expunge(user)
+
+    rnd = random.Random(7)
+    start = datetime.datetime(2025, 4, 1)
+
+    def generate():
+        for i in range(rows):
+            at = start + datetime.timedelta(minutes=i)
+            yield {
+                "pasture_id": pasture_id, "method": "drone_video", "status": "completed",
+                "biomass_value": rnd.uniform(300, 4000), "ndvi_value": rnd.uniform(0.1, 0.9),
+                "coverage_percent": rnd.uniform(20, 100), "quality_score": rnd.uniform(0, 1),
+                "description": None, "media_url": f"/uploads/measurements/{i}.mp4",
+                "measured_at": at, "created_at": at, "updated_at": at,
+            }
+
+    with engine.begin() as conn:
+        bulk_insert(conn, Measurement.__table__, generate(), chunk_size=50_000)
+    return user
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--yield-per", type=int, default=5000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    user = seed_measurements(args.rows)
+    print(f"заливка {args.rows:,} измерений: {time.perf_counter() - started:.1f} с, "
+          f"пик RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} МБ")
+
+    query = export_query("measurements", user)
+    columns = list(query.selected_columns)
+    print(f"{'формат':8} {'строк/с':>12} {'МБ/с':>8} {'МБ всего':>9} {'пик RSS, МБ':>12}")
+    for name, writer in WRITERS.items():
+        total = 0
+        started = time.perf_counter()
+        for chunk in writer(columns, stream_partitions(query, args.yield_per)):
+            total += len(chunk)
+        elapsed = time.perf_counter() - started
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{name:8} {args.rows / elapsed:12,.0f} {total / elapsed / 1e6:8.1f} {total / 1e6:9.1f} {peak:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+# backend/benchmarks/bench_fleet.py
+# Задержка рассылки живого состояния парка: clients подписчиков у owners владельцев,
+# поток точек телеметрии rate точек/с. Задержка — от recorded_at точки (ставится
+# в момент отправки) до получения diff с ней. Доля slow клиентов читает медленно:
+# за счёт схлопывания они получают меньше сообщений, но свежее состояние.
+#
+#   cd backend && python -m benchmarks.bench_fleet --clients 1000                 # в процессе, без сети
+#   python -m benchmarks.bench_fleet --clients 1000 --base-url http://127.0.0.1:8000   # живые WebSocket
+#
+# Живые клиенты подключаются с window=1 и подтверждают каждое сообщение.
+#
+# Использует DATABASE_URL из .env; создаёт owners фермеров по drones дронов.
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import time
+
+import httpx
+import orjson
+
+from benchmarks.bench_conditional_get import seed
+from benchmarks.loadgen import percentile
+from core.security import create_access_token
+from database.db import SessionLocal
+from app.api.fleet.crud.fleet_crud import owner_drones
+from app.api.fleet.fleet_state import fleet_state
+
+
+class Client:
+    def __init__(self, slow_delay: float):
+        self.slow_delay = slow_delay
+        self.latency: list[float] = []
+        self.messages = 0
+
+    def receive(self, message: dict):
+        self.messages += 1
+        now = time.time()
+        recorded = message["drones"]
+        self.latency.extend(now - row[-1] for row in recorded if row[-1])
+
+
+def make_points(drone_ids: list[int], count: int, rng: random.Random) -> list[dict]:
+    now = datetime.datetime.utcnow()
+    return [{
+        "drone_id": rng.choice(drone_ids), "recorded_at": now,
+        "lat": 51.1 + rng.random() * 0.01, "lng": 71.4 + rng.random() * 0.01,
+        "altitude": 80.0, "battery": 75.0, "speed": 10.0, "heading": 90.0,
+    } for _ in range(count)]
+
+
+async def produce(owners: dict[int, list[int]], args, deadline: float, post=None):
+    rng = random.Random(1)
+    tick = 0.05
+    per_tick = max(1, int(args.rate * tick / len(owners)))
+    updates = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        batches = {owner_id: make_points(drone_ids, per_tick, rng) for owner_id, drone_ids in owners.items()}
+        if post is None:
+            for owner_id, points in batches.items():
+                fleet_state.apply_points(owner_id, points)
+        else:
+            await asyncio.gather(*(post(owner_id, points) for owner_id, points in batches.items()))
+        updates += sum(len(points) for points in batches.values())
+        await asyncio.sleep(max(0.0, tick - (time.perf_counter() - started)))
+    return updates
+
+
+async def local_client(client: Client, owner_id: int, ready: asyncio.Event):
+    subscription = fleet_state.subscribe(owner_id)
+    ready.set()
+    try:
+        async for message in fleet_state.updates(subscription):
+            client.receive(orjson.loads(orjson.dumps(message)))  # та же сериализация, что в эндпоинте
+            if client.slow_delay:
+                await asyncio.sleep(client.slow_delay)
+    finally:
+        fleet_state.unsubscribe(subscription)
+
+
+async def remote_client(client: Client, base_url: str, token: str, ready: asyncio.Event):
+    import websockets
+
+    url = base_url.replace("http", "ws", 1) + f"/api/fleet/ws?token={token}&window=1"
+    async with websockets.connect(url, max_size=None) as ws:
+        await ws.recv()  # снимок
+        ready.set()
+        async for raw in ws:
+            client.receive(json.loads(raw))
+            if client.slow_delay:
+                await asyncio.sleep(client.slow_delay)
+            await ws.send("ack")
+
+
+async def run(args, owners: dict[int, list[int]], tokens: dict[int, str]) -> tuple[list[Client], int]:
+    clients, tasks, ready = [], [], []
+    owner_ids = list(owners)
+    for i in range(args.clients):
+        owner_id = owner_ids[i % len(owner_ids)]
+        client = Client(args.slow_delay if i < args.clients * args.slow else 0.0)
+        event = asyncio.Event()
+        clients.append(client)
+        ready.append(event)
+        if args.base_url:
+            tasks.append(asyncio.create_task(remote_client(client, args.base_url, tokens[owner_id], event)))
+        else:
+            tasks.append(asyncio.create_task(local_client(client, owner_id, event)))
+    await asyncio.gather(*(event.wait() for event in ready))
+
+    deadline = time.perf_counter() + args.seconds
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as http:
+            async def post(owner_id, points):
+                body = [{**p, "recorded_at": p["recorded_at"].isoformat()} for p in points]
+                await http.post("/api/telemetry", json={"points": body},
+                                headers={"Authorization": f"Bearer {tokens[owner_id]}"})
+            updates = await produce(owners, args, deadline, post)
+    else:
+        updates = await produce(owners, args, deadline)
+    await asyncio.sleep(0.5)  # последние сообщения
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return clients, updates
+
+
+def report(label: str, clients: list[Client], seconds: float):
+    if not clients:
+        return
+    latency = sorted(x for c in clients for x in c.latency)
+    messages = sum(c.messages for c in clients) / len(clients) / seconds
+    print(f"{label:10} клиентов={len(clients):5} сообщений/с на клиента={messages:7.1f} "
+          f"p50={percentile(latency, 50) * 1000:7.1f} мс p95={percentile(latency, 95) * 1000:7.1f} мс "
+          f"p99={percentile(latency, 99) * 1000:7.1f} мс")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--owners", type=int, default=20)
+    parser.add_argument("--drones", type=int, default=20, help="дронов у каждого владельца")
+    parser.add_argument("--rate", type=int, default=2000, help="точек телеметрии в секунду на всех")
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--slow", type=float, default=0.1, help="доля медленных клиентов")
+    parser.add_argument("--slow-delay", type=float, default=0.5, help="пауза медленного клиента после сообщения, с")
+    parser.add_argument("--base-url", default="")
+    args = parser.parse_args()
+
+    owners, tokens = {}, {}
+    for _ in range(args.owners):
+        user_id = seed(args.drones)
+        with SessionLocal() as db:
+            drones = owner_drones(db, user_id)
+        fleet_state.register(user_id, drones)
+        owners[user_id] = [drone_id for drone_id, _ in drones]
+        tokens[user_id] = create_access_token({"user_id": user_id}, datetime.timedelta(hours=1))
+
+    clients, updates = asyncio.run(run(args, owners, tokens))
+    where = args.base_url or "в процессе"
+    print(f"{args.clients} подписчиков, {args.owners} владельцев × {args.drones} дронов, "
+          f"{updates / args.seconds:,.0f} точек/с ({where})")
+    report("быстрые", [c for c in clients if not c.slow_delay], args.seconds)
+    report("медленные", [c for c in clients if c.slow_delay], args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# backend/benchmarks/bench_geofence.py
+# Пропускная способность геозон: синтетическая сетка пастбищ-многоугольников
+# и случайные точки телеметрии. Меряется locate() индекса и полный проход
+# GeofenceEngine.process() (сортировка по дронам, переходы, события) на одном ядре;
+# результат locate сверяется с перебором всех полигонов на выборке.
+#
+#   cd backend && python -m benchmarks.bench_geofence --pastures 10000 --points 100000
+#
+# БД не нужна: индекс строится из сгенерированных границ.
+import argparse
+import datetime
+import math
+import time
+
+import numpy as np
+
+from app.api.telemetry.geofence import GeofenceEngine
+from core.geo import PolygonIndex
+
+
+def make_pastures(count: int, vertices: int, seed: int = 1) -> list[tuple[int, int, dict]]:
+    """Неправильные многоугольники в ячейках сетки ~1 км вокруг Астаны, по 10 на ферму"""
+    rng = np.random.default_rng(seed)
+    side = math.ceil(math.sqrt(count))
+    step = 0.01
+    rows = []
+    for n in range(count):
+        cx, cy = 71.0 + (n % side) * step, 51.0 + (n // side) * step
+        angles = np.sort(rng.uniform(0, 2 * math.pi, vertices))
+        radius = rng.uniform(0.25, 0.5, vertices) * step
+        ring = np.column_stack([cx + radius * np.cos(angles), cy + radius * np.sin(angles)]).tolist()
+        ring.append(ring[0])
+        rows.append((n + 1, n // 10 + 1, {"type": "Polygon", "coordinates": [ring]}))
+    return rows
+
+
+def brute_force(rows, lng: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    """Каждый полигон против всех точек выборки, без индекса"""
+    result = np.full(len(lng), -1)
+    for position, (_, _, geometry) in enumerate(rows):
+        ring = np.asarray(geometry["coordinates"][0])
+        inside = np.zeros(len(lng), dtype=bool)
+        for (x1, y1), (x2, y2) in zip(ring[:-1], ring[1:]):
+            if y1 == y2:
+                continue
+            inside ^= ((y1 > lat) != (y2 > lat)) & (lng < x1 + (lat - y1) * (x2 - x1) / (y2 - y1))
+        result[inside & (result == -1)] = position
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pastures", type=int, default=10_000)
+    parser.add_argument("--vertices", type=int, default=24)
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--drones", type=int, default=500)
+    parser.add_argument("--check", type=int, default=2000, help="точек для сверки с перебором")
+    args = parser.parse_args()
+
+    rows = make_pastures(args.pastures, args.vertices)
+    started = time.perf_counter()
+    index = PolygonIndex([r[0] for r in rows], [r[2] for r in rows])
+    print(f"индекс: {args.pastures} пастбищ x {args.vertices} вершин за {time.perf_counter() - started:.2f} с")
+
+    rng = np.random.default_rng(2)
+    side = math.ceil(math.sqrt(args.pastures)) * 0.01
+    lng = rng.uniform(71.0 - 0.005, 71.0 + side, args.points)
+    lat = rng.uniform(51.0 - 0.005, 51.0 + side, args.points)
+
+    started = time.perf_counter()
+    located = index.locate(lng, lat)
+    elapsed = time.perf_counter() - started
+    print(f"locate: {args.points / elapsed:12,.0f} точек/с  (внутри пастбищ {np.mean(located >= 0):.0%})")
+
+    sample = rng.choice(args.points, min(args.check, args.points), replace=False)
+    mismatches = int(np.sum(brute_force(rows, lng[sample], lat[sample]) != located[sample]))
+    print(f"сверка с перебором: {len(sample)} точек, расхождений {mismatches}")
+
+    engine = GeofenceEngine(loader=lambda: rows)
+    engine.build()
+    drone_farms = {d: d % (args.pastures // 10 + 1) + 1 for d in range(1, args.drones + 1)}
+    start = datetime.datetime(2026, 1, 1)
+    # дроны летят по прямым — переходы между соседними пастбищами
+    per_drone = args.points // args.drones
+    points = []
+    for d in range(1, args.drones + 1):
+        x0, y0 = rng.uniform(71.0, 71.0 + side), rng.uniform(51.0, 51.0 + side)
+        for k in range(per_drone):
+            points.append({"drone_id": d, "recorded_at": start + datetime.timedelta(seconds=k),
+                           "lng": x0 + k * 2e-4, "lat": y0})
+    batch = 5000
+    events = 0
+    started = time.perf_counter()
+    for i in range(0, len(points), batch):
+        events += len(engine.process(points[i:i + batch], drone_farms))
+    elapsed = time.perf_counter() - started
+    print(f"process: {len(points) / elapsed:11,.0f} точек/с  (пачки по {batch}, событий {events})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# backend/benchmarks/bench_hot_paths.py
+# Микробенчмарки функций, которые выполняются на каждом запросе.
+#
+#   cd backend && python -m benchmarks.bench_hot_paths            # сравнить с baseline
+#   cd backend && python -m benchmarks.bench_hot_paths --save     # перезаписать baseline
+#
+# Завершается с кодом 1, если какой-то случай медленнее baseline больше чем в --threshold раз.
+# Baseline зависит от машины: сохраняйте его на той же машине, где гоняете сравнение (CI-раннер).
+import argparse
+import base64
+import datetime
+import json
+import os
+import platform
+import sys
+import timeit
+from pathlib import Path
+
+from jose import jwt
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.config import settings
+from core.security import create_access_token, get_current_user
+from database.db import Base
+from model.models import Farm, User
+from app.api.farms.schemas.farm_schemas import FarmResponse
+from app.api.users.schemas.user_schemas import UserRead
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "hot_paths.json"
+
+
+def make_cases() -> dict:
+    now = datetime.datetime(2026, 1, 1, 12, 0)
+    user = User(
+        id=1, full_name="Айгерим Нурланова", phone="+77001234567", email="farmer@kokmaisa.kz",
+        hashed_password="x", account_type="farmer", country="Казахстан", city="Астана",
+        created_at=now, profile_photo="/uploads/profile_photos/a.jpg", education=None, specializations=None,
+    )
+    farm = Farm(
+        id=1, owner_id=1, name="КХ Береке", address="с. Акмол", region="Акмолинская", area=1250.5,
+        description="Смешанное хозяйство " * 10, coordinates_lat=51.12, coordinates_lng=71.43,
+        phone="+77011234567", owner_name="Айгерим", owner_iin="990101300123", farm_type="mixed",
+        established_date=datetime.date(2010, 5, 1), crops=["пшеница", "ячмень", "люцерна"],
+        equipment=["трактор", "сеялка"], status="active", photos=["/uploads/farms/1.jpg", "/uploads/farms/2.jpg"],
+        created_at=now, updated_at=now,
+    )
+
+    token = create_access_token({"user_id": 1}, datetime.timedelta(minutes=30))
+
+    # get_current_user целиком: декод JWT + выборка пользователя из БД (SQLite в памяти)
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    db = sessionmaker(bind=engine)()
+    db.add(User(**{c.name: getattr(user, c.name) for c in User.__table__.columns}))
+    db.commit()
+
+    photo_base64 = base64.b64encode(os.urandom(1024 * 1024)).decode()
+
+    return {
+        "create_access_token": lambda: create_access_token({"user_id": 1}, datetime.timedelta(minutes=30)),
+        "jwt_decode": lambda: jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM]),
+        "user_read_model_validate": lambda: UserRead.model_validate(user),
+        "farm_response_serialize": lambda: FarmResponse.model_validate(farm).model_dump_json(),
+        "get_current_user": lambda: get_current_user(token, db),
+        "photo_base64_decode_1mb": lambda: base64.b64decode(photo_base64),
+    }
+
+
+def measure(func, repeat: int) -> float:
+    """Лучшее время одного вызова, мкс"""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--save", action="store_true", help="сохранить результаты как baseline")
+    parser.add_argument("--threshold", type=float, default=1.25, help="допустимое замедление относительно baseline")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("-k", default=None, help="запустить только случаи, содержащие подстроку")
+    args = parser.parse_args()
+
+    cases = {name: func for name, func in make_cases().items() if not args.k or args.k in name}
+    baseline = json.loads(BASELINE_PATH.read_text())["cases"] if BASELINE_PATH.exists() else {}
+
+    results = {}
+    regressions = []
+    for name, func in cases.items():
+        value = measure(func, args.repeat)
+        results[name] = {"us_per_op": round(value, 3)}
+        base = baseline.get(name, {}).get("us_per_op")
+        if base:
+            ratio = value / base
+            flag = "  РЕГРЕССИЯ" if ratio > args.threshold else ""
+            print(f"{name:28} {value:10.2f} мкс  (baseline {base:.2f}, x{ratio:.2f}){flag}")
+            if ratio > args.threshold:
+                regressions.append(name)
+        else:
+            print(f"{name:28} {value:10.2f} мкс  (нет baseline)")
+
+    if args.save:
+        BASELINE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        saved = {name: baseline[name] for name in baseline if name not in results}
+        saved.update(results)
+        BASELINE_PATH.write_text(json.dumps({
+            "machine": {"python": platform.python_version(), "platform": platform.platform(), "processor": platform.processor()},
+            "cases": saved,
+        }, indent=2, ensure_ascii=False) + "\n")
+        print(f"Baseline сохранён в {BASELINE_PATH}")
+    elif regressions:
+        print(f"Регрессии (порог x{args.threshold}): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# backend/benchmarks/bench_import.py
+# Импорт пастбищ из CSV и GeoJSON растущего размера: строк в секунду и пиковая
+# память процесса. При потоковом чтении пик не должен расти вместе с файлом.
+#
+#   cd backend && python -m benchmarks.bench_import --rows 20000 100000
+#
+# Использует DATABASE_URL из .env; создаёт отдельного фермера с одной фермой.
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+
+from benchmarks.bench_conditional_get import seed
+from database.db import SessionLocal
+from model.models import Farm, ImportJob
+from app.api.imports.importer import run_import
+
+
+def write_csv(path: str, rows: int, farm_id: int):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("farm_id;name;area;pasture_type;coordinates_lat;coordinates_lng;description\n")
+        for i in range(rows):
+            f.write(f"{farm_id};Участок {i};{10 + i % 90};степное;51.{i % 1000:03d};71.{i % 997:03d};Сенокос, выпас КРС\n")
+
+
+def write_geojson(path: str, rows: int, farm_id: int):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"type": "FeatureCollection", "features": [\n')
+        for i in range(rows):
+            ring = [[71 + i * 1e-4, 51], [71.01 + i * 1e-4, 51], [71.01 + i * 1e-4, 51.01], [71 + i * 1e-4, 51]]
+            feature = {"type": "Feature", "properties": {"farm_id": farm_id, "name": f"Участок {i}", "area": 10 + i % 90},
+                       "geometry": {"type": "Polygon", "coordinates": [ring]}}
+            f.write(("," if i else "") + json.dumps(feature, ensure_ascii=False) + "\n")
+        f.write("]}\n")
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[20_000, 100_000])
+    args = parser.parse_args()
+
+    user_id = seed(1)
+    with SessionLocal() as db:
+        farm_id = db.query(Farm.id).filter(Farm.owner_id == user_id).scalar()
+
+    print(f"{'формат':8} {'строк':>8} {'МБ файла':>9} {'строк/с':>10} {'пик RSS, МБ':>12}")
+    for file_format, suffix, writer in (("csv", ".csv", write_csv), ("geojson", ".geojson", write_geojson)):
+        for rows in sorted(args.rows):
+            fd, path = tempfile.mkstemp(suffix=suffix)
+            os.close(fd)
+            writer(path, rows, farm_id)
+            size_mb = os.path.getsize(path) / 1024 / 1024
+            with SessionLocal() as db:
+                job = ImportJob(owner_id=user_id, kind="pastures", file_format=file_format, status="pending",
+                                progress=0.0, processed_rows=0, inserted_rows=0, error_count=0)
+                db.add(job)
+                db.commit()
+                job_id = job.id
+
+            started = time.perf_counter()
+            run_import(job_id, path)  # удаляет файл по завершении
+            elapsed = time.perf_counter() - started
+            with SessionLocal() as db:
+                job = db.get(ImportJob, job_id)
+                assert job.status == "completed" and job.inserted_rows == rows, (job.status, job.message)
+            print(f"{file_format:8} {rows:8} {size_mb:9.1f} {rows / elapsed:10,.0f} {peak_rss_mb():12.1f}")
+
+
+if __name__ == "__main__":
+    main()
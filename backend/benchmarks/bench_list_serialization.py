@@ -0,0 +1,105 @@
+# backend/benchmarks/bench_list_serialization.py
+# Сериализация списков из 10k элементов: прежний путь (ORM-объекты -> response_model
+# FastAPI -> JSONResponse) против быстрого (строки из колонок -> ListSerializer).
+#
+#   cd backend && python -m benchmarks.bench_list_serialization --rows 10000
+import argparse
+import asyncio
+import datetime
+import time
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.serialization import ListSerializer
+from database.bulk import bulk_insert
+from database.db import Base
+from model.models import Drone, Farm, Pasture, User
+from app.api.drones.schemas.drone_schemas import DroneResponse
+from app.api.farms.schemas.farm_schemas import FarmResponse
+from app.api.pastures.schemas.pasture_schemas import PastureResponse
+
+
+def make_session(rows: int):
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    now = datetime.datetime(2026, 5, 1, 10, 30)
+    with engine.begin() as conn:
+        bulk_insert(conn, User.__table__, [{
+            "id": 1, "full_name": "Bench", "phone": "+7", "email": "b@kokmaisa.kz", "hashed_password": "x",
+            "account_type": "farmer", "country": "Казахстан", "city": "Астана",
+        }])
+        bulk_insert(conn, Farm.__table__, ({
+            "id": i, "owner_id": 1, "name": f"КХ {i}", "address": "с. Акмол", "region": "Акмолинская",
+            "area": 1200.5, "description": "Смешанное хозяйство " * 8, "coordinates_lat": 51.1, "coordinates_lng": 71.4,
+            "phone": "+77011234567", "owner_name": "Владелец", "owner_iin": "990101300123", "farm_type": "mixed",
+            "established_date": datetime.date(2010, 5, 1), "crops": ["пшеница", "ячмень"], "equipment": ["трактор"],
+            "status": "active", "photos": ["/uploads/farms/1.jpg"], "created_at": now, "updated_at": now,
+        } for i in range(1, rows + 1)))
+        bulk_insert(conn, Pasture.__table__, ({
+            "id": i, "farm_id": i, "name": f"Пастбище {i}", "area": 50.0, "pasture_type": "степное",
+            "coordinates_lat": 51.1, "coordinates_lng": 71.4, "description": None, "status": "active",
+            "created_at": now, "updated_at": now,
+        } for i in range(1, rows + 1)))
+        bulk_insert(conn, Drone.__table__, ({
+            "id": i, "farm_id": i, "model": "DJI Mavic 3", "serial_number": f"SN-{i}", "status": "active",
+            "description": None, "created_at": now, "updated_at": now,
+        } for i in range(1, rows + 1)))
+    return sessionmaker(bind=engine)()
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    db = make_session(args.rows)
+    loop = asyncio.new_event_loop()
+    print(f"{'список':10} {'путь':32} {'сериализация, строк/с':>24} {'запрос+сериализация, строк/с':>30}")
+
+    for name, model, schema in (("farms", Farm, FarmResponse), ("pastures", Pasture, PastureResponse), ("drones", Drone, DroneResponse)):
+        field = create_response_field(name="response", type_=list[schema])
+        serializer = ListSerializer(schema, model)
+
+        orm_rows = db.query(model).all()
+        column_rows = [dict(r) for r in db.execute(select(*serializer.columns)).mappings()]
+
+        def before(objects):
+            content = loop.run_until_complete(serialize_response(field=field, response_content=objects))
+            return JSONResponse(content).body
+
+        def before_full():
+            db.expunge_all()
+            return before(db.query(model).all())
+
+        def after(rows):
+            return serializer.response(rows).body
+
+        def after_full():
+            return after([dict(r) for r in db.execute(select(*serializer.columns)).mappings()])
+
+        assert before(orm_rows) == after(column_rows), "ответы должны совпадать байт в байт"
+
+        for label, only, full in (("ORM + response_model", lambda: before(orm_rows), before_full),
+                                  ("колонки + ListSerializer", lambda: after(column_rows), after_full)):
+            ser = args.rows / best_of(only, args.repeat)
+            total = args.rows / best_of(full, args.repeat)
+            print(f"{name:10} {label:32} {ser:24,.0f} {total:30,.0f}")
+
+
+if __name__ == "__main__":
+    main()
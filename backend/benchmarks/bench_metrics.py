@@ -0,0 +1,67 @@
+# backend/benchmarks/bench_metrics.py
+# Накладные расходы MetricsMiddleware на один запрос (цель — меньше 20 мкс).
+#
+#   cd backend && python -m benchmarks.bench_metrics
+import argparse
+import asyncio
+import sys
+import time
+
+from core.metrics import MetricsMiddleware
+
+
+async def endpoint():
+    pass
+
+
+class FakeRoute:
+    path = "/api/farms/{farm_id}"
+    endpoint = staticmethod(endpoint)
+
+
+class FakeApp:
+    routes = [FakeRoute()]
+
+
+async def bare_app(scope, receive, send):
+    # Имитирует роутер Starlette: выставляет endpoint и отвечает
+    scope["endpoint"] = endpoint
+    await receive()
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def measure(app, iterations: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b'{"name": "farm"}', "more_body": False}
+
+    async def send(message):
+        pass
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        scope = {"type": "http", "method": "PUT", "path": "/api/farms/1", "app": FakeApp}
+        await app(scope, receive, send)
+    return (time.perf_counter() - started) / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200_000)
+    parser.add_argument("--budget-us", type=float, default=20.0)
+    args = parser.parse_args()
+
+    middleware = MetricsMiddleware(bare_app)
+    asyncio.run(measure(middleware, 1000))  # прогрев
+
+    bare = min(asyncio.run(measure(bare_app, args.iterations)) for _ in range(3))
+    wrapped = min(asyncio.run(measure(middleware, args.iterations)) for _ in range(3))
+    overhead_us = (wrapped - bare) * 1e6
+    print(f"без middleware: {bare * 1e6:.2f} мкс, с middleware: {wrapped * 1e6:.2f} мкс, "
+          f"накладные расходы: {overhead_us:.2f} мкс (бюджет {args.budget_us} мкс)")
+    if overhead_us > args.budget_us:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
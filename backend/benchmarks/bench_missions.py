@@ -0,0 +1,46 @@
+# backend/benchmarks/bench_missions.py
+# Планирование облёта для фермы из сотен пастбищ: холодный расчёт маршрутов
+# (выпуклая оболочка, выбор направления, пересечения галсов) и повторный запрос
+# через кэш. Пастбища — невыпуклые многоугольники ~1 км из bench_geofence.
+#
+#   cd backend && python -m benchmarks.bench_missions --pastures 300
+#
+# БД не нужна; кэш — бэкенд memory.
+import argparse
+import datetime
+import time
+
+from benchmarks.bench_geofence import make_pastures
+from app.api.missions.crud.mission_crud import cached_mission, plan_mission
+from app.api.missions.schemas.mission_schemas import MissionParams
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pastures", type=int, default=300)
+    parser.add_argument("--vertices", type=int, default=48)
+    parser.add_argument("--altitude", type=float, default=60)
+    args = parser.parse_args()
+
+    rows = make_pastures(args.pastures, args.vertices)
+    params = MissionParams(altitude=args.altitude)
+    version = datetime.datetime(2026, 1, 1)
+
+    started = time.perf_counter()
+    missions = [plan_mission(pasture_id, version, boundary, params) for pasture_id, _, boundary in rows]
+    cold = time.perf_counter() - started
+    waypoints = sum(len(m["waypoints"]) for m in missions)
+    passes = sum(m["passes"] for m in missions)
+    print(f"расчёт: {args.pastures} пастбищ за {cold * 1000:.0f} мс "
+          f"({cold / args.pastures * 1000:.2f} мс на пастбище, галсов {passes}, точек {waypoints})")
+
+    for pasture_id, _, boundary in rows:
+        cached_mission(pasture_id, version, boundary, params)
+    started = time.perf_counter()
+    for pasture_id, _, boundary in rows:
+        cached_mission(pasture_id, version, boundary, params)
+    print(f"из кэша: {args.pastures} пастбищ за {(time.perf_counter() - started) * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
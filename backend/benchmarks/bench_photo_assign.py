@@ -0,0 +1,120 @@
+# backend/benchmarks/bench_photo_assign.py
+# Пакетная загрузка фото: разбор EXIF (GPS, время) без декодирования пикселей и
+# привязка к пастбищам пользователя через PolygonIndex — как в POST /uploads/photos.
+# Фото — один большой JPEG, в который вклеиваются разные EXIF-блоки; часть фото
+# без GPS и часть вне пастбищ. Печатает время CPU по этапам и проверяет привязку.
+#
+#   cd backend && python -m benchmarks.bench_photo_assign --photos 500 --pastures 300
+#
+# Нужны Pillow и numpy; БД не нужна.
+import argparse
+import io
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+from PIL.TiffImagePlugin import IFDRational
+
+from benchmarks.bench_geofence import make_pastures
+from core.geo import PolygonIndex
+from app.processing.exif import GPS_IFD, EXIF_IFD, read_photo_exif
+
+
+def _dms(value: float) -> tuple:
+    degrees = int(value)
+    minutes = int((value - degrees) * 60)
+    seconds = round(((value - degrees) * 60 - minutes) * 60 * 1000)
+    return IFDRational(degrees), IFDRational(minutes), IFDRational(seconds, 1000)
+
+
+def exif_segment(lat: float | None, lng: float | None, second: int) -> bytes:
+    """APP1-сегмент JPEG с EXIF"""
+    exif = Image.Exif()
+    original = exif.get_ifd(EXIF_IFD)
+    original[0x9003] = f"2026:06:01 11:{second // 60 % 60:02d}:{second % 60:02d}"
+    original[0x9011] = "+05:00"
+    if lat is not None:
+        gps = exif.get_ifd(GPS_IFD)
+        gps[1], gps[2], gps[3], gps[4] = "N", _dms(lat), "E", _dms(lng)
+    data = exif.tobytes()
+    return b"\xff\xe1" + (len(data) + 2).to_bytes(2, "big") + data
+
+
+def _cell_center(pasture_id: int, count: int) -> tuple[float, float]:
+    side = int(np.ceil(np.sqrt(count)))
+    n = pasture_id - 1
+    return 71.0 + (n % side) * 0.01, 51.0 + (n // side) * 0.01
+
+
+def write_photos(workdir: str, rows, count: int, width: int, height: int, seed: int = 1):
+    """Фото и ожидаемое пастбище каждого (None — без GPS или вне пастбищ)"""
+    rng = np.random.default_rng(seed)
+    buffer = io.BytesIO()
+    Image.fromarray(rng.integers(0, 255, (height, width, 3), dtype=np.uint8)).save(buffer, "JPEG", quality=90)
+    base = buffer.getvalue()
+    paths, expected = [], []
+    for n in range(count):
+        kind = rng.random()
+        if kind < 0.1:
+            lat = lng = pasture = None  # камера без спутников
+        elif kind < 0.2:
+            lat, lng, pasture = 43.2 + rng.random(), 76.9 + rng.random(), None  # чужой регион
+        else:
+            pasture_id = rows[int(rng.integers(len(rows)))][0]
+            # многоугольники make_pastures звёздные: окрестность центра ячейки внутри
+            cx, cy = _cell_center(pasture_id, len(rows))
+            lng, lat = cx + rng.uniform(-0.001, 0.001), cy + rng.uniform(-0.001, 0.001)
+            pasture = pasture_id
+        path = os.path.join(workdir, f"DJI_{n:04d}.JPG")
+        with open(path, "wb") as f:
+            f.write(base[:2] + exif_segment(lat, lng, n) + base[2:])
+        paths.append(path)
+        expected.append(pasture)
+    return paths, expected
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--photos", type=int, default=500)
+    parser.add_argument("--pastures", type=int, default=300)
+    parser.add_argument("--vertices", type=int, default=64)
+    parser.add_argument("--width", type=int, default=4000)
+    parser.add_argument("--height", type=int, default=3000)
+    args = parser.parse_args()
+
+    rows = make_pastures(args.pastures, args.vertices)
+    workdir = tempfile.mkdtemp(prefix="kokmaisa-photos-")
+    try:
+        paths, expected = write_photos(workdir, rows, args.photos, args.width, args.height)
+        size_mb = os.path.getsize(paths[0]) / 1024 / 1024
+        print(f"фото: {args.photos} шт. по {size_mb:.1f} МБ, пастбищ {args.pastures} по {args.vertices} вершин")
+
+        started = time.process_time()
+        tags = []
+        for path in paths:
+            with open(path, "rb") as f:
+                tags.append(read_photo_exif(f))
+        parsed = time.process_time()
+        index = PolygonIndex([r[0] for r in rows], [r[2] for r in rows])
+        built = time.process_time()
+        located = [i for i, t in enumerate(tags) if t["lat"] is not None]
+        positions = index.locate([tags[i]["lng"] for i in located], [tags[i]["lat"] for i in located])
+        done = time.process_time()
+
+        assigned = [None] * len(paths)
+        for i, position in zip(located, positions.tolist()):
+            assigned[i] = index.keys[position] if position >= 0 else None
+        print(f"EXIF:     {(parsed - started) * 1000:7.1f} мс CPU ({(parsed - started) / len(paths) * 1e6:.0f} мкс/фото)")
+        print(f"индекс:   {(built - parsed) * 1000:7.1f} мс CPU")
+        print(f"привязка: {(done - built) * 1000:7.1f} мс CPU")
+        print(f"всего:    {(done - started) * 1000:7.1f} мс CPU; привязано {sum(a is not None for a in assigned)}, "
+              f"совпадает с ожидаемым: {assigned == expected}")
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+# backend/benchmarks/bench_singleflight.py
+# «Открытие дашборда»: N одинаковых одновременных GET к спискам от одного пользователя.
+# Сравнивает число SQL-запросов и время с объединением (single-flight) и без него.
+#
+#   cd backend && python -m benchmarks.bench_singleflight --burst 20 --farms 200
+#
+# Использует DATABASE_URL из .env; кэш коллекций отключается, чтобы мерить только объединение.
+import argparse
+import asyncio
+import datetime
+import time
+
+import httpx
+from sqlalchemy import event
+
+import core.cache as cache
+from benchmarks.bench_conditional_get import seed
+from core.security import create_access_token
+from core.singleflight import SingleFlightMiddleware, singleflight_calls_total
+from database.db import engine
+from main import app
+
+PATHS = ("/api/farms/", "/api/pastures/", "/api/drones/")
+
+
+def disable_singleflight():
+    """Стек middleware без SingleFlightMiddleware (как при SINGLEFLIGHT_ENABLED=false)"""
+    app.middleware_stack = None
+    app.user_middleware = [m for m in app.user_middleware if m.cls is not SingleFlightMiddleware]
+
+
+async def burst(client: httpx.AsyncClient, headers: dict, size: int, rounds: int, queries: list) -> tuple[int, float]:
+    queries[0] = 0
+    started = time.perf_counter()
+    for _ in range(rounds):
+        responses = await asyncio.gather(*[client.get(path, headers=headers) for path in PATHS for _ in range(size)])
+        assert all(r.status_code == 200 for r in responses)
+    return queries[0], (time.perf_counter() - started) / rounds
+
+
+async def run(args, headers: dict, queries: list, label: str):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        await client.get(PATHS[0], headers=headers)  # прогрев
+        before = {k: v for k, v in singleflight_calls_total._values.items() if k[0] == "http"}
+        count, elapsed = await burst(client, headers, args.burst, args.rounds, queries)
+        after = {k: v for k, v in singleflight_calls_total._values.items() if k[0] == "http"}
+    followers = after.get(("http", "follower"), 0) - before.get(("http", "follower"), 0)
+    total = args.burst * len(PATHS) * args.rounds
+    print(f"{label:22} SQL/раунд={count / args.rounds:8.1f} мс/раунд={elapsed * 1000:8.1f} "
+          f"объединено={followers / total:6.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--burst", type=int, default=20, help="одинаковых запросов на каждый список")
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--farms", type=int, default=200)
+    args = parser.parse_args()
+
+    user_id = seed(args.farms)
+    token = create_access_token({"user_id": user_id}, datetime.timedelta(minutes=30))
+    headers = {"Authorization": f"Bearer {token}"}
+
+    cache.set_backend(cache.NullCache())
+    queries = [0]
+    event.listen(engine, "before_cursor_execute", lambda *a: queries.__setitem__(0, queries[0] + 1))
+
+    asyncio.run(run(args, headers, queries, "single-flight"))
+    disable_singleflight()
+    asyncio.run(run(args, headers, queries, "без объединения"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+# backend/benchmarks/bench_video_frames.py
+# Отбор кадров из видео съёмки: синтетический облёт (панорама по текстуре «поля»,
+# зависания на месте и смены сцены) кодируется в H.264, затем меряется скорость
+# декодирования одного файла и нескольких файлов в JOB_WORKERS процессах
+# (как их разбирают процессы воркера очереди).
+#
+#   cd backend && python -m benchmarks.bench_video_frames --seconds 60 --files 4
+#
+# Нужен пакет av (PyAV); БД не нужна.
+import argparse
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import av
+import numpy as np
+
+from core.config import settings
+from app.processing.video_frames import extract_frames
+
+
+def make_texture(rng, height: int, width: int) -> np.ndarray:
+    """Пятнистая «трава» своей яркости: шум, сглаженный уменьшением и увеличением"""
+    low = int(rng.integers(10, 120))
+    coarse = rng.integers(low, low + 100, (height // 16 + 1, width // 16 + 1, 3), dtype=np.uint8)
+    texture = coarse.repeat(16, axis=0).repeat(16, axis=1)[:height, :width]
+    noise = rng.integers(0, 40, (height, width, 3), dtype=np.uint8)
+    texture = texture // 2 + noise
+    texture[..., 1] = np.maximum(texture[..., 1], texture[..., 0])  # зелёный преобладает
+    return texture
+
+
+def write_video(path: str, seconds: int, width: int, height: int, fps: int = 30, seed: int = 1):
+    rng = np.random.default_rng(seed)
+    with av.open(path, "w") as container:
+        container.metadata["creation_time"] = "2026-06-01T08:00:00.000000Z"
+        stream = container.add_stream("libx264", rate=fps)
+        stream.width, stream.height, stream.pix_fmt = width, height, "yuv420p"
+        stream.options = {"preset": "ultrafast"}
+        texture, shift = None, 0
+        for n in range(seconds * fps):
+            second = n // fps
+            if second % 15 == 0 and n % fps == 0:
+                # новая сцена: другой участок поля
+                texture, shift = make_texture(rng, height, width * 3), 0
+            # каждые 10 с дрон висит 4 с на месте — почти одинаковые кадры
+            if second % 10 < 6:
+                shift = (shift + 8) % (width * 2)
+            image = texture[:, shift:shift + width]
+            frame = av.VideoFrame.from_ndarray(np.ascontiguousarray(image), format="rgb24")
+            for packet in stream.encode(frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--seconds", type=int, default=60)
+    parser.add_argument("--width", type=int, default=1280)
+    parser.add_argument("--height", type=int, default=720)
+    parser.add_argument("--files", type=int, default=4, help="файлов для пула процессов")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="kokmaisa-video-")
+    executor = ProcessPoolExecutor(settings.JOB_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        paths = []
+        for i in range(args.files):
+            path = os.path.join(workdir, f"flight-{i}.mp4")
+            write_video(path, args.seconds, args.width, args.height, seed=i)
+            paths.append(path)
+        size_mb = os.path.getsize(paths[0]) / 1024 / 1024
+        print(f"видео: {args.seconds} с {args.width}x{args.height}, {size_mb:.1f} МБ")
+
+        params = (settings.VIDEO_FRAME_INTERVAL, settings.VIDEO_SCENE_THRESHOLD,
+                  settings.VIDEO_HASH_DISTANCE, settings.VIDEO_FRAME_MAX_WIDTH)
+        result = extract_frames(paths[0], os.path.join(workdir, "frames-single"), *params)
+        print(f"один файл: {result['fps']:7.0f} кадров/с, отобрано {len(result['frames'])}, "
+              f"дубликатов {result['duplicates']}, из {result['decoded']}")
+
+        executor.submit(int).result()  # процессы пула запущены до замера
+        started = time.perf_counter()
+        futures = [executor.submit(extract_frames, path, os.path.join(workdir, f"frames-{i}"), *params)
+                   for i, path in enumerate(paths)]
+        decoded = sum(f.result()["decoded"] for f in futures)
+        elapsed = time.perf_counter() - started
+        print(f"{settings.JOB_WORKERS} процесса, {args.files} файлов: {decoded / elapsed:7.0f} кадров/с")
+    finally:
+        executor.shutdown()
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# backend/benchmarks/bench_workers.py
+# Пропускная способность CRUD-эндпоинтов при 1, 2, 4 и 8 воркерах gunicorn.
+#
+#   cd backend && python -m benchmarks.bench_workers --duration 15
+#
+# Использует DATABASE_URL из .env; в базу добавляется тестовый фермер с фермами.
+import argparse
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+import uuid
+
+import httpx
+
+from benchmarks.loadgen import Target, run_load
+
+
+def wait_ready(base_url: str, timeout: float = 30.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            httpx.get(f"{base_url}/docs", timeout=1)
+            return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("Сервер не поднялся")
+
+
+def prepare_data(base_url: str, farms: int = 20) -> list[Target]:
+    """Регистрирует фермера и заводит фермы, пастбища и дроны"""
+    suffix = uuid.uuid4().hex[:10]
+    resp = httpx.post(f"{base_url}/api/users/register", json={
+        "full_name": "Bench Farmer",
+        "phone": f"+7{suffix}",
+        "email": f"bench-{suffix}@example.kz",
+        "country": "Kazakhstan",
+        "city": "Astana",
+        "password": "bench-password",
+        "account_type": "farmer",
+    })
+    resp.raise_for_status()
+    headers = {"Authorization": f"Bearer {resp.json()['access_token']}"}
+
+    farm_id = None
+    for i in range(farms):
+        farm = httpx.post(f"{base_url}/api/farms/", headers=headers, json={
+            "name": f"Ферма {i}", "region": "Акмолинская", "area": 100 + i,
+            "crops": ["пшеница", "ячмень"], "equipment": ["трактор"],
+        }).json()
+        farm_id = farm["id"]
+        httpx.post(f"{base_url}/api/pastures/", headers=headers, json={
+            "name": f"Пастбище {i}", "farm_id": farm_id, "area": 50,
+        })
+        httpx.post(f"{base_url}/api/drones/", headers=headers, json={
+            "model": "DJI Mavic 3", "serial_number": f"SN-{suffix}-{i}", "farm_id": farm_id,
+        })
+
+    return [
+        Target("GET /api/farms/", "GET", "/api/farms/", headers),
+        Target("GET /api/farms/{id}", "GET", f"/api/farms/{farm_id}", headers),
+        Target("PUT /api/farms/{id}", "PUT", f"/api/farms/{farm_id}", headers, {"description": "bench"}),
+        Target("GET /api/pastures/", "GET", "/api/pastures/", headers),
+        Target("GET /api/drones/", "GET", "/api/drones/", headers),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", default="1,2,4,8")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--output", default=None, help="куда сохранить JSON-отчёт")
+    args = parser.parse_args()
+
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = {}
+    targets = None
+    for workers in [int(w) for w in args.workers.split(",")]:
+        env = dict(os.environ, WEB_CONCURRENCY=str(workers), WEB_BIND=f"127.0.0.1:{args.port}")
+        server = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "-c", "gunicorn_conf.py", "--access-logfile", os.devnull, "main:app"],
+            env=env,
+        )
+        try:
+            wait_ready(base_url)
+            if targets is None:
+                targets = prepare_data(base_url)
+            report = asyncio.run(run_load(base_url, targets, args.concurrency, args.duration))
+            results[workers] = report
+            print(f"workers={workers}: {report['total_rps']} req/s")
+        finally:
+            server.send_signal(signal.SIGTERM)
+            server.wait(timeout=60)
+
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# backend/benchmarks/check_cache_staleness.py
+# Проверка кэша коллекций на устаревшие чтения: случайные записи через CRUD
+# вперемешку с чтениями; каждое чтение из кэша сравнивается с прямым запросом к БД.
+#
+#   cd backend && python -m benchmarks.check_cache_staleness --ops 5000
+#
+# Работает на sqlite в памяти; код выхода 1 при первом расхождении.
+import argparse
+import random
+import sys
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import core.cache as cache
+from database.db import Base
+from model.models import Drone, Farm, Pasture, User
+from app.api.drones.crud import drone_crud
+from app.api.drones.schemas.drone_schemas import DroneCreate, DroneUpdate
+from app.api.farms.crud import farm_crud
+from app.api.farms.schemas.farm_schemas import FarmCreate, FarmUpdate
+from app.api.pastures.crud import pasture_crud
+from app.api.pastures.schemas.pasture_schemas import PastureCreate, PastureUpdate
+
+
+def make_session():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def uncached(db, kind: str, owner_id: int) -> list:
+    # прямой запрос мимо CRUD и кэша — эталон для сравнения
+    if kind == "farms":
+        query = select(*Farm.__table__.columns).where(Farm.owner_id == owner_id)
+    else:
+        model = Pasture if kind == "pastures" else Drone
+        query = select(*model.__table__.columns).select_from(model).join(Farm).where(
+            Farm.owner_id == owner_id).offset(0).limit(100)
+    return [dict(row) for row in db.execute(query).mappings()]
+
+
+def cached(db, kind: str, owner_id: int) -> list:
+    if kind == "farms":
+        return farm_crud.get_farms(db, owner_id)
+    if kind == "pastures":
+        return pasture_crud.get_pastures(db, owner_id)
+    return drone_crud.get_drones(db, owner_id)
+
+
+def normalize(rows: list) -> list:
+    # SharedCache отдаёт даты строками (orjson) — сравниваем в одном виде
+    return [{k: (v.isoformat() if hasattr(v, "isoformat") else v) for k, v in row.items()} for row in rows]
+
+
+def write(db, rnd: random.Random, owner_id: int, serial: list[int]):
+    farms = [f.id for f in db.query(Farm.id).filter(Farm.owner_id == owner_id)]
+    pastures = [p.id for p in db.query(Pasture.id).join(Farm).filter(Farm.owner_id == owner_id)]
+    drones = [d.id for d in db.query(Drone.id).join(Farm).filter(Farm.owner_id == owner_id)]
+    op = rnd.choice(["farm+", "farm~", "farm-", "pasture+", "pasture~", "pasture-",
+                     "drone+", "drone~", "drone!", "drone-"])
+    if op == "farm+" or not farms:
+        farm_crud.create_farm(db, FarmCreate(name=f"КХ {rnd.random():.6f}", region="Акмолинская", area=rnd.randint(1, 5000)), owner_id)
+    elif op == "farm~":
+        farm_crud.update_farm(db, rnd.choice(farms), FarmUpdate(area=rnd.randint(1, 5000)), owner_id)
+    elif op == "farm-" and len(farms) > 1:
+        farm_crud.delete_farm(db, rnd.choice(farms), owner_id)
+    elif op == "pasture+":
+        pasture_crud.create_pasture(db, PastureCreate(farm_id=rnd.choice(farms), name="Пастбище", area=rnd.random() * 100), owner_id)
+    elif op == "pasture~" and pastures:
+        pasture_crud.update_pasture(db, rnd.choice(pastures), PastureUpdate(area=rnd.random() * 100), owner_id)
+    elif op == "pasture-" and pastures:
+        pasture_crud.delete_pasture(db, rnd.choice(pastures), owner_id)
+    elif op == "drone+":
+        serial[0] += 1
+        drone_crud.create_drone(db, DroneCreate(farm_id=rnd.choice(farms), model="DJI Mavic 3", serial_number=f"SN-{serial[0]}"), owner_id)
+    elif op == "drone~" and drones:
+        drone_crud.update_drone(db, rnd.choice(drones), DroneUpdate(description=f"{rnd.random():.6f}"), owner_id)
+    elif op == "drone!" and drones:
+        drone_crud.update_drone_status(db, rnd.choice(drones), rnd.choice(["active", "inactive", "maintenance"]), owner_id)
+    elif op == "drone-" and drones:
+        drone_crud.delete_drone(db, rnd.choice(drones), owner_id)
+
+
+def run(backend_name: str, ops: int, owners: int, seed: int) -> bool:
+    cache.set_backend(cache.create_backend(backend_name))
+    db = make_session()
+    for i in range(owners):
+        db.add(User(full_name=f"Фермер {i}", phone=f"+7{i}", email=f"f{i}@kokmaisa.kz", hashed_password="x",
+                    account_type="farmer", country="Казахстан", city="Астана"))
+    db.commit()
+    owner_ids = [u.id for u in db.query(User.id)]
+
+    rnd = random.Random(seed)
+    serial = [0]
+    before = cache.cache_stats()
+    for step in range(ops):
+        owner_id = rnd.choice(owner_ids)
+        if rnd.random() < 0.3:
+            write(db, rnd, owner_id, serial)
+            continue
+        kind = rnd.choice(["farms", "pastures", "drones"])
+        got, expected = normalize(cached(db, kind, owner_id)), normalize(uncached(db, kind, owner_id))
+        if got != expected:
+            print(f"[{backend_name}] шаг {step}: устаревшее чтение {kind} владельца {owner_id}")
+            return False
+
+    after = cache.cache_stats()
+    for namespace in sorted(after):
+        counts = {k: v - before.get(namespace, {}).get(k, 0) for k, v in after[namespace].items()}
+        reads = counts.get("hit", 0) + counts.get("miss", 0)
+        ratio = counts.get("hit", 0) / reads if reads else 0.0
+        print(f"[{backend_name}] {namespace:9} hit={counts.get('hit', 0):6} miss={counts.get('miss', 0):6} "
+              f"invalidate={counts.get('invalidate', 0):6} hit ratio={ratio:.0%}")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ops", type=int, default=5000)
+    parser.add_argument("--owners", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--backends", default="memory,local")
+    args = parser.parse_args()
+
+    ok = all(run(name, args.ops, args.owners, args.seed) for name in args.backends.split(","))
+    print("устаревших чтений нет" if ok else "НАЙДЕНЫ устаревшие чтения")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# backend/benchmarks/check_query_counts.py
+# Проверка числа SQL-запросов на эндпоинт: оно не должно зависеть от объёма данных
+# (нет N+1). Для каждого размера портфеля заполняется свежая SQLite в памяти
+# (у первой фермы столько же пастбищ и дронов, сколько ферм в портфеле),
+# запрос выполняется через TestClient, а SQL считаются событием before_cursor_execute.
+#
+#   cd backend && python -m benchmarks.check_query_counts
+#
+# Код выхода 1, если число запросов выросло вместе с данными или превысило лимит.
+import datetime
+import sys
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from core.security import create_access_token
+from database.bulk import bulk_insert
+from database.db import Base, get_db
+from main import app
+from model.models import Drone, Farm, Measurement, Pasture, User
+
+SIZES = (1, 10, 100)
+
+FARMER_ID, AGRONOMIST_ID = 1, 2
+
+# эндпоинт -> (пользователь, путь по данным seed, максимум запросов включая выборку пользователя)
+ENDPOINTS = {
+    "portfolio": (AGRONOMIST_ID, lambda ids: "/api/farms/portfolio", 3),
+    "overview": (FARMER_ID, lambda ids: f"/api/farms/{ids['farm_ids'][0]}/overview", 5),
+}
+
+
+def seed(engine, farms: int) -> dict:
+    now = datetime.datetime.utcnow()
+    with engine.begin() as conn:
+        bulk_insert(conn, User.__table__, [
+            {"id": FARMER_ID, "full_name": "Фермер", "phone": "+71", "email": "f@kokmaisa.kz", "hashed_password": "x",
+             "account_type": "farmer", "country": "Казахстан", "city": "Астана"},
+            {"id": AGRONOMIST_ID, "full_name": "Агроном", "phone": "+72", "email": "a@kokmaisa.kz", "hashed_password": "x",
+             "account_type": "agronomist", "country": "Казахстан", "city": "Астана"},
+        ])
+        bulk_insert(conn, Farm.__table__, [
+            {"id": i, "owner_id": FARMER_ID, "agronomist_id": AGRONOMIST_ID, "name": f"КХ {i}", "region": "Акмолинская", "area": 100.0,
+             "status": "active", "created_at": now, "updated_at": now}
+            for i in range(1, farms + 1)
+        ])
+        bulk_insert(conn, Pasture.__table__, [
+            {"id": i * 1000 + n, "farm_id": i, "name": f"Пастбище {n}", "area": 5.0, "status": "active",
+             "created_at": now, "updated_at": now}
+            for i in range(1, farms + 1) for n in range(3 if i > 1 else farms)
+        ])
+        bulk_insert(conn, Drone.__table__, [
+            {"farm_id": i, "model": "DJI Mavic 3", "serial_number": f"SN-{i}-{n}", "status": "active",
+             "created_at": now, "updated_at": now}
+            for i in range(1, farms + 1) for n in range(2 if i > 1 else farms)
+        ])
+        bulk_insert(conn, Measurement.__table__, [
+            {"pasture_id": i * 1000 + n, "method": "photo_upload", "status": "completed", "biomass_value": 1200.0 + d,
+             "measured_at": now - datetime.timedelta(days=d), "created_at": now, "updated_at": now}
+            for i in range(1, farms + 1) for n in range(3 if i > 1 else farms) for d in range(4)
+        ])
+    return {"farm_ids": list(range(1, farms + 1))}
+
+
+def count_queries(farms: int) -> dict[str, int]:
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    ids = seed(engine, farms)
+    session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    statements = [0]
+    event.listen(engine, "before_cursor_execute", lambda *a: statements.__setitem__(0, statements[0] + 1))
+    app.dependency_overrides[get_db] = override_get_db
+    counts = {}
+    try:
+        client = TestClient(app)
+        for name, (user_id, path, _) in ENDPOINTS.items():
+            token = create_access_token({"user_id": user_id}, datetime.timedelta(minutes=5))
+            statements[0] = 0
+            resp = client.get(path(ids), headers={"Authorization": f"Bearer {token}"})
+            assert resp.status_code == 200, (name, resp.status_code, resp.text[:200])
+            counts[name] = statements[0]
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        engine.dispose()
+    return counts
+
+
+def main():
+    results = {size: count_queries(size) for size in SIZES}
+    ok = True
+    print(f"{'эндпоинт':12} " + " ".join(f"{size:>6} ферм" for size in SIZES) + "   лимит")
+    for name, (_, _, limit) in ENDPOINTS.items():
+        counts = [results[size][name] for size in SIZES]
+        stable = len(set(counts)) == 1 and counts[0] <= limit
+        ok &= stable
+        print(f"{name:12} " + " ".join(f"{c:>11}" for c in counts) + f"   {limit:>5}  {'ok' if stable else 'РАСТЁТ'}")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# backend/benchmarks/load_telemetry.py
+# Нагрузочный тест приёма телеметрии: senders отправителей шлют пачки точек
+# с заданным суммарным темпом; меряются принятые и записанные точки в секунду,
+# доля 429 (обратное давление) и задержки ответа.
+#
+#   cd backend && python -m benchmarks.load_telemetry --rate 10000 --seconds 20
+#   python -m benchmarks.load_telemetry --base-url http://127.0.0.1:8000 --rate 10000        # живой сервер
+#   python -m benchmarks.load_telemetry --base-url http://127.0.0.1:8000 --ws --rate 10000   # через WebSocket
+#
+# Цель — 10 000 точек/с на одном узле с локальным PostgreSQL. Без --base-url приложение
+# запускается в процессе (с lifespan, т.е. с фоновой записью буфера).
+# Использует DATABASE_URL из .env; создаёт фермера со 100 дронами.
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import time
+
+import httpx
+from sqlalchemy import func, select
+
+from benchmarks.bench_conditional_get import seed
+from benchmarks.loadgen import percentile
+from core.security import create_access_token
+from database.db import SessionLocal
+from main import app
+from model.models import Drone, DroneTelemetry, Farm
+
+
+def make_batch(drone_ids: list[int], size: int, rng: random.Random) -> dict:
+    now = datetime.datetime.utcnow().isoformat()
+    return {"points": [{
+        "drone_id": rng.choice(drone_ids), "recorded_at": now,
+        "lat": 51.1 + rng.random() * 0.01, "lng": 71.4 + rng.random() * 0.01,
+        "altitude": 80 + rng.random() * 5, "battery": rng.uniform(20, 100), "speed": rng.uniform(0, 15),
+        "heading": rng.uniform(0, 359),
+    } for _ in range(size)]}
+
+
+async def http_sender(client: httpx.AsyncClient, headers: dict, drone_ids: list[int], args, deadline: float, stats: dict, seed_: int):
+    rng = random.Random(seed_)
+    interval = args.batch * args.senders / args.rate
+    next_at = time.perf_counter()
+    while next_at < deadline:
+        body = make_batch(drone_ids, args.batch, rng)
+        started = time.perf_counter()
+        resp = await client.post("/api/telemetry", json=body, headers=headers)
+        stats["latency"].append(time.perf_counter() - started)
+        if resp.status_code == 202:
+            stats["accepted"] += args.batch
+        elif resp.status_code == 429:
+            stats["throttled"] += 1
+        else:
+            stats["errors"] += 1
+        next_at += interval
+        await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+
+async def ws_sender(base_url: str, token: str, drone_ids: list[int], args, deadline: float, stats: dict, seed_: int):
+    import websockets
+
+    rng = random.Random(seed_)
+    interval = args.batch * args.senders / args.rate
+    url = base_url.replace("http", "ws", 1) + f"/api/telemetry/ws?token={token}"
+    async with websockets.connect(url, max_size=None) as ws:
+        next_at = time.perf_counter()
+        while next_at < deadline:
+            started = time.perf_counter()
+            await ws.send(json.dumps(make_batch(drone_ids, args.batch, rng)))
+            reply = json.loads(await ws.recv())  # ответ приходит, когда буфер принял пачку
+            stats["latency"].append(time.perf_counter() - started)
+            if "accepted" in reply:
+                stats["accepted"] += reply["accepted"]
+            else:
+                stats["errors"] += 1
+            next_at += interval
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+
+def written(drone_ids: list[int]) -> int:
+    with SessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(DroneTelemetry).where(DroneTelemetry.drone_id.in_(drone_ids)))
+
+
+async def run(args, token: str, drone_ids: list[int]) -> tuple[dict, float]:
+    stats = {"accepted": 0, "throttled": 0, "errors": 0, "latency": []}
+    headers = {"Authorization": f"Bearer {token}"}
+    started = time.perf_counter()
+    deadline = started + args.seconds
+    if args.base_url:
+        async with httpx.AsyncClient(base_url=args.base_url, timeout=30) as client:
+            await asyncio.gather(*[
+                ws_sender(args.base_url, token, drone_ids, args, deadline, stats, i) if args.ws
+                else http_sender(client, headers, drone_ids, args, deadline, stats, i)
+                for i in range(args.senders)
+            ])
+        elapsed = time.perf_counter() - started
+        # живой сервер дописывает буфер сам — ждём, пока число строк перестанет расти
+        previous = -1
+        while (current := written(drone_ids)) != previous:
+            previous = current
+            await asyncio.sleep(max(1.0, args.flush_wait))
+    else:
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=30) as client:
+                await asyncio.gather(*[
+                    http_sender(client, headers, drone_ids, args, deadline, stats, i) for i in range(args.senders)
+                ])
+            elapsed = time.perf_counter() - started
+        # выход из lifespan дописал остаток буфера
+    return stats, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=int, default=10_000, help="целевой темп, точек/с")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--batch", type=int, default=500, help="точек в одном запросе")
+    parser.add_argument("--senders", type=int, default=20)
+    parser.add_argument("--base-url", default="")
+    parser.add_argument("--ws", action="store_true", help="слать через WebSocket (только с --base-url)")
+    parser.add_argument("--flush-wait", type=float, default=1.0)
+    args = parser.parse_args()
+
+    user_id = seed(100)
+    with SessionLocal() as db:
+        drone_ids = list(db.scalars(select(Drone.id).join(Farm).where(Farm.owner_id == user_id)))
+    token = create_access_token({"user_id": user_id}, datetime.timedelta(hours=1))
+
+    stats, elapsed = asyncio.run(run(args, token, drone_ids))
+    total = written(drone_ids)
+    latency = sorted(stats["latency"])
+    requests = len(latency) or 1
+    print(f"цель:       {args.rate:>10,} точек/с  ({'WebSocket' if args.ws else 'HTTP'}, пачки по {args.batch}, {args.senders} отправителей)")
+    print(f"принято:    {stats['accepted'] / elapsed:>10,.0f} точек/с")
+    print(f"записано:   {total:>10,} точек ({total / elapsed:,.0f}/с за время отправки)")
+    print(f"429:        {stats['throttled'] / requests:>10.1%}   ошибки: {stats['errors']}")
+    print(f"задержка:   p50={percentile(latency, 50) * 1000:.1f} мс  p95={percentile(latency, 95) * 1000:.1f} мс  "
+          f"p99={percentile(latency, 99) * 1000:.1f} мс")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# backend/benchmarks/loadgen.py
+# Простой асинхронный генератор нагрузки для бенчмарков (httpx + asyncio).
+import asyncio
+import itertools
+import time
+from dataclasses import dataclass, field
+
+import httpx
+
+
+@dataclass
+class Target:
+    name: str
+    method: str
+    path: str
+    headers: dict = field(default_factory=dict)
+    json: dict | None = None
+
+
+def percentile(sorted_values: list[float], p: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def run_load(base_url: str, targets: list[Target], concurrency: int = 32, duration: float = 10.0) -> dict:
+    """Гоняет запросы по кругу из targets в concurrency потоков duration секунд"""
+    latencies: dict[str, list[float]] = {t.name: [] for t in targets}
+    errors: dict[str, int] = {t.name: 0 for t in targets}
+    cycle = itertools.cycle(targets)
+    deadline = time.perf_counter() + duration
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                target = next(cycle)
+                started = time.perf_counter()
+                try:
+                    resp = await client.request(target.method, target.path, headers=target.headers, json=target.json)
+                    ok = resp.status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                elapsed = time.perf_counter() - started
+                if ok:
+                    latencies[target.name].append(elapsed)
+                else:
+                    errors[target.name] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        wall = time.perf_counter() - started
+
+    report = {"duration_s": round(wall, 3), "concurrency": concurrency, "endpoints": {}}
+    total = 0
+    for name, values in latencies.items():
+        values.sort()
+        total += len(values)
+        report["endpoints"][name] = {
+            "requests": len(values),
+            "errors": errors[name],
+            "rps": round(len(values) / wall, 1),
+            "p50_ms": round(percentile(values, 50) * 1000, 2),
+            "p95_ms": round(percentile(values, 95) * 1000, 2),
+            "p99_ms": round(percentile(values, 99) * 1000, 2),
+        }
+    report["total_rps"] = round(total / wall, 1)
+    return report
@@ -0,0 +1,121 @@
+# backend/benchmarks/loadtest.py
+# Сквозной нагрузочный тест по данным из benchmarks.seed.
+#
+#   cd backend && python -m benchmarks.seed --scale 0.01
+#   python -m benchmarks.ai_stub &   # и API с OPENAI_BASE_URL на заглушку
+#   python -m benchmarks.loadtest --base-url http://127.0.0.1:8000 --output run.json
+#   python -m benchmarks.loadtest ... --compare run.json     # сравнение с прошлым прогоном
+#
+# Отчёт: пропускная способность и p50/p95/p99 по каждому эндпоинту в JSON.
+import argparse
+import asyncio
+import datetime
+import json
+import random
+import subprocess
+
+import httpx
+
+from benchmarks.loadgen import Target, run_load
+from benchmarks.seed import SEED_EMAIL, SEED_PASSWORD
+
+
+def login(client: httpx.Client, email: str) -> str | None:
+    resp = client.post("/api/users/login", json={"email": email, "password": SEED_PASSWORD})
+    if resp.status_code != 200:
+        return None
+    return resp.json()["access_token"]
+
+
+def build_targets(base_url: str, users: int, max_user_id: int, ai: bool) -> list[Target]:
+    """Логинит случайных сид-фермеров и собирает сценарии по их фермам, пастбищам и дронам"""
+    rng = random.Random(7)
+    targets = []
+    with httpx.Client(base_url=base_url, timeout=30) as client:
+        attempts = 0
+        while len(targets) < users * 4 and attempts < users * 20:
+            attempts += 1
+            email = SEED_EMAIL.format(rng.randint(1, max_user_id))
+            token = login(client, email)
+            if token is None:
+                continue
+            headers = {"Authorization": f"Bearer {token}"}
+            farms = client.get("/api/farms/", headers=headers)
+            if farms.status_code != 200 or not farms.json():
+                continue  # агроном или фермер без ферм
+            farm_id = farms.json()[0]["id"]
+            pastures = client.get("/api/pastures/", headers=headers).json()
+            drones = client.get("/api/drones/", headers=headers).json()
+
+            targets += [
+                Target("POST /api/users/login", "POST", "/api/users/login", {}, {"email": email, "password": SEED_PASSWORD}),
+                Target("GET /api/users/me", "GET", "/api/users/me", headers),
+                Target("GET /api/farms/", "GET", "/api/farms/", headers),
+                Target("GET /api/farms/{id}", "GET", f"/api/farms/{farm_id}", headers),
+                Target("GET /api/pastures/", "GET", "/api/pastures/", headers),
+                Target("GET /api/drones/", "GET", "/api/drones/", headers),
+            ]
+            if pastures:
+                targets.append(Target("GET /api/pastures/{id}", "GET", f"/api/pastures/{pastures[0]['id']}", headers))
+            if drones:
+                targets.append(Target("GET /api/drones/{id}", "GET", f"/api/drones/{drones[0]['id']}", headers))
+            if ai:
+                targets.append(Target("POST /api/ai/chat", "POST", "/api/ai/chat", headers, {"message": "Как оценить биомассу?"}))
+    if not targets:
+        raise SystemExit("Не удалось залогиниться сид-пользователями — запустите benchmarks.seed")
+    rng.shuffle(targets)
+    return targets
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def print_comparison(current: dict, previous: dict):
+    print(f"{'эндпоинт':32} {'rps':>18} {'p95, мс':>20} {'p99, мс':>20}")
+    for name, now in sorted(current["endpoints"].items()):
+        before = previous["endpoints"].get(name)
+        if before is None:
+            continue
+        cells = []
+        for key in ("rps", "p95_ms", "p99_ms"):
+            delta = (now[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+            cells.append(f"{before[key]:>7} → {now[key]:<7} ({delta:+.0f}%)")
+        print(f"{name:32} " + " ".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--users", type=int, default=20, help="сколько сид-фермеров использовать")
+    parser.add_argument("--max-user-id", type=int, default=1000, help="верхняя граница id сид-пользователей")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--no-ai", action="store_true", help="не нагружать /api/ai/chat")
+    parser.add_argument("--output", default=None)
+    parser.add_argument("--compare", default=None, help="JSON прошлого прогона")
+    args = parser.parse_args()
+
+    targets = build_targets(args.base_url, args.users, args.max_user_id, not args.no_ai)
+    report = asyncio.run(run_load(args.base_url, targets, args.concurrency, args.duration))
+    report["meta"] = {
+        "started_at": datetime.datetime.utcnow().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "base_url": args.base_url,
+        "users": args.users,
+    }
+
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(report, json.load(f))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
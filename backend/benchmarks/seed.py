@@ -0,0 +1,231 @@
+# backend/benchmarks/seed.py
+# Генератор синтетических данных для нагрузочных тестов.
+#
+#   cd backend && python -m benchmarks.seed --scale 0.01        # ~1k пользователей, 10k ферм
+#   cd backend && python -m benchmarks.seed                     # 100k пользователей, 1M ферм и пастбищ
+#
+# Пишет напрямую через COPY (PostgreSQL) или executemany (SQLite), минуя ORM.
+# Все пользователи получают пароль SEED_PASSWORD и почту seed-user-<n>@kokmaisa.kz.
+import argparse
+import array
+import datetime
+import math
+import random
+import time
+
+from sqlalchemy import func, select
+
+from core.security import get_password_hash
+from database.bulk import bulk_insert, reset_sequence
+from database.db import engine
+from model.models import Drone, Farm, Measurement, Pasture, User
+
+SEED_PASSWORD = "kokmaisa-seed"
+SEED_EMAIL = "seed-user-{}@kokmaisa.kz"
+
+# Центры областей Казахстана (широта, долгота)
+REGIONS = {
+    "Акмолинская": (51.9, 69.4),
+    "Карагандинская": (49.8, 73.1),
+    "Костанайская": (52.3, 63.6),
+    "Павлодарская": (52.3, 76.9),
+    "Северо-Казахстанская": (54.0, 69.4),
+    "Восточно-Казахстанская": (49.0, 82.6),
+    "Алматинская": (44.5, 77.5),
+    "Жамбылская": (43.6, 71.4),
+    "Туркестанская": (42.3, 68.3),
+    "Актюбинская": (49.0, 57.5),
+    "Западно-Казахстанская": (50.5, 51.5),
+}
+CITIES = ["Астана", "Алматы", "Караганда", "Костанай", "Павлодар", "Петропавловск", "Усть-Каменогорск", "Тараз", "Шымкент", "Актобе", "Уральск"]
+CROPS = ["пшеница", "ячмень", "овёс", "подсолнечник", "люцерна", "кукуруза", "рапс"]
+EQUIPMENT = ["трактор", "комбайн", "сеялка", "опрыскиватель", "косилка", "пресс-подборщик"]
+PASTURE_TYPES = ["степное", "луговое", "горное", "пойменное", "сеяное"]
+DRONE_MODELS = ["DJI Mavic 3 Multispectral", "DJI Phantom 4 RTK", "DJI Agras T30", "Autel EVO II"]
+SPECIALIZATIONS = ["agronomy", "livestock", "soil", "remote_sensing"]
+
+FULL_SCALE = {"users": 100_000, "farms": 1_000_000, "pastures": 1_000_000, "drones": 200_000, "measurements": 5_000_000}
+
+
+def next_id(conn, model) -> int:
+    return (conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def gen_users(rng: random.Random, first_id: int, count: int, hashed_password: str, now: datetime.datetime):
+    for i in range(first_id, first_id + count):
+        agronomist = rng.random() < 0.1
+        yield {
+            "id": i,
+            "full_name": f"Пользователь {i}",
+            "phone": f"+7700{i:07d}",
+            "email": SEED_EMAIL.format(i),
+            "hashed_password": hashed_password,
+            "account_type": "agronomist" if agronomist else "farmer",
+            "country": "Казахстан",
+            "city": rng.choice(CITIES),
+            "created_at": now - datetime.timedelta(days=rng.randint(0, 700)),
+            "education": "Магистр агрономии" if agronomist else None,
+            "specializations": rng.sample(SPECIALIZATIONS, 2) if agronomist else None,
+        }
+
+
+def gen_farms(rng: random.Random, first_id: int, count: int, farmer_ids: list[int], agronomist_ids: list[int], now: datetime.datetime):
+    regions = list(REGIONS.items())
+    for i in range(first_id, first_id + count):
+        region, (lat, lng) = rng.choice(regions)
+        created = now - datetime.timedelta(days=rng.randint(0, 700))
+        yield {
+            "id": i,
+            "owner_id": rng.choice(farmer_ids),
+            "agronomist_id": rng.choice(agronomist_ids) if agronomist_ids and rng.random() < 0.3 else None,
+            "name": f"Крестьянское хозяйство №{i}",
+            "address": f"{region} обл., с. Аул-{i % 977}",
+            "region": region,
+            "area": round(rng.uniform(50, 20_000), 1),
+            "description": "Смешанное хозяйство: растениеводство и отгонное животноводство." if rng.random() < 0.5 else None,
+            "coordinates_lat": round(lat + rng.uniform(-1.5, 1.5), 6),
+            "coordinates_lng": round(lng + rng.uniform(-2.0, 2.0), 6),
+            "phone": f"+7701{i % 10_000_000:07d}",
+            "owner_name": f"Владелец {i}",
+            "owner_iin": f"{rng.randint(0, 10**12 - 1):012d}",
+            "farm_type": rng.choice(["crop", "livestock", "mixed"]),
+            "established_date": datetime.date(rng.randint(1995, 2024), rng.randint(1, 12), 1),
+            "crops": rng.sample(CROPS, rng.randint(1, 4)),
+            "equipment": rng.sample(EQUIPMENT, rng.randint(1, 4)),
+            "status": "active",
+            "photos": [f"/uploads/farms/{i}_{n}.jpg" for n in range(rng.randint(0, 3))],
+            "created_at": created,
+            "updated_at": created,
+        }
+
+
+def gen_pastures(rng: random.Random, first_id: int, count: int, first_farm: int, farm_lats: array.array, farm_lngs: array.array, now: datetime.datetime):
+    for i in range(first_id, first_id + count):
+        offset = rng.randrange(len(farm_lats))
+        farm_id = first_farm + offset
+        lat, lng = farm_lats[offset], farm_lngs[offset]
+        created = now - datetime.timedelta(days=rng.randint(0, 600))
+        yield {
+            "id": i,
+            "farm_id": farm_id,
+            "name": f"Пастбище {i}",
+            "area": round(rng.uniform(5, 2_000), 1),
+            "pasture_type": rng.choice(PASTURE_TYPES),
+            "coordinates_lat": round(lat + rng.uniform(-0.05, 0.05), 6),
+            "coordinates_lng": round(lng + rng.uniform(-0.08, 0.08), 6),
+            "description": None,
+            "status": "active",
+            "created_at": created,
+            "updated_at": created,
+        }
+
+
+def gen_drones(rng: random.Random, first_id: int, count: int, farm_ids: range, now: datetime.datetime):
+    for i in range(first_id, first_id + count):
+        created = now - datetime.timedelta(days=rng.randint(0, 500))
+        yield {
+            "id": i,
+            "farm_id": rng.choice(farm_ids),
+            "model": rng.choice(DRONE_MODELS),
+            "serial_number": f"SEED-{i:09d}",
+            "status": rng.choices(["active", "inactive", "maintenance"], [0.8, 0.1, 0.1])[0],
+            "description": None,
+            "created_at": created,
+            "updated_at": created,
+        }
+
+
+def gen_measurements(rng: random.Random, first_id: int, count: int, pasture_ids: range, now: datetime.datetime):
+    """Временные ряды: каждое пастбище измеряется раз в ~2 недели с сезонной кривой биомассы"""
+    per_pasture = max(1, math.ceil(count / max(1, len(pasture_ids))))
+    measurement_id = first_id
+    for pasture_id in pasture_ids:
+        base = rng.uniform(800, 3500)
+        for n in range(per_pasture):
+            if measurement_id >= first_id + count:
+                return
+            measured = now - datetime.timedelta(days=14 * (per_pasture - n), hours=rng.randint(6, 18))
+            # пик вегетации — конец июня
+            season = math.cos((measured.timetuple().tm_yday - 175) / 365 * 2 * math.pi)
+            biomass = max(0.0, base * (0.55 + 0.45 * season) + rng.gauss(0, 120))
+            yield {
+                "id": measurement_id,
+                "pasture_id": pasture_id,
+                "drone_id": None,
+                "method": "drone_video" if rng.random() < 0.3 else "photo_upload",
+                "status": "completed",
+                "biomass_value": round(biomass, 1),
+                "ndvi_value": round(min(0.9, 0.15 + biomass / 5000 + rng.gauss(0, 0.03)), 3),
+                "coverage_percent": round(min(100.0, 30 + biomass / 50 + rng.gauss(0, 5)), 1),
+                "quality_score": round(rng.uniform(0.7, 0.99), 2),
+                "description": None,
+                "media_url": None,
+                "measured_at": measured,
+                "created_at": measured,
+                "updated_at": measured,
+            }
+            measurement_id += 1
+
+
+def seed(counts: dict[str, int], random_seed: int = 42):
+    rng = random.Random(random_seed)
+    now = datetime.datetime.utcnow().replace(microsecond=0)
+    hashed_password = get_password_hash(SEED_PASSWORD)  # bcrypt один раз на всех
+
+    with engine.begin() as conn:
+        timings = {}
+
+        def load(name, model, rows):
+            started = time.perf_counter()
+            inserted = bulk_insert(conn, model.__table__, rows)
+            reset_sequence(conn, model.__table__)
+            elapsed = time.perf_counter() - started
+            timings[name] = {"rows": inserted, "seconds": round(elapsed, 2), "rows_per_s": round(inserted / max(elapsed, 1e-9))}
+            print(f"{name}: {inserted} строк за {elapsed:.1f} с")
+
+        first_user = next_id(conn, User)
+        users = list(gen_users(rng, first_user, counts["users"], hashed_password, now))
+        load("users", User, users)
+        farmer_ids = [u["id"] for u in users if u["account_type"] == "farmer"]
+        agronomist_ids = [u["id"] for u in users if u["account_type"] == "agronomist"]
+        del users
+
+        # координаты ферм нужны пастбищам; id идут подряд, поэтому хватает массивов
+        first_farm = next_id(conn, Farm)
+        farm_lats, farm_lngs = array.array("d"), array.array("d")
+
+        def farms_with_coords():
+            for row in gen_farms(rng, first_farm, counts["farms"], farmer_ids, agronomist_ids, now):
+                farm_lats.append(row["coordinates_lat"])
+                farm_lngs.append(row["coordinates_lng"])
+                yield row
+
+        load("farms", Farm, farms_with_coords())
+        farm_ids = range(first_farm, first_farm + counts["farms"])
+
+        first_pasture = next_id(conn, Pasture)
+        load("pastures", Pasture, gen_pastures(rng, first_pasture, counts["pastures"], first_farm, farm_lats, farm_lngs, now))
+        load("drones", Drone, gen_drones(rng, next_id(conn, Drone), counts["drones"], farm_ids, now))
+
+        pasture_ids = range(first_pasture, first_pasture + counts["pastures"])
+        load("measurements", Measurement, gen_measurements(rng, next_id(conn, Measurement), counts["measurements"], pasture_ids, now))
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Заполнить БД синтетическими данными")
+    parser.add_argument("--scale", type=float, default=1.0, help="множитель к полному объёму (100k пользователей, 1M ферм)")
+    for name, default in FULL_SCALE.items():
+        parser.add_argument(f"--{name}", type=int, default=None, help=f"переопределить количество (по умолчанию {default} * scale)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    counts = {name: getattr(args, name) or max(1, int(default * args.scale)) for name, default in FULL_SCALE.items()}
+    print("Объёмы:", counts)
+    seed(counts, args.seed)
+    print(f"Готово. Пароль всех пользователей: {SEED_PASSWORD}")
+
+
+if __name__ == "__main__":
+    main()
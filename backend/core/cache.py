@@ -0,0 +1,211 @@
+# backend/core/cache.py
+# Read-through кэш коллекций, привязанных к владельцу (фермы, пастбища, дроны).
+#
+# Бэкенды (CACHE_BACKEND):
+#   memory — LRU в процессе (по умолчанию);
+#   redis  — общий для всех воркеров (CACHE_URL, нужен пакет redis);
+#   local  — локальная замена redis: тот же код с сериализацией, но хранилище в процессе.
+#   none   — кэш выключен.
+#
+# Инвалидация — через поколение (generation) на пару (коллекция, владелец):
+# CRUD-функции после commit записывают новое поколение (time_ns), и старые ключи
+# становятся недостижимыми. Если ключ поколения вытеснен или истёк, создаётся
+# новое, никогда не совпадающее с прежним, — это даёт промах, но не устаревшие данные.
+# Поколение читается до запроса к БД, поэтому гонка «чтение старых данных / запись»
+# не может оставить устаревшую запись под новым поколением.
+#
+# Бэкенд memory у каждого воркера свой: инвалидация видна только в воркере,
+# обработавшем запись. Поэтому списки передают в ключ ещё и версию коллекции
+# (count, max(updated_at)), которую всё равно считают для ETag.
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable
+
+import orjson
+
+from core.config import settings
+from core.metrics import REGISTRY
+from core.singleflight import SingleFlight
+
+cache_requests_total = REGISTRY.counter(
+    "cache_requests_total", "Обращения к кэшу коллекций", ("namespace", "result"))
+
+
+class LRUCache:
+    """Кэш в процессе: LRU по количеству записей + TTL. Значения не копируются — не изменяйте их"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, ttl: float | None = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+class LocalSharedStore:
+    """Локальная замена клиента redis: get/set(ex)/delete над байтами"""
+
+    def __init__(self):
+        self._data: dict[str, tuple[float, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None or item[0] < time.monotonic():
+                return None
+            return item[1]
+
+    def set(self, key: str, value: bytes, ex: int | None = None):
+        with self._lock:
+            self._data[key] = (time.monotonic() + ex if ex else float("inf"), value)
+
+    def delete(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def flushdb(self):
+        with self._lock:
+            self._data.clear()
+
+
+class SharedCache:
+    """Кэш поверх redis (или LocalSharedStore); значения сериализуются orjson"""
+
+    def __init__(self, client, ttl: float, prefix: str = "kokmaisa:"):
+        self.client = client
+        self.ttl = ttl
+        self.prefix = prefix
+
+    def get(self, key: str):
+        raw = self.client.get(self.prefix + key)
+        return None if raw is None else orjson.loads(raw)
+
+    def set(self, key: str, value, ttl: float | None = None):
+        self.client.set(self.prefix + key, orjson.dumps(value), ex=int(ttl or self.ttl))
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+
+    def clear(self):
+        self.client.flushdb()
+
+
+class NullCache:
+    def get(self, key: str):
+        return None
+
+    def set(self, key: str, value, ttl: float | None = None):
+        pass
+
+    def delete(self, key: str):
+        pass
+
+    def clear(self):
+        pass
+
+
+def create_backend(name: str | None = None):
+    name = name or settings.CACHE_BACKEND
+    if name == "memory":
+        return LRUCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL)
+    if name == "redis":
+        import redis
+
+        return SharedCache(redis.Redis.from_url(settings.CACHE_URL), settings.CACHE_TTL)
+    if name == "local":
+        return SharedCache(LocalSharedStore(), settings.CACHE_TTL)
+    if name == "none":
+        return NullCache()
+    raise ValueError(f"Неизвестный CACHE_BACKEND: {name}")
+
+
+backend = create_backend()
+
+
+def set_backend(new_backend):
+    """Подменить бэкенд (бенчмарки, проверка устаревших чтений)"""
+    global backend
+    backend = new_backend
+
+
+class CollectionCache:
+    """Кэш коллекций одного вида (namespace), разбитых по владельцу"""
+
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        # одинаковые промахи из разных потоков ходят в БД один раз
+        self.flight = SingleFlight(namespace)
+        # кто ещё держит производные данные коллекции (индекс геозон и т.п.)
+        self.listeners: list[Callable[[int], None]] = []
+
+    def _generation_key(self, owner_id: int) -> str:
+        return f"gen:{self.namespace}:{owner_id}"
+
+    def _generation(self, owner_id: int) -> int:
+        generation = backend.get(self._generation_key(owner_id))
+        if generation is None:
+            generation = time.time_ns()
+            backend.set(self._generation_key(owner_id), generation)
+        return generation
+
+    def get_or_load(self, owner_id: int, params: tuple, loader: Callable[[], list]):
+        generation = self._generation(owner_id)
+        key = f"{self.namespace}:{owner_id}:{generation}:{params!r}"
+        value = backend.get(key)
+        if value is not None:
+            cache_requests_total.inc((self.namespace, "hit"))
+            return value
+        cache_requests_total.inc((self.namespace, "miss"))
+
+        def load():
+            loaded = loader()
+            backend.set(key, loaded)
+            return loaded
+
+        return self.flight.do(key, load)
+
+    def invalidate(self, owner_id: int):
+        backend.set(self._generation_key(owner_id), time.time_ns())
+        cache_requests_total.inc((self.namespace, "invalidate"))
+        for listener in self.listeners:
+            listener(owner_id)
+
+
+farms_cache = CollectionCache("farms")
+pastures_cache = CollectionCache("pastures")
+drones_cache = CollectionCache("drones")
+
+
+def cache_stats() -> dict:
+    stats = {}
+    for (namespace, result), value in cache_requests_total._values.items():
+        stats.setdefault(namespace, {})[result] = int(value)
+    return stats
@@ -0,0 +1,126 @@
+# backend/core/compression.py
+# Сжатие ответов brotli/gzip по Accept-Encoding, начиная с COMPRESSION_MIN_SIZE байт.
+# brotli — необязательная зависимость: без неё используется только gzip.
+import gzip
+import zlib
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+from core.config import settings
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/geo+json",
+    "application/x-ndjson",
+    "application/javascript",
+    "text/",
+)
+
+
+def _accepted_encodings(scope) -> set[str]:
+    for name, value in scope["headers"]:
+        if name == b"accept-encoding":
+            accepted = set()
+            for item in value.decode("latin-1").split(","):
+                token, _, params = item.strip().partition(";")
+                if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                    continue
+                accepted.add(token.strip().lower())
+            return accepted
+    return set()
+
+
+class _Compressor:
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._obj = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self.compress, self._finish = self._obj.process, self._obj.finish
+        else:
+            # wbits=31 — формат gzip (заголовок и CRC)
+            self._obj = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+            self.compress, self._finish = self._obj.compress, self._obj.flush
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+class CompressionMiddleware:
+    """Сжимает ответы целиком или потоково (StreamingResponse)"""
+
+    def __init__(self, app, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accepted = _accepted_encodings(scope)
+        if "br" in accepted and brotli is not None:
+            encoding = "br"
+        elif "gzip" in accepted:
+            encoding = "gzip"
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor: _Compressor | None = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is None:
+                headers = {k.lower(): v for k, v in start_message.get("headers", [])}
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                if (
+                    b"content-encoding" in headers
+                    or start_message["status"] in (204, 304)
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start_message)
+                    await send(message)
+                    return
+
+                raw_headers = [(k, v) for k, v in start_message.get("headers", []) if k.lower() != b"content-length"]
+                raw_headers.append((b"content-encoding", encoding.encode()))
+                raw_headers.append((b"vary", b"Accept-Encoding"))
+
+                if not more_body:
+                    compressed = compress_body(body, encoding)
+                    raw_headers.append((b"content-length", str(len(compressed)).encode()))
+                    await send({**start_message, "headers": raw_headers})
+                    await send({"type": "http.response.body", "body": compressed})
+                    return
+
+                compressor = _Compressor(encoding)
+                await send({**start_message, "headers": raw_headers})
+
+            chunk = compressor.compress(body)
+            if not more_body:
+                chunk += compressor.finish()
+            if chunk or not more_body:
+                await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_wrapper)
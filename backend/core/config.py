@@ -28,6 +28,97 @@ class Settings(BaseSettings):
     openai_model: str = Field("meta-llama/llama-3.1-8b-instruct", alias="OPENAI_MODEL")
     openai_base_url: str = Field("https://openrouter.ai/api/v1", alias="OPENAI_BASE_URL")
 
+    # Пул соединений с БД (на каждый воркер)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800
+
+    # Продакшен-сервер (gunicorn_conf.py)
+    WEB_BIND: str = "0.0.0.0:8000"
+    WEB_CONCURRENCY: int = 0  # 0 — по количеству CPU
+    WEB_MAX_REQUESTS: int = 2000  # перезапуск воркера после N запросов
+    WEB_MAX_REQUESTS_JITTER: int = 200
+    WEB_GRACEFUL_TIMEOUT: int = 30  # сколько ждать завершения запросов при SIGTERM
+    WEB_KEEPALIVE: int = 5
+
+    # Каталог для сбора метрик со всех воркеров (пусто — только текущий процесс)
+    METRICS_MULTIPROC_DIR: str = ""
+
+    # Проверять списки через TypeAdapter перед отдачей (core/serialization.py)
+    VALIDATE_LIST_RESPONSES: bool = False
+
+    # Сжатие ответов (core/compression.py)
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+
+    # Профилирование по запросу (пусто — выключено, middleware не подключается)
+    PROFILING_SECRET: str = ""
+    PROFILES_DIR: str = "profiles"
+    PROFILING_INTERVAL_MS: float = 1.0
+
+    # Кэш списков ферм/пастбищ/дронов (core/cache.py): memory, redis, local или none
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: str = ""
+    CACHE_TTL: int = 300
+    CACHE_MAX_ENTRIES: int = 10000
+
+    # Объединение одинаковых одновременных GET (core/singleflight.py)
+    SINGLEFLIGHT_ENABLED: bool = True
+
+    # Импорт ферм и пастбищ из файлов (app/api/imports)
+    IMPORT_MAX_BYTES: int = 512 * 1024 * 1024
+    IMPORT_CHUNK_ROWS: int = 5000
+    IMPORT_MAX_ERRORS: int = 1000
+
+    # Потоковый экспорт (app/api/exports): строк на одну выборку с серверного курсора
+    EXPORT_YIELD_PER: int = 5000
+
+    # Дельта-синхронизация (app/api/sync): записей журнала изменений на страницу
+    SYNC_PAGE_SIZE: int = 5000
+
+    # Телеметрия дронов (app/api/telemetry): буфер в памяти и пакетная запись
+    TELEMETRY_BATCH_SIZE: int = 5000          # точек на одну запись (COPY)
+    TELEMETRY_FLUSH_INTERVAL: float = 0.5     # секунд между записями при малом потоке
+    TELEMETRY_MAX_BUFFER: int = 100_000       # выше — 429 по HTTP и ожидание в WebSocket
+    TELEMETRY_FLUSH_RETRIES: int = 30         # повторов пачки при недоступной БД, затем она отбрасывается
+    TELEMETRY_PARTITIONS_AHEAD: int = 2       # месячных партиций создаётся наперёд
+    TELEMETRY_MAX_CLOCK_SKEW: float = 300.0   # с: точки позже «сейчас» на большее время отклоняются
+
+    # Геозоны: проверка телеметрии по границам пастбищ (app/api/telemetry/geofence.py)
+    GEOFENCE_ENABLED: bool = True
+    GEOFENCE_REFRESH_SECONDS: float = 60.0    # индекс перестраивается не реже (изменения в других воркерах)
+
+    # Возобновляемая загрузка съёмки по частям (app/api/uploads)
+    UPLOAD_DIR: str = "uploads"               # раздаётся как /uploads
+    UPLOAD_PARTIAL_DIR: str = "uploads_partial"  # недокачанные части — вне раздачи, на той же ФС
+    UPLOAD_MAX_BYTES: int = 50 * 1024 ** 3
+    UPLOAD_CHUNK_SIZE: int = 8 * 1024 * 1024  # рекомендуемый клиенту размер PATCH
+    UPLOAD_SESSION_TTL_HOURS: int = 72        # незавершённая загрузка живёт после последней части
+    PHOTO_BATCH_MAX_FILES: int = 500          # фото в одном POST /uploads/photos
+
+    # Отбор кадров из видео съёмки (app/processing/video_frames.py)
+    VIDEO_FRAME_INTERVAL: float = 2.0         # секунд между кадрами; 0 — только смена сцены
+    VIDEO_SCENE_THRESHOLD: float = 0.12       # средняя разница миниатюр (0..1); 0 — выключено
+    VIDEO_HASH_DISTANCE: int = 6              # бит dHash: ближе — почти дубликат
+    VIDEO_FRAME_MAX_WIDTH: int = 1920
+    THUMBNAIL_SIZE: int = 512                 # px по длинной стороне, превью фото измерений
+
+    # Оценка биомассы по снимкам (app/processing/biomass.py)
+    BIOMASS_CALIBRATION: str = "app/processing/calibration/biomass_rgb_v1.json"
+    BIOMASS_BATCH_SIZE: int = 8               # снимков в пачке признаков (время уходит на JPEG, пачка ограничивает память)
+
+    # Очередь фоновых заданий (app/jobs); воркер: python -m app.jobs.worker
+    JOB_WORKERS: int = 2                      # процессов воркера
+    JOB_POLL_INTERVAL: float = 1.0            # с между опросами пустой очереди
+    JOB_LEASE_SECONDS: int = 60               # без heartbeat дольше — задание возвращается в очередь
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_BACKOFF: float = 10.0           # с до первого повтора, дальше вдвое больше
+    JOB_RETRY_MAX_DELAY: float = 3600.0
+    JOB_FARM_CONCURRENCY: int = 2             # одновременных заданий одной фермы
+    JOB_FILES_DIR: str = "job_files"          # общий для API и воркеров: файлы импорта, готовые выгрузки
+    JOB_RESULT_TTL_HOURS: int = 24            # сколько хранятся готовые выгрузки
+
 
 
 settings = Settings()
\ No newline at end of file
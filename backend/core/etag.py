@@ -0,0 +1,32 @@
+# backend/core/etag.py
+# Условные GET: слабый ETag из «версии» коллекции (количество строк и max(updated_at)),
+# чтобы на If-None-Match отвечать 304 без выборки и сериализации списка.
+import hashlib
+
+from fastapi import Request, Response
+
+CACHE_CONTROL = "private, no-cache"  # браузер хранит ответ, но каждый раз перепроверяет
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # слабое сравнение: W/ не учитывается
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def etag_headers(etag: str) -> dict:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
@@ -0,0 +1,202 @@
+# backend/core/geo.py
+# Геометрия пастбищ в координатах WGS 84 (GeoJSON: [lng, lat]).
+#
+# PolygonIndex — подготовленный индекс полигонов для пакетной проверки
+# «точка в полигоне»: рёбра всех полигонов лежат в плоских массивах numpy,
+# кандидаты отбираются по равномерной сетке и bbox, а проверка чётности
+# пересечений луча идёт векторно сразу по всем парам (точка, ребро).
+import numpy as np
+
+GEOMETRY_TYPES = ("Polygon", "MultiPolygon")
+
+# точек за один проход: ограничивает размер промежуточных массивов пар (точка, ребро)
+LOCATE_CHUNK = 4096
+
+METERS_PER_DEGREE = 111_195.0  # градус широты
+MIN_RING_AREA = 1.0            # м²; кольцо меньше — вырожденное (точки на одной прямой и т.п.)
+
+
+def _ring_centroid(ring: list) -> tuple[float, float, float]:
+    """Центроид кольца по формуле площади Гаусса: (площадь, lng, lat)"""
+    # считаем относительно первой вершины — иначе теряется точность на градусных координатах
+    x0, y0 = ring[0][0], ring[0][1]
+    area = cx = cy = 0.0
+    for (x1, y1, *_), (x2, y2, *_) in zip(ring, ring[1:]):
+        x1, y1, x2, y2 = x1 - x0, y1 - y0, x2 - x0, y2 - y0
+        cross = x1 * y2 - x2 * y1
+        area += cross
+        cx += (x1 + x2) * cross
+        cy += (y1 + y2) * cross
+    if abs(area) < 1e-18:
+        xs = [p[0] for p in ring]
+        ys = [p[1] for p in ring]
+        return 0.0, sum(xs) / len(xs), sum(ys) / len(ys)
+    return abs(area) / 2, x0 + cx / (3 * area), y0 + cy / (3 * area)
+
+
+def geometry_center(geometry: dict | None) -> tuple[float, float] | None:
+    """Центральная точка геометрии GeoJSON как (lat, lng)"""
+    if not geometry:
+        return None
+    kind, coords = geometry.get("type"), geometry.get("coordinates")
+    if not coords:
+        return None
+    if kind == "Point":
+        return coords[1], coords[0]
+    if kind == "Polygon":
+        _, lng, lat = _ring_centroid(coords[0])
+        return lat, lng
+    if kind == "MultiPolygon":
+        # центр самого большого полигона
+        _, lng, lat = max(_ring_centroid(polygon[0]) for polygon in coords)
+        return lat, lng
+    return None
+
+
+def _ring_area_m2(ring: list) -> float:
+    """Площадь кольца в м² (локально: градус долготы короче в cos(широты) раз)"""
+    area, _, lat = _ring_centroid(ring)
+    return float(area * METERS_PER_DEGREE ** 2 * np.cos(np.radians(lat)))
+
+
+def validate_boundary(geometry: dict) -> dict:
+    """Проверить GeoJSON Polygon/MultiPolygon; кольца замыкаются, если не замкнуты"""
+    kind, coords = geometry.get("type"), geometry.get("coordinates")
+    if kind not in GEOMETRY_TYPES:
+        raise ValueError("Граница пастбища — GeoJSON Polygon или MultiPolygon")
+    polygons = [coords] if kind == "Polygon" else coords
+    if not isinstance(polygons, list) or not polygons:
+        raise ValueError("Пустая геометрия границы")
+    closed = []
+    for polygon in polygons:
+        rings = []
+        for ring in polygon or []:
+            points = [[float(p[0]), float(p[1])] for p in ring]
+            if points and points[0] != points[-1]:
+                points.append(points[0])
+            if len(points) < 4:
+                raise ValueError("Кольцо полигона должно содержать не меньше трёх точек")
+            if not all(-180 <= x <= 180 and -90 <= y <= 90 for x, y in points):
+                raise ValueError("Координаты границы вне диапазона WGS 84")
+            if _ring_area_m2(points) <= MIN_RING_AREA:
+                raise ValueError("Кольцо полигона вырождено: нулевая площадь")
+            rings.append(points)
+        if not rings:
+            raise ValueError("Полигон без колец")
+        closed.append(rings)
+    return {"type": kind, "coordinates": closed[0] if kind == "Polygon" else closed}
+
+
+def _ragged_arange(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Склеенные диапазоны [start, start + count) без цикла Python"""
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return np.arange(total, dtype=np.int64) + offsets
+
+
+class PolygonIndex:
+    """Неизменяемый индекс полигонов; locate() возвращает позицию ключа или -1"""
+
+    def __init__(self, keys: list, geometries: list[dict], cell_size: float | None = None):
+        self.keys = list(keys)
+        part_keys, bboxes, edges = [], [], []
+        for key_index, geometry in enumerate(geometries):
+            polygons = [geometry["coordinates"]] if geometry["type"] == "Polygon" else geometry["coordinates"]
+            for polygon in polygons:
+                # все кольца части (внешнее и дырки) — правило чётности учитывает дырки само
+                rings = [np.asarray(ring, dtype=np.float64)[:, :2] for ring in polygon]
+                part_edges = np.concatenate([np.hstack([ring[:-1], ring[1:]]) for ring in rings])
+                outer = rings[0]
+                part_keys.append(key_index)
+                bboxes.append((outer[:, 0].min(), outer[:, 1].min(), outer[:, 0].max(), outer[:, 1].max()))
+                edges.append(part_edges)
+
+        self.part_key = np.asarray(part_keys, dtype=np.int64)
+        self.bbox = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        counts = np.asarray([len(e) for e in edges], dtype=np.int64)
+        self.edge_start = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64) if len(counts) else counts
+        self.edge_count = counts
+        all_edges = np.concatenate(edges) if edges else np.empty((0, 4))
+        self.x1, self.y1, self.x2, self.y2 = (np.ascontiguousarray(all_edges[:, i]) for i in range(4))
+        self._build_grid(cell_size)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _build_grid(self, cell_size: float | None):
+        if not len(self.bbox):
+            self.cell = 1.0
+            self.cells = np.empty(0, dtype=np.int64)
+            self.cell_start = np.zeros(1, dtype=np.int64)
+            self.cell_parts = np.empty(0, dtype=np.int64)
+            return
+        extent = np.maximum(self.bbox[:, 2] - self.bbox[:, 0], self.bbox[:, 3] - self.bbox[:, 1])
+        # ячейка порядка типичного пастбища: 1-4 кандидата на точку
+        self.cell = float(cell_size or max(float(np.median(extent)), 1e-6))
+        ix0 = np.floor(self.bbox[:, 0] / self.cell).astype(np.int64)
+        iy0 = np.floor(self.bbox[:, 1] / self.cell).astype(np.int64)
+        ix1 = np.floor(self.bbox[:, 2] / self.cell).astype(np.int64)
+        iy1 = np.floor(self.bbox[:, 3] / self.cell).astype(np.int64)
+        cell_ids, part_ids = [], []
+        for part, (ax, ay, bx, by) in enumerate(zip(ix0, iy0, ix1, iy1)):
+            xs, ys = np.meshgrid(np.arange(ax, bx + 1), np.arange(ay, by + 1))
+            cell_ids.append(self._cell_id(xs.ravel(), ys.ravel()))
+            part_ids.append(np.full(xs.size, part, dtype=np.int64))
+        cell_ids, part_ids = np.concatenate(cell_ids), np.concatenate(part_ids)
+        order = np.argsort(cell_ids, kind="stable")
+        cell_ids, self.cell_parts = cell_ids[order], part_ids[order]
+        self.cells, first = np.unique(cell_ids, return_index=True)
+        self.cell_start = np.append(first, len(cell_ids)).astype(np.int64)
+
+    @staticmethod
+    def _cell_id(ix: np.ndarray, iy: np.ndarray) -> np.ndarray:
+        # градусная сетка конечна: сдвиг и упаковка в одно int64
+        return (ix + (1 << 31)) * (1 << 32) + (iy + (1 << 31))
+
+    def locate(self, lng, lat) -> np.ndarray:
+        """Для каждой точки — позиция ключа полигона, который её содержит, иначе -1"""
+        lng = np.asarray(lng, dtype=np.float64)
+        lat = np.asarray(lat, dtype=np.float64)
+        result = np.full(len(lng), -1, dtype=np.int64)
+        if not len(self.cells):
+            return result
+        for start in range(0, len(lng), LOCATE_CHUNK):
+            end = start + LOCATE_CHUNK
+            result[start:end] = self._locate_chunk(lng[start:end], lat[start:end])
+        return result
+
+    def _locate_chunk(self, px: np.ndarray, py: np.ndarray) -> np.ndarray:
+        result = np.full(len(px), -1, dtype=np.int64)
+        ids = self._cell_id(np.floor(px / self.cell).astype(np.int64), np.floor(py / self.cell).astype(np.int64))
+        pos = np.searchsorted(self.cells, ids)
+        pos = np.minimum(pos, len(self.cells) - 1)
+        hit = self.cells[pos] == ids
+        counts = np.where(hit, self.cell_start[pos + 1] - self.cell_start[pos], 0)
+
+        # пары (точка, часть полигона) из ячейки точки, затем отсев по bbox
+        pair_point = np.repeat(np.arange(len(px)), counts)
+        pair_part = self.cell_parts[_ragged_arange(self.cell_start[pos][hit], counts[hit])]
+        x, y = px[pair_point], py[pair_point]
+        box = self.bbox[pair_part]
+        inside_box = (x >= box[:, 0]) & (x <= box[:, 2]) & (y >= box[:, 1]) & (y <= box[:, 3])
+        pair_point, pair_part = pair_point[inside_box], pair_part[inside_box]
+        if not len(pair_part):
+            return result
+
+        # пары (точка, ребро): луч вправо от точки, считаем пересечения рёбер
+        edge_counts = self.edge_count[pair_part]
+        edge = _ragged_arange(self.edge_start[pair_part], edge_counts)
+        pair_of_edge = np.repeat(np.arange(len(pair_part)), edge_counts)
+        ex = px[pair_point][pair_of_edge]
+        ey = py[pair_point][pair_of_edge]
+        x1, y1, x2, y2 = self.x1[edge], self.y1[edge], self.x2[edge], self.y2[edge]
+        straddles = (y1 > ey) != (y2 > ey)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cross_x = x1 + (ey - y1) * (x2 - x1) / (y2 - y1)
+        crossings = np.bincount(pair_of_edge, weights=straddles & (ex < cross_x), minlength=len(pair_part))
+        inside = crossings % 2 == 1
+        # пастбища не пересекаются; при наложении выигрывает последняя часть
+        result[pair_point[inside]] = self.part_key[pair_part[inside]]
+        return result
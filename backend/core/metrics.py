@@ -0,0 +1,323 @@
+# backend/core/metrics.py
+# Метрики в текстовом формате Prometheus без внешних зависимостей.
+#
+# Каждый воркер gunicorn считает свои метрики. Если задан METRICS_MULTIPROC_DIR,
+# воркеры периодически сбрасывают снимки туда, а /metrics суммирует их все,
+# поэтому при скрейпе неважно, какой воркер ответил.
+import asyncio
+import contextvars
+import fcntl
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+from sqlalchemy import event
+
+from core.config import settings
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple, object] = {}
+        self._lock = threading.Lock()
+
+    def _format_labels(self, labels: tuple, extra: str = "") -> str:
+        parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(self.labelnames, labels)]
+        if extra:
+            parts.append(extra)
+        return "{" + ",".join(parts) + "}" if parts else ""
+
+    def snapshot(self) -> list:
+        with self._lock:
+            return [[list(k), v if not isinstance(v, list) else list(v)] for k, v in self._values.items()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, labels: tuple = (), amount: float = 1.0):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, labels: tuple = ()) -> float:
+        return self._values.get(labels, 0.0)
+
+    @staticmethod
+    def merge(a, b):
+        return a + b
+
+    def render(self, values: dict) -> list[str]:
+        return [f"{self.name}{self._format_labels(k)} {_num(v)}" for k, v in values.items()]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, labels: tuple = (), amount: float = 1.0):
+        self.inc(labels, -amount)
+
+    def set(self, value: float, labels: tuple = ()):
+        with self._lock:
+            self._values[labels] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value: float, labels: tuple = ()):
+        # [счётчики по корзинам..., +Inf, сумма]
+        with self._lock:
+            data = self._values.get(labels)
+            if data is None:
+                data = self._values[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            data[bisect_left(self.buckets, value)] += 1
+            data[-1] += value
+
+    @staticmethod
+    def merge(a, b):
+        return [x + y for x, y in zip(a, b)]
+
+    def render(self, values: dict) -> list[str]:
+        lines = []
+        for labels, data in values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), data):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _num(bound)
+                le_label = 'le="' + le + '"'
+                lines.append(f"{self.name}_bucket{self._format_labels(labels, le_label)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._format_labels(labels)} {_num(data[-1])}")
+            lines.append(f"{self.name}_count{self._format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, documentation: str, labelnames: tuple = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def snapshot(self) -> dict:
+        return {name: metric.snapshot() for name, metric in self._metrics.items()}
+
+    def render(self, snapshots: list[dict] | None = None) -> str:
+        """Текстовый формат Prometheus; snapshots — снимки других процессов для суммирования"""
+        snapshots = snapshots or [self.snapshot()]
+        lines = []
+        for name, metric in self._metrics.items():
+            merged: dict[tuple, object] = {}
+            for snap in snapshots:
+                for labels, value in snap.get(name, []):
+                    key = tuple(labels)
+                    merged[key] = metric.merge(merged[key], value) if key in merged else value
+            lines.append(f"# HELP {name} {metric.documentation}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.render(merged))
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _num(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+REGISTRY = Registry()
+
+http_requests_total = REGISTRY.counter(
+    "http_requests_total", "Количество HTTP-запросов", ("method", "route", "status"))
+http_request_duration_seconds = REGISTRY.histogram(
+    "http_request_duration_seconds", "Время обработки запроса", ("method", "route"))
+http_request_db_seconds = REGISTRY.histogram(
+    "http_request_db_seconds", "Время SQL-запросов внутри HTTP-запроса", ("method", "route"))
+http_requests_in_flight = REGISTRY.gauge(
+    "http_requests_in_flight", "Запросы, обрабатываемые в данный момент")
+http_request_upload_bytes_total = REGISTRY.counter(
+    "http_request_upload_bytes_total", "Объём тел запросов (загрузки)", ("method", "route"))
+
+
+# ---------- Время БД ----------
+
+# Изменяемый список [секунды] текущего запроса; контекст копируется в threadpool,
+# поэтому синхронные эндпоинты пишут в тот же объект.
+_request_db_time: contextvars.ContextVar[list | None] = contextvars.ContextVar("request_db_time", default=None)
+
+
+def instrument_engine(engine):
+    """Подключает замер времени SQL к engine"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        acc = _request_db_time.get()
+        if acc is not None:
+            acc[0] += time.perf_counter() - started
+
+
+# ---------- Middleware ----------
+
+class MetricsMiddleware:
+    """Чистый ASGI middleware: счётчики, латентность, время БД и объём загрузок по шаблону пути"""
+
+    def __init__(self, app):
+        self.app = app
+        self._routes: dict | None = None
+
+    def _route_template(self, scope) -> str:
+        if self._routes is None:
+            self._routes = {}
+            for route in scope["app"].routes:
+                endpoint = getattr(route, "endpoint", None)
+                if endpoint is not None:
+                    self._routes[endpoint] = route.path
+        endpoint = scope.get("endpoint")
+        if endpoint is not None:
+            return self._routes.get(endpoint, "unmatched")
+        root_path = scope.get("root_path")
+        return f"{root_path}/*" if root_path else "unmatched"
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_holder = [500]
+        upload = [0]
+        db_time = [0.0]
+        token = _request_db_time.set(db_time)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder[0] = message["status"]
+            await send(message)
+
+        async def receive_wrapper():
+            message = await receive()
+            upload[0] += len(message.get("body", b""))
+            return message
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec()
+            _request_db_time.reset(token)
+            method = scope["method"]
+            route = self._route_template(scope)
+            http_requests_total.inc((method, route, status_holder[0]))
+            http_request_duration_seconds.observe(elapsed, (method, route))
+            http_request_db_seconds.observe(db_time[0], (method, route))
+            if upload[0]:
+                http_request_upload_bytes_total.inc((method, route), upload[0])
+
+
+# ---------- Сбор со всех воркеров ----------
+
+def _snapshot_path(pid: int) -> Path:
+    return Path(settings.METRICS_MULTIPROC_DIR) / f"metrics_{pid}.json"
+
+
+def write_snapshot():
+    if not settings.METRICS_MULTIPROC_DIR:
+        return
+    path = _snapshot_path(os.getpid())
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps({"pid": os.getpid(), "metrics": REGISTRY.snapshot()}))
+    tmp.replace(path)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except OSError:
+        return False
+    return True
+
+
+def _merge_snapshot(target: dict, source: dict):
+    for name, items in source.items():
+        metric = REGISTRY._metrics.get(name)
+        if metric is None or metric.kind == "gauge":
+            continue
+        merged = {tuple(labels): value for labels, value in target.get(name, [])}
+        for labels, value in items:
+            key = tuple(labels)
+            merged[key] = metric.merge(merged[key], value) if key in merged else value
+        target[name] = [[list(k), v] for k, v in merged.items()]
+
+
+def collect_snapshots() -> list[dict]:
+    """Снимки всех воркеров; счётчики завершённых воркеров сворачиваются в metrics_dead.json"""
+    write_snapshot()
+    if not settings.METRICS_MULTIPROC_DIR:
+        return [REGISTRY.snapshot()]
+    directory = Path(settings.METRICS_MULTIPROC_DIR)
+    dead_path = directory / "metrics_dead.json"
+    snapshots = []
+    with open(directory / ".lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        dead = json.loads(dead_path.read_text()) if dead_path.exists() else {}
+        dead_changed = False
+        for path in directory.glob("metrics_[0-9]*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            if _pid_alive(data["pid"]):
+                snapshots.append(data["metrics"])
+            else:
+                _merge_snapshot(dead, data["metrics"])
+                path.unlink(missing_ok=True)
+                dead_changed = True
+        if dead_changed:
+            dead_path.write_text(json.dumps(dead))
+    snapshots.append(dead)
+    return snapshots
+
+
+async def snapshot_loop(interval: float = 5.0):
+    while True:
+        await asyncio.sleep(interval)
+        write_snapshot()
+
+
+async def metrics_endpoint(request: Request):
+    return PlainTextResponse(
+        REGISTRY.render(collect_snapshots()),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -0,0 +1,191 @@
+# backend/core/profiling.py
+# Профилирование отдельного запроса по подписанному токену.
+#
+# Токен выдаётся администратором:
+#   python -m core.profiling GET /api/pastures/ --ttl 600
+# и передаётся в заголовке X-Profile или в параметре ?__profile=<токен>.
+# Результат — файл свёрнутых стеков (формат flamegraph.pl / speedscope)
+# в PROFILES_DIR; имя файла возвращается в заголовке X-Profile-Artifact.
+#
+# Middleware подключается только если задан PROFILING_SECRET, а обычные
+# запросы не запускают сэмплер, поэтому без токена профилирование ничего не стоит.
+#
+# В профиль попадают только стеки этого запроса: поток цикла событий — пока на
+# его стеке кадр middleware этого запроса (а не корутина соседнего запроса), и
+# потоки пула, выполняющие синхронный код в контексте этого запроса
+# (run_in_threadpool копирует contextvars в поток).
+import argparse
+import contextvars
+import hashlib
+import hmac
+import logging
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+HEADER_NAME = b"x-profile"
+QUERY_NAME = "__profile"
+
+# Потоки, у которых на вершине стека ожидание, считаются простаивающими
+_IDLE_MODULES = {"selectors.py", "threading.py", "queue.py"}
+
+# сэмплер профилируемого запроса — виден в потоках пула через скопированный контекст
+_active_sampler: contextvars.ContextVar["StackSampler | None"] = contextvars.ContextVar("active_sampler", default=None)
+
+
+def sign_profile_request(method: str, path: str, expires: int, secret: str | None = None) -> str:
+    secret = secret or settings.PROFILING_SECRET
+    message = f"{expires}:{method.upper()}:{path}".encode()
+    digest = hmac.new(secret.encode(), message, hashlib.sha256).hexdigest()
+    return f"{expires}.{digest}"
+
+
+def verify_profile_token(token: str, method: str, path: str) -> bool:
+    try:
+        expires_raw, _ = token.split(".", 1)
+        expires = int(expires_raw)
+    except ValueError:
+        return False
+    if expires < time.time():
+        return False
+    expected = sign_profile_request(method, path, expires)
+    return hmac.compare_digest(expected, token)
+
+
+class StackSampler:
+    """Сэмплирующий профайлер: раз в interval снимает стеки потоков, занятых запросом"""
+
+    def __init__(self, interval: float, root=None):
+        self.interval = interval
+        self.root = root  # кадр корутины запроса в потоке цикла событий
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _owns(self, frames: list) -> bool:
+        """Стек принадлежит запросу: в нём кадр запроса или контекст с этим сэмплером"""
+        if self.root is None:
+            return True
+        for frame in frames:
+            if frame is self.root:
+                return True
+            # поток пула anyio выполняет context.run(func) — контекст лежит в локальных
+            # переменных кадра, вызвавшего context.run
+            context = frame.f_locals.get("context") if frame.f_code.co_name == "run" else None
+            if isinstance(context, contextvars.Context) and context.get(_active_sampler) is self:
+                return True
+        return False
+
+    def _run(self):
+        own_ident = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident or Path(frame.f_code.co_filename).name in _IDLE_MODULES:
+                    continue
+                frames = []
+                while frame is not None:
+                    frames.append(frame)
+                    frame = frame.f_back
+                if not self._owns(frames):
+                    continue
+                stack = [f"{f.f_code.co_name} ({Path(f.f_code.co_filename).name}:{f.f_code.co_firstlineno})"
+                         for f in frames]
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def write_folded(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _requested_token(scope) -> str | None:
+    for name, value in scope["headers"]:
+        if name == HEADER_NAME:
+            return value.decode("latin-1")
+    query = scope.get("query_string", b"")
+    if QUERY_NAME.encode() in query:
+        values = parse_qs(query.decode("latin-1")).get(QUERY_NAME)
+        if values:
+            return values[0]
+    return None
+
+
+class ProfilingMiddleware:
+    """Запускает StackSampler на время запроса с валидным токеном профилирования"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _requested_token(scope)
+        if token is None:
+            await self.app(scope, receive, send)
+            return
+        if not verify_profile_token(token, scope["method"], scope["path"]):
+            logger.warning("Неверный токен профилирования для %s %s", scope["method"], scope["path"])
+            await self.app(scope, receive, send)
+            return
+
+        slug = scope["path"].strip("/").replace("/", "_") or "root"
+        filename = f"{time.strftime('%Y%m%d-%H%M%S')}_{scope['method']}_{slug}_{uuid.uuid4().hex[:6]}.folded"
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-artifact", filename.encode()),
+                ]
+            await send(message)
+
+        sampler = StackSampler(settings.PROFILING_INTERVAL_MS / 1000, root=sys._getframe())
+        context_token = _active_sampler.set(sampler)
+        sampler.start()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            sampler.stop()
+            _active_sampler.reset(context_token)
+            sampler.write_folded(Path(settings.PROFILES_DIR) / filename)
+            logger.info(
+                "Профиль %s %s: %.1f мс, %d сэмплов -> %s",
+                scope["method"], scope["path"], (time.perf_counter() - started) * 1000, sampler.samples, filename,
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Выдать токен профилирования для одного эндпоинта")
+    parser.add_argument("method")
+    parser.add_argument("path")
+    parser.add_argument("--ttl", type=int, default=600, help="срок действия токена, секунды")
+    args = parser.parse_args()
+    if not settings.PROFILING_SECRET:
+        sys.exit("PROFILING_SECRET не задан")
+    print(sign_profile_request(args.method, args.path, int(time.time()) + args.ttl))
+
+
+if __name__ == "__main__":
+    main()
@@ -48,7 +48,18 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     return encoded_jwt
 
 
-async def get_current_user(
+def user_id_from_token(token: str) -> int | None:
+    """id пользователя из JWT без обращения к БД (None — токен недействителен)"""
+    try:
+        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+    except JWTError:
+        return None
+    return payload.get("user_id")  # или "sub" — зависит от create_access_token
+
+
+# Синхронная: FastAPI выполняет её в пуле потоков. В async-варианте запрос к БД
+# блокировал event loop, и при всплеске запросов сверх размера пула всё вставало.
+def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Session = Depends(get_db)
 ):
@@ -57,12 +68,8 @@ async def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        user_id: int = payload.get("user_id")  # или "sub" — зависит от create_access_token
-        if user_id is None:
-            raise credentials_exception
-    except JWTError:
+    user_id = user_id_from_token(token)
+    if user_id is None:
         raise credentials_exception
 
     user = db.query(User).filter(User.id == user_id).first()
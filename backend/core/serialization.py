@@ -0,0 +1,50 @@
+# backend/core/serialization.py
+# Быстрая отдача списков: из БД выбираются только колонки схемы ответа,
+# строки уже имеют форму JSON-ответа и сериализуются orjson без ORM и Pydantic.
+#
+# При VALIDATE_LIST_RESPONSES=true строки дополнительно проходят через заранее
+# собранный TypeAdapter(list[Схема]) — удобно на стенде, чтобы ловить
+# расхождения схемы и таблицы.
+#
+# Параметр ?fields=id,name,coordinates_lat сужает и SELECT, и ответ: тяжёлые
+# JSON/Text-колонки (photos, crops, description) не читаются из БД вовсе.
+from typing import Iterable
+
+from fastapi import HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Column
+
+from core.config import settings
+
+
+class ListSerializer:
+    """Колонки и сериализатор списка для пары (Pydantic-схема ответа, ORM-модель)"""
+
+    def __init__(self, schema: type[BaseModel], model):
+        self.schema = schema
+        self.columns: list[Column] = [model.__table__.c[name] for name in schema.model_fields]
+        self.adapter = TypeAdapter(list[schema])
+        self.fields_description = (
+            "Поля ответа через запятую (id добавляется всегда): " + ", ".join(schema.model_fields)
+        )
+
+    def select(self, fields: str | None) -> list[Column]:
+        """Колонки для ?fields= в порядке схемы; без параметра — все колонки схемы"""
+        if not fields:
+            return self.columns
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - self.schema.model_fields.keys()
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Неизвестные поля: {', '.join(sorted(unknown))}")
+        requested.add("id")
+        return [column for column in self.columns if column.key in requested]
+
+    def response(self, rows: Iterable[dict], status_code: int = 200, headers: dict | None = None,
+                 columns: list[Column] | None = None) -> Response:
+        rows = rows if isinstance(rows, list) else list(rows)
+        # неполные строки (?fields=) схеме не соответствуют — проверяем только полные
+        if settings.VALIDATE_LIST_RESPONSES and (columns is None or columns is self.columns):
+            body = self.adapter.dump_json(self.adapter.validate_python(rows))
+            return Response(body, status_code=status_code, headers=headers, media_type="application/json")
+        return ORJSONResponse(rows, status_code=status_code, headers=headers)
@@ -0,0 +1,154 @@
+# backend/core/singleflight.py
+# Single-flight: одинаковые одновременные вызовы выполняются один раз,
+# остальные ждут и получают тот же результат (или то же исключение).
+#
+#   SingleFlight          — для синхронного кода (CRUD в пуле потоков);
+#   AsyncSingleFlight     — для корутин;
+#   SingleFlightMiddleware — объединяет одинаковые авторизованные GET к спискам.
+#
+# Ведущий вызов (leader) выполняет работу, ведомые (follower) только ждут;
+# доля ведомых в singleflight_calls_total и есть доля сэкономленных выполнений.
+import asyncio
+import threading
+from typing import Awaitable, Callable
+
+from core.metrics import REGISTRY
+
+singleflight_calls_total = REGISTRY.counter(
+    "singleflight_calls_total", "Вызовы через single-flight (follower — объединённые)", ("name", "role"))
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Объединение одинаковых одновременных вызовов в потоках"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn: Callable):
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            singleflight_calls_total.inc((self.name, "follower"))
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        singleflight_calls_total.inc((self.name, "leader"))
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Объединение одинаковых одновременных корутин в одном event loop"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: dict[object, asyncio.Future] = {}
+
+    async def do(self, key, fn: Callable[[], Awaitable]):
+        future = self._calls.get(key)
+        if future is not None:
+            singleflight_calls_total.inc((self.name, "follower"))
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # ведущего отменили (а не нас) — выполняем сами
+                if future.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.do(key, fn)
+                raise
+
+        singleflight_calls_total.inc((self.name, "leader"))
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # исключение забирают ведомые; без них — не ругаемся «never retrieved»
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+class SingleFlightMiddleware:
+    """Объединяет одинаковые одновременные GET одного пользователя к одному адресу.
+
+    Ключ — Authorization, путь, query и If-None-Match. Ответ ведущего запроса
+    буферизуется и проигрывается каждому ведомому. Ставится внутри CORS и сжатия,
+    чтобы они отработали для каждого клиента отдельно.
+    """
+
+    def __init__(self, app, paths: tuple[str, ...] = ("/api/",)):
+        self.app = app
+        self.paths = paths
+        self.flight = AsyncSingleFlight("http")
+
+    def _key(self, scope):
+        if scope["type"] != "http" or scope["method"] != "GET" or not scope["path"].startswith(self.paths):
+            return None
+        authorization = if_none_match = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value
+            elif name == b"if-none-match":
+                if_none_match = value
+            elif name == b"x-profile":
+                return None
+        if authorization is None or b"__profile" in scope["query_string"]:
+            return None
+        return authorization, scope["path"], scope["query_string"], if_none_match
+
+    async def __call__(self, scope, receive, send):
+        key = self._key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        async def run():
+            messages = []
+
+            async def capture(message):
+                messages.append(message)
+
+            await self.app(scope, receive, capture)
+            # маршрут, найденный ведущим, нужен внешним middleware (метрики) и у ведомых
+            routed = {k: scope[k] for k in ("endpoint", "route", "path_params") if k in scope}
+            return messages, routed
+
+        messages, routed = await self.flight.do(key, run)
+        scope.update(routed)
+        for message in messages:
+            # внешние middleware (CORS) дописывают заголовки на месте — каждому своя копия
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", []))}
+            await send(message)
@@ -0,0 +1,70 @@
+# backend/database/bulk.py
+# Массовая вставка в обход ORM: COPY для PostgreSQL, executemany для остальных БД.
+import io
+import json
+from itertools import islice
+from typing import Iterable
+
+from sqlalchemy import Table, text
+from sqlalchemy.engine import Connection
+
+
+def _chunks(rows: Iterable, size: int):
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def _copy_field(value) -> str:
+    """Поле COPY CSV: NULL — пустое поле без кавычек, строки всегда в кавычках,
+    поэтому пустая строка ("") остаётся пустой строкой"""
+    if value is None:
+        return ""
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+def _copy_buffer(columns: list[str], rows: list[dict]) -> io.StringIO:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join([_copy_field(row.get(c)) for c in columns]))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _copy_chunk(connection: Connection, table: Table, columns: list[str], rows: list[dict]):
+    buffer = _copy_buffer(columns, rows)
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    cursor = connection.connection.dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(f'COPY "{table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv)', buffer)
+    finally:
+        cursor.close()
+
+
+def bulk_insert(connection: Connection, table: Table, rows: Iterable[dict], columns: list[str] | None = None, chunk_size: int = 10_000) -> int:
+    """Вставить строки пачками; возвращает количество вставленных строк"""
+    columns = columns or [c.name for c in table.columns]
+    use_copy = connection.dialect.name == "postgresql"
+    total = 0
+    for chunk in _chunks(rows, chunk_size):
+        if use_copy:
+            _copy_chunk(connection, table, columns, chunk)
+        else:
+            connection.execute(table.insert(), [{c: row.get(c) for c in columns} for row in chunk])
+        total += len(chunk)
+    return total
+
+
+def reset_sequence(connection: Connection, table: Table, column: str = "id"):
+    """После вставки с явными id сдвинуть последовательность PostgreSQL"""
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('{table.name}', '{column}'), "
+        f"COALESCE((SELECT MAX({column}) FROM \"{table.name}\"), 1))"
+    ))
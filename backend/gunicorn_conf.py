@@ -0,0 +1,31 @@
+# backend/gunicorn_conf.py
+# Продакшен-запуск:  gunicorn -c gunicorn_conf.py main:app
+# Для разработки по-прежнему используется run.py (один процесс, reload).
+import multiprocessing
+
+from core.config import settings
+
+bind = settings.WEB_BIND
+# uvicorn-воркер асинхронный и сам держит много соединений: формула 2*CPU+1
+# рассчитана на синхронные воркеры, здесь достаточно процесса на ядро
+workers = settings.WEB_CONCURRENCY or multiprocessing.cpu_count()
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Приложение импортируется один раз в мастере, воркеры получают его через fork;
+# пулы соединений каждый воркер создаёт заново в lifespan (main.py)
+preload_app = True
+
+# Перезапуск воркера после N запросов ограничивает рост памяти;
+# jitter не даёт всем воркерам перезапуститься одновременно
+max_requests = settings.WEB_MAX_REQUESTS
+max_requests_jitter = settings.WEB_MAX_REQUESTS_JITTER
+
+# SIGTERM: воркер перестаёт принимать соединения и дожидается
+# текущих запросов не дольше graceful_timeout, затем lifespan закрывает пулы
+graceful_timeout = settings.WEB_GRACEFUL_TIMEOUT
+timeout = settings.WEB_GRACEFUL_TIMEOUT * 2
+keepalive = settings.WEB_KEEPALIVE
+
+accesslog = "-"
+errorlog = "-"
+
@@ -1,11 +1,65 @@
 # backend/main.py
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import httpx
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import text
+
+from core.compression import CompressionMiddleware
 from core.config import settings
+from core.metrics import MetricsMiddleware, instrument_engine, metrics_endpoint, snapshot_loop
+from core.profiling import ProfilingMiddleware
+from core.singleflight import SingleFlightMiddleware
+from database.db import engine
 from app.router import router
+from app.api.telemetry.buffer import telemetry_buffer
+from app.api.telemetry.crud.telemetry_crud import ensure_partitions
+
+
+def _prepare_database():
+    # При preload_app приложение импортируется в мастер-процессе до fork,
+    # поэтому каждый воркер начинает со своего, пустого пула соединений.
+    engine.dispose(close=False)
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    # секции телеметрии на ближайшие месяцы (IF NOT EXISTS — безопасно из каждого воркера)
+    with engine.begin() as conn:
+        ensure_partitions(conn)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # синхронный драйвер — в потоке, чтобы не блокировать цикл событий воркера
+    await run_in_threadpool(_prepare_database)
+
+    # Общий HTTP-пул для исходящих запросов (AI и т.п.)
+    app.state.http_client = httpx.AsyncClient(
+        timeout=60,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+    metrics_task = asyncio.create_task(snapshot_loop())
+    telemetry_buffer.start()
+    try:
+        yield
+    finally:
+        metrics_task.cancel()
+        await telemetry_buffer.stop()
+        await app.state.http_client.aclose()
+        await run_in_threadpool(engine.dispose)
+
+
+app = FastAPI(title="KokMaisa API", lifespan=lifespan)
+
+instrument_engine(engine)
 
-app = FastAPI(title="KokMaisa API")
+# Объединение одинаковых одновременных GET к спискам — самый внутренний слой
+if settings.SINGLEFLIGHT_ENABLED:
+    app.add_middleware(SingleFlightMiddleware, paths=("/api/farms", "/api/pastures", "/api/drones"))
 
 # CORS middleware
 app.add_middleware(
@@ -14,8 +68,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+app.add_middleware(CompressionMiddleware)
+if settings.PROFILING_SECRET:
+    app.add_middleware(ProfilingMiddleware)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(router)
+app.add_route("/metrics", metrics_endpoint, include_in_schema=False)
 
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# каталог создаётся заранее: StaticFiles не запускается без него, а первый файл
+# появится только после первой загрузки. Медиа съёмки — под неугадываемыми
+# именами (app/api/uploads/storage.py)
+os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
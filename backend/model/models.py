@@ -1,6 +1,6 @@
 # backend/model/models.py
 import datetime
-from sqlalchemy import Column, Date, Integer, String, DateTime, Enum, JSON, func, Float, Text, ForeignKey
+from sqlalchemy import BigInteger, Boolean, Column, Date, Integer, String, DateTime, Enum, JSON, func, Float, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from database.db import Base
 
@@ -34,8 +34,8 @@ class Farm(Base):
     __tablename__ = "farms"
 
     id = Column(Integer, primary_key=True, index=True)
-    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False)          # владелец — фермер
-    agronomist_id = Column(Integer, ForeignKey("users.id"), nullable=True)      # консультирующий агроном (опционально)
+    owner_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)          # владелец — фермер
+    agronomist_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)      # консультирующий агроном (опционально)
 
     name = Column(String, nullable=False)
     address = Column(String)
@@ -72,13 +72,14 @@ class Pasture(Base):
     __tablename__ = "pastures"
 
     id = Column(Integer, primary_key=True, index=True)
-    farm_id = Column(Integer, ForeignKey("farms.id"), nullable=False)
+    farm_id = Column(Integer, ForeignKey("farms.id"), nullable=False, index=True)
 
     name = Column(String, nullable=False)
     area = Column(Float, nullable=False)  # площадь в га
     pasture_type = Column(String)         # тип пастбища
     coordinates_lat = Column(Float)       # центральная точка
     coordinates_lng = Column(Float)
+    boundary = Column(JSON(none_as_null=True))  # граница: GeoJSON Polygon/MultiPolygon в WGS 84
     description = Column(Text)
     status = Column(String, default="active")
 
@@ -86,13 +87,14 @@ class Pasture(Base):
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
 
     farm = relationship("Farm", back_populates="pastures")
+    measurements = relationship("Measurement", back_populates="pasture", cascade="all, delete-orphan", passive_deletes=True)
 
 
 class Drone(Base):
     __tablename__ = "drones"
 
     id = Column(Integer, primary_key=True, index=True)
-    farm_id = Column(Integer, ForeignKey("farms.id"), nullable=False)
+    farm_id = Column(Integer, ForeignKey("farms.id"), nullable=False, index=True)
 
     model = Column(String, nullable=False)
     serial_number = Column(String, unique=True, nullable=False)
@@ -102,4 +104,177 @@ class Drone(Base):
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
 
-    farm = relationship("Farm", back_populates="drones")
\ No newline at end of file
+    farm = relationship("Farm", back_populates="drones")
+
+
+class Measurement(Base):
+    __tablename__ = "measurements"
+    __table_args__ = (
+        Index("ix_measurements_pasture_measured_at", "pasture_id", "measured_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    pasture_id = Column(Integer, ForeignKey("pastures.id", ondelete="CASCADE"), nullable=False)
+    drone_id = Column(Integer, ForeignKey("drones.id", ondelete="SET NULL"), nullable=True)
+
+    method = Column(String, nullable=False)             # photo_upload / drone_video
+    status = Column(String, default="processing")       # processing / completed / failed
+    biomass_value = Column(Float)                       # биомасса, кг/га
+    ndvi_value = Column(Float)
+    coverage_percent = Column(Float)                    # проективное покрытие, %
+    quality_score = Column(Float)
+    biomass_model = Column(String(50))                  # версия калибровки оценки по снимкам
+    description = Column(Text)
+    media_url = Column(String(500))                     # путь к фото/видео
+
+    measured_at = Column(DateTime, default=datetime.datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+
+    pasture = relationship("Pasture", back_populates="measurements")
+
+
+class MeasurementFrame(Base):
+    """Кадр, отобранный из видео измерения (app/processing/video_frames.py)"""
+    __tablename__ = "measurement_frames"
+
+    id = Column(Integer, primary_key=True, index=True)
+    measurement_id = Column(Integer, ForeignKey("measurements.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    offset = Column(Float, nullable=False)              # секунды от начала видео
+    captured_at = Column(DateTime)                      # UTC, если известно время начала съёмки
+    lat = Column(Float)                                 # по телеметрии дрона на момент кадра
+    lng = Column(Float)
+    image_url = Column(String(500), nullable=False)
+    phash = Column(String(16))                          # dHash 64 бит, hex
+    scene_score = Column(Float)                         # отличие от предыдущего кадра, 0..1
+
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+
+class ImportJob(Base):
+    __tablename__ = "import_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    kind = Column(String(20), nullable=False)           # farms / pastures
+    file_format = Column(String(20), nullable=False)    # csv / geojson / shapefile
+    filename = Column(String(255))
+    status = Column(String(20), default="pending")      # pending / running / completed / failed
+
+    progress = Column(Float, default=0.0)               # доля обработанного файла, 0..1
+    processed_rows = Column(Integer, default=0)
+    inserted_rows = Column(Integer, default=0)
+    error_count = Column(Integer, default=0)
+    errors = Column(JSON)                               # первые ошибки: [{"row": N, "error": "..."}]
+    message = Column(Text)                              # причина падения всего задания
+
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+
+class UploadSession(Base):
+    """Возобновляемая загрузка файла съёмки по частям (app/api/uploads)"""
+    __tablename__ = "upload_sessions"
+
+    id = Column(Integer, primary_key=True, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    pasture_id = Column(Integer, ForeignKey("pastures.id", ondelete="CASCADE"), nullable=False)
+    drone_id = Column(Integer, ForeignKey("drones.id", ondelete="SET NULL"), nullable=True)
+    measurement_id = Column(Integer, ForeignKey("measurements.id", ondelete="SET NULL"), nullable=True)
+
+    filename = Column(String(255), nullable=False)
+    content_type = Column(String(100))
+    size = Column(BigInteger, nullable=False)           # объявленный размер файла, байт
+    received = Column(BigInteger, nullable=False, default=0)  # подтверждённое смещение, байт
+    sha256 = Column(String(64))                         # ожидаемая сумма всего файла (необязательно)
+    status = Column(String(20), default="uploading")    # uploading / completing / completed / failed / expired
+    message = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False)
+
+
+class Job(Base):
+    """Фоновое задание очереди (app/jobs): импорт, экспорт, обработка съёмки"""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_priority_run_after", "status", "priority", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    farm_id = Column(Integer, ForeignKey("farms.id", ondelete="CASCADE"), nullable=True, index=True)
+
+    kind = Column(String(50), nullable=False)           # import / export / video_frames / thumbnail
+    payload = Column(JSON, nullable=False)
+    priority = Column(Integer, nullable=False, default=0)   # больше — раньше
+    status = Column(String(20), nullable=False, default="queued")  # queued / running / completed / failed / cancelled
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)  # отложенный повтор
+    worker = Column(String(100))
+    heartbeat_at = Column(DateTime)
+    result = Column(JSON(none_as_null=True))
+    error = Column(Text)
+
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
+
+
+class ChangeLog(Base):
+    """Журнал изменений ферм, пастбищ и дронов для дельта-синхронизации (/api/sync)"""
+    __tablename__ = "change_log"
+    __table_args__ = (
+        Index("ix_change_log_owner_id_id", "owner_id", "id"),
+    )
+
+    # id — курсор синхронизации: у владельца растёт в порядке коммитов (см. app/api/sync/changelog.py)
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    owner_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+
+    entity = Column(String(20), nullable=False)         # farms / pastures / drones
+    entity_id = Column(Integer, nullable=False)         # без внешнего ключа: строка может быть удалена
+    op = Column(String(10), nullable=False)             # upsert / delete
+    changed_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+
+class DroneTelemetry(Base):
+    """Точки полётной телеметрии; в PostgreSQL таблица секционирована по месяцам recorded_at"""
+    __tablename__ = "drone_telemetry"
+    __table_args__ = (
+        Index("ix_drone_telemetry_drone_id_recorded_at", "drone_id", "recorded_at"),
+    )
+
+    # в PostgreSQL первичный ключ (id, recorded_at) — ключ секционирования обязан в него входить
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    drone_id = Column(Integer, ForeignKey("drones.id", ondelete="CASCADE"), nullable=False)
+    recorded_at = Column(DateTime, nullable=False)      # время точки на борту, UTC
+
+    lat = Column(Float, nullable=False)
+    lng = Column(Float, nullable=False)
+    altitude = Column(Float)                            # м над точкой взлёта
+    battery = Column(Float)                             # заряд, %
+    speed = Column(Float)                               # м/с
+    heading = Column(Float)                             # курс, градусы
+
+
+class GeofenceEvent(Base):
+    """Вход дрона в пастбище и выход из него по телеметрии"""
+    __tablename__ = "geofence_events"
+    __table_args__ = (
+        Index("ix_geofence_events_drone_id_recorded_at", "drone_id", "recorded_at"),
+    )
+
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    drone_id = Column(Integer, ForeignKey("drones.id", ondelete="CASCADE"), nullable=False)
+    pasture_id = Column(Integer, ForeignKey("pastures.id", ondelete="SET NULL"))
+    pasture_farm_id = Column(Integer)                   # ферма пастбища: своя или соседняя
+    event = Column(String(10), nullable=False)          # enter / exit
+    own = Column(Boolean, nullable=False)               # пастбище фермы самого дрона
+    recorded_at = Column(DateTime, nullable=False)      # время точки телеметрии
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
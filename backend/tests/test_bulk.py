@@ -0,0 +1,60 @@
+# backend/tests/test_bulk.py
+# COPY-путь bulk_insert: NULL и пустые строки должны доезжать до PostgreSQL без подмены.
+#
+#   cd backend && TEST_DATABASE_URL=postgresql+psycopg2://... python -m pytest tests
+import datetime
+import os
+
+import pytest
+from sqlalchemy import JSON, Boolean, Column, DateTime, Float, Integer, MetaData, String, Table, create_engine, select
+
+from database.bulk import bulk_insert
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL.startswith("postgresql"), reason="нужен TEST_DATABASE_URL на PostgreSQL"
+)
+
+metadata = MetaData()
+samples = Table(
+    "bulk_copy_samples", metadata,
+    Column("id", Integer, primary_key=True),
+    Column("amount", Integer),
+    Column("ratio", Float),
+    Column("seen_at", DateTime),
+    Column("flag", Boolean),
+    Column("label", String),
+    Column("extra", JSON(none_as_null=True)),
+)
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as conn:
+        metadata.drop_all(conn)
+        metadata.create_all(conn)
+        yield conn
+        metadata.drop_all(conn)
+        conn.commit()
+    engine.dispose()
+
+
+def test_copy_round_trips_nulls(connection):
+    rows = [
+        {"id": 1, "amount": None, "ratio": None, "seen_at": None, "flag": None, "label": None, "extra": None},
+        {"id": 2, "amount": 0, "ratio": 2.5, "seen_at": datetime.datetime(2026, 6, 1, 8, 30), "flag": False,
+         "label": "", "extra": {"a": [1, None]}},
+        {"id": 3, "amount": -7, "ratio": 0.0, "seen_at": None, "flag": True,
+         "label": 'кавычки "", запятая, перевод\nстроки и \\N', "extra": []},
+    ]
+    assert bulk_insert(connection, samples, rows) == 3
+    stored = [dict(r) for r in connection.execute(select(samples).order_by(samples.c.id)).mappings()]
+    assert stored == rows
+
+
+def test_copy_missing_columns_are_null(connection):
+    bulk_insert(connection, samples, [{"id": 1, "label": "x"}], columns=["id", "amount", "label"])
+    row = connection.execute(select(samples)).mappings().one()
+    assert row["amount"] is None and row["label"] == "x"
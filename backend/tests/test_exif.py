@@ -0,0 +1,39 @@
+# backend/tests/test_exif.py
+# Разбор EXIF фото: испорченное GPS-время не должно ронять пакетную загрузку.
+#
+#   cd backend && python -m pytest tests
+import datetime
+import io
+
+import pytest
+
+pytest.importorskip("PIL")
+from PIL import Image
+from PIL.TiffImagePlugin import IFDRational
+
+from app.processing.exif import GPS_DATESTAMP, GPS_IFD, GPS_TIMESTAMP, read_photo_exif
+
+
+def photo(time) -> io.BytesIO:
+    """JPEG 8x8 с GPS-датой и временем time (три рациональных)"""
+    exif = Image.Exif()
+    gps = exif.get_ifd(GPS_IFD)
+    gps[GPS_DATESTAMP], gps[GPS_TIMESTAMP] = "2026:06:01", time
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8)).save(buffer, "JPEG", exif=exif.tobytes())
+    buffer.seek(0)
+    return buffer
+
+
+def test_gps_time():
+    tags = read_photo_exif(photo((IFDRational(6), IFDRational(30), IFDRational(15))))
+    assert tags["taken_at"] == datetime.datetime(2026, 6, 1, 6, 30, 15)
+
+
+@pytest.mark.parametrize("time", [
+    (IFDRational(0, 0), IFDRational(0, 0), IFDRational(0, 0)),  # камера без фиксации спутников
+    (IFDRational(10 ** 9), IFDRational(0), IFDRational(0)),     # за пределами datetime
+])
+def test_broken_gps_time(time):
+    tags = read_photo_exif(photo(time))
+    assert tags is not None and tags["taken_at"] is None